@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark del tool batchInvoke del adapter router (fan-out concurrente).
+
+Para lotes de N tool calls distintas (ATMs, datáfonos y saldos) compara, contra el
+stand-in local de las APIs privadas:
+    - secuencial: N invocaciones gateway → adapter, una por tool call
+    - batch:      una invocación de batchInvoke con las N llamadas en paralelo
+
+`--invoke-overhead-ms` modela el costo de cada invocación gateway → Lambda, que
+el batch paga una sola vez. La caché del adapter se desactiva para medir solo el
+fan-out.
+
+Uso: python benchmarks/adapter_batch_benchmark.py [--sizes 1,2,4,8] [--api-latency-ms 40]
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+# harness primero: agrega la capa shared_runtime al sys.path
+from harness import gateway_context, load_lambda_module, use_private_api
+from private_api_standin import PrivateApiStandIn
+
+CALLS = [
+    {"tool": "listAtmsByCity", "arguments": {"city": "medellin", "status": "online"}},
+    {"tool": "listDatafonosByCity", "arguments": {"city": "bogota", "status": "maintenance"}},
+    {"tool": "getBalanceByUsername", "arguments": {"username": "santi"}},
+    {"tool": "findNearestAtms", "arguments": {"lat": 6.2088, "lon": -75.5680}},
+    {"tool": "listAtmsByCity", "arguments": {"city": "bogota", "status": "low_cash"}},
+    {"tool": "listDatafonosByCity", "arguments": {"city": "medellin", "status": "active"}},
+    {"tool": "getBalanceByUsername", "arguments": {"username": "moni"}},
+    {"tool": "findNearestDatafonos", "arguments": {"lat": 4.6533, "lon": -74.0836}},
+]
+
+
+def invoke(module, tool: str, event: dict, overhead_ms: float) -> dict:
+    time.sleep(overhead_ms / 1000)
+    return module.handler(event, gateway_context(tool))
+
+
+def sequential(module, calls: list, overhead_ms: float) -> None:
+    for call in calls:
+        result = invoke(module, call["tool"], dict(call["arguments"]), overhead_ms)
+        if "error" in result:
+            raise RuntimeError(f"Unexpected response: {result}")
+
+
+def batch(module, calls: list, overhead_ms: float) -> None:
+    result = invoke(module, "batchInvoke", {"calls": calls}, overhead_ms)
+    if result["errors"]:
+        raise RuntimeError(f"Unexpected response: {result}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", default="1,2,4,8")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--api-latency-ms", type=float, default=40.0)
+    parser.add_argument("--invoke-overhead-ms", type=float, default=15.0)
+    args = parser.parse_args()
+
+    os.environ["HEALTH_CACHE_TTL_SECONDS"] = "0"
+
+    print(
+        f"\nTool calls secuenciales vs. batchInvoke (p50 de {args.repeat}, API privada "
+        f"{args.api_latency_ms:g} ms, invocación +{args.invoke_overhead_ms:g} ms)\n"
+    )
+    print(f"{'calls':>5} | {'secuencial ms':>13} | {'batch ms':>8} | {'speedup':>7}")
+    print("-" * 44)
+
+    with PrivateApiStandIn(request_latency_ms=args.api_latency_ms) as api:
+        use_private_api(api)
+        module = load_lambda_module("adapter_router")
+        batch(module, CALLS, 0)  # calentamiento: abre las conexiones del pool
+
+        for size in [int(s) for s in args.sizes.split(",")]:
+            calls = CALLS[:size]
+            timings = {"secuencial": [], "batch": []}
+            for _ in range(args.repeat):
+                for name, run in (("secuencial", sequential), ("batch", batch)):
+                    started = time.perf_counter()
+                    run(module, calls, args.invoke_overhead_ms)
+                    timings[name].append((time.perf_counter() - started) * 1000)
+
+            sequential_ms = statistics.median(timings["secuencial"])
+            batch_ms = statistics.median(timings["batch"])
+            print(
+                f"{size:>5} | {sequential_ms:>13.1f} | {batch_ms:>8.1f} | "
+                f"{sequential_ms / batch_ms:>6.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la caché de respuestas del adapter router (TTL por tool).
+
+Reproduce contra el stand-in local de las APIs privadas una mezcla de tool calls
+típica de varias conversaciones concurrentes: consultas repetidas de salud por
+ciudad/estado y por proximidad (TTL largo) intercaladas con saldos (TTL 0).
+Compara el handler de `lambdas/adapter_router` con la caché desactivada y
+activada: latencia por tool call, hit rate y requests que llegan a la API privada.
+
+`--api-latency-ms` modela el salto completo gateway → VPC endpoint → API Gateway
+→ Lambda → DynamoDB que la caché evita en cada HIT.
+
+Uso: python benchmarks/adapter_cache_benchmark.py [--calls 500] [--api-latency-ms 40]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+
+# harness primero: agrega la capa shared_runtime al sys.path
+from harness import gateway_context, load_lambda_module, use_private_api
+from private_api_standin import PrivateApiStandIn
+
+CITIES = ("medellin", "bogota")
+ATM_STATUSES = (None, "online", "low_cash")
+DATAFONO_STATUSES = (None, "active", "maintenance")
+POINTS = ((6.2088, -75.5680), (6.2442, -75.5812), (4.6533, -74.0836))
+USERNAMES = ("santi", "moni", "jero", "joachim", "fabi")
+
+
+def build_workload(calls: int, seed: int) -> list:
+    """Lista de (tool, event) con la distribución sesgada de una conversación real."""
+    rng = random.Random(seed)
+    workload = []
+    for _ in range(calls):
+        kind = rng.choices(("atm", "datafono", "near", "balance"), (4, 3, 2, 1))[0]
+        if kind == "atm":
+            event = {"city": rng.choice(CITIES), "status": rng.choice(ATM_STATUSES)}
+            workload.append(("listAtmsByCity", event))
+        elif kind == "datafono":
+            event = {"city": rng.choice(CITIES), "status": rng.choice(DATAFONO_STATUSES)}
+            workload.append(("listDatafonosByCity", event))
+        elif kind == "near":
+            lat, lon = rng.choice(POINTS)
+            workload.append(("findNearestAtms", {"lat": lat, "lon": lon, "status": "online"}))
+        else:
+            workload.append(("getBalanceByUsername", {"username": rng.choice(USERNAMES)}))
+    return [(tool, {k: v for k, v in event.items() if v is not None}) for tool, event in workload]
+
+
+def run(module, workload: list) -> tuple:
+    timings, statuses = [], {}
+    for tool, event in workload:
+        started = time.perf_counter()
+        result = module.handler(dict(event), gateway_context(tool))
+        timings.append((time.perf_counter() - started) * 1000)
+        if "error" in result:
+            raise RuntimeError(f"Unexpected response: {result}")
+        status = result["_meta"]["cache"]
+        statuses[status] = statuses.get(status, 0) + 1
+    return timings, statuses
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--api-latency-ms", type=float, default=40.0)
+    parser.add_argument("--health-ttl-s", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    workload = build_workload(args.calls, args.seed)
+
+    with PrivateApiStandIn(request_latency_ms=args.api_latency_ms) as api:
+        use_private_api(api)
+        results = {}
+        for name, ttl in (("sin caché", 0), ("con caché", args.health_ttl_s)):
+            os.environ["HEALTH_CACHE_TTL_SECONDS"] = str(ttl)
+            module = load_lambda_module("adapter_router")
+            api.reset_counters()
+            started = time.perf_counter()
+            timings, statuses = run(module, workload)
+            elapsed_s = time.perf_counter() - started
+            results[name] = (timings, statuses, api.request_count, elapsed_s)
+
+    print(
+        f"\n{args.calls} tool calls por el adapter router "
+        f"(API privada {args.api_latency_ms:g} ms, TTL salud {args.health_ttl_s:g} s)\n"
+    )
+    print(
+        f"{'variante':>10} | {'p50 ms':>7} | {'p95 ms':>7} | {'media ms':>8} | "
+        f"{'hit rate':>8} | {'API reqs':>8} | {'total s':>7}"
+    )
+    print("-" * 76)
+    for name, (timings, statuses, requests, elapsed_s) in results.items():
+        hit_rate = statuses.get("HIT", 0) / len(timings)
+        print(
+            f"{name:>10} | {statistics.median(timings):>7.2f} | "
+            f"{percentile(timings, 95):>7.2f} | {statistics.mean(timings):>8.2f} | "
+            f"{hit_rate:>7.0%} | {requests:>8} | {elapsed_s:>7.2f}"
+        )
+    print(f"\nEstados de caché con caché activa: {results['con caché'][1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark del adapter router: API privada vs. lectura directa de DynamoDB.
+
+Ejecuta las mismas tool calls de `listAtmsByCity` (ciudad, ciudad + status y
+mode=summary) por el handler de `lambdas/adapter_router` en sus dos modos:
+    - api:      adapter → stand-in HTTPS de la API privada → handler real de
+                `lambdas/atm_machines_health` → stand-in de DynamoDB
+    - dynamodb: adapter → stand-in de DynamoDB (DIRECT_DYNAMODB_TOOLS)
+
+`--api-overhead-ms` modela lo que el stand-in no ejecuta del salto por la API
+privada: VPC endpoint, API Gateway y la invocación de la Lambda de datos. Ambos
+modos leen el mismo stand-in de DynamoDB, y el benchmark verifica que las
+respuestas sean idénticas (sin `_meta`). La caché del adapter y la caché por
+ciudad de la Lambda de datos se desactivan.
+
+Uso: python benchmarks/adapter_direct_dynamodb_benchmark.py [--calls 200] [--api-overhead-ms 15]
+"""
+
+import argparse
+import os
+import statistics
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+# harness primero: agrega setup/ y la capa shared_runtime al sys.path
+from harness import gateway_context, load_lambda_module, use_private_api, use_standin
+from dynamodb_standin import DynamoDBStandIn
+from populate_atms import generate_atms
+from private_api_standin import PrivateApiStandIn
+
+TOOL = "listAtmsByCity"
+CALLS = (
+    {"city": "bogota"},
+    {"city": "bogota", "status": "low_cash"},
+    {"city": "medellin", "status": "online", "fields": "atm_id,address,status"},
+    {"city": "bogota", "mode": "summary"},
+)
+
+
+def api_gateway(data_module):
+    """Traduce cada request del stand-in a un evento proxy de API Gateway."""
+
+    def handle(method: str, path: str, body: bytes) -> tuple:
+        url = urlsplit(path)
+        event = {
+            "resource": "/atms/{city}",
+            "pathParameters": {"city": url.path.rsplit("/", 1)[-1]},
+            "queryStringParameters": dict(parse_qsl(url.query)) or None,
+            "headers": {"Accept-Encoding": "identity"},
+        }
+        response = data_module.handler(event, None)
+        return response["statusCode"], response["body"].encode("utf-8")
+
+    return handle
+
+
+def run(module, calls: int) -> tuple:
+    timings, results = [], []
+    for i in range(calls):
+        event = dict(CALLS[i % len(CALLS)])
+        started = time.perf_counter()
+        result = module.handler(event, gateway_context(TOOL))
+        timings.append((time.perf_counter() - started) * 1000)
+        if "error" in result:
+            raise RuntimeError(f"Unexpected response: {result}")
+        source = result.pop("_meta")["source"]
+        if i < len(CALLS):
+            results.append(result)
+    return timings, results, source
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--atms", type=int, default=500)
+    parser.add_argument("--dynamodb-latency-ms", type=float, default=4.0)
+    parser.add_argument("--api-overhead-ms", type=float, default=15.0)
+    args = parser.parse_args()
+
+    os.environ.update(
+        {
+            "HEALTH_CACHE_TTL_SECONDS": "0",
+            "CITY_CACHE_TTL_SECONDS": "0",
+            "STATUS_INDEX_NAME": "CityStatusIndex",
+            "ATM_TABLE_NAME": "standin-table",
+        }
+    )
+
+    results = {}
+    with DynamoDBStandIn(
+        generate_atms(args.atms),
+        request_latency_ms=args.dynamodb_latency_ms,
+        indexes={"CityStatusIndex": ("city", "status")},
+    ) as dynamodb:
+        use_standin(dynamodb)
+        data_module = load_lambda_module("atm_machines_health")
+
+        with PrivateApiStandIn(
+            handler=api_gateway(data_module), request_latency_ms=args.api_overhead_ms
+        ) as api:
+            use_private_api(api)
+            for direct_tools in ("", TOOL):
+                os.environ["DIRECT_DYNAMODB_TOOLS"] = direct_tools
+                module = load_lambda_module("adapter_router")
+                run(module, len(CALLS))  # calentamiento: conexiones y clientes
+                dynamodb.reset_counters()
+                timings, responses, source = run(module, args.calls)
+                results[source] = (timings, responses, dynamodb.request_count)
+
+    if results["api"][1] != results["dynamodb"][1]:
+        raise RuntimeError("The two modes returned different responses")
+
+    print(
+        f"\n{args.calls} tool calls {TOOL} ({args.atms} ATMs; DynamoDB "
+        f"{args.dynamodb_latency_ms:g} ms, "
+        f"salto API privada +{args.api_overhead_ms:g} ms)\n"
+    )
+    print(
+        f"{'modo':>8} | {'p50 ms':>7} | {'p95 ms':>7} | {'media ms':>8} | "
+        f"{'queries DynamoDB':>16}"
+    )
+    print("-" * 58)
+    for source, (timings, _, queries) in results.items():
+        print(
+            f"{source:>8} | {statistics.median(timings):>7.2f} | "
+            f"{percentile(timings, 95):>7.2f} | {statistics.mean(timings):>8.2f} | "
+            f"{queries:>16}"
+        )
+    print("\nRespuestas idénticas en ambos modos (sin _meta).")
+
+
+if __name__ == "__main__":
+    main()
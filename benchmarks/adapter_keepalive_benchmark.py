@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark del pool keep-alive del adapter (`shared_runtime.http_pool`).
+
+Compara, contra el stand-in local de las APIs privadas servido por HTTPS:
+    - antes:   el patrón original de los adapters, que llamaba
+               `urllib.request.urlopen` en cada invocación (conexión TCP +
+               handshake TLS por tool call).
+    - después: el handler actual de `lambdas/adapter_router` (tool
+               listAtmsByCity), que reutiliza la conexión del pool module-scope
+               entre invocaciones en caliente.
+
+Imprime la latencia por invocación, las conexiones abiertas y el desglose por
+fase (connect / send / wait / read) de una conexión nueva vs. una reutilizada.
+`--handshake-latency-ms` agrega los RTT extra de TCP + TLS hasta el VPC endpoint.
+Por último verifica la reconexión cuando el servidor cierra una conexión inactiva.
+
+Uso: python benchmarks/adapter_keepalive_benchmark.py [--invocations 200] [--handshake-latency-ms 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from urllib.request import Request, urlopen
+
+# harness primero: agrega la capa shared_runtime al sys.path
+from harness import gateway_context, load_lambda_module, use_private_api
+from private_api_standin import PrivateApiStandIn
+
+PHASES = ("connect_ms", "send_ms", "wait_ms", "read_ms", "total_ms")
+
+
+def legacy_handler(event, context):
+    """Réplica del adapter de ATMs previo al pool (urlopen por invocación)."""
+    url = f"{os.environ['ATM_API_URL']}/atms/{event['city']}"
+    req = Request(url, method="GET")
+    req.add_header("Content-Type", "application/json")
+    with urlopen(req, timeout=30) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+def measure(handler, invocations: int) -> list:
+    context = gateway_context("listAtmsByCity")
+    timings = []
+    for index in range(invocations):
+        event = {"city": ("medellin", "bogota")[index % 2]}
+        started = time.perf_counter()
+        result = handler(event, context)
+        timings.append((time.perf_counter() - started) * 1000)
+        if "error" in result:
+            raise RuntimeError(f"Unexpected response: {result}")
+    return timings
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--invocations", type=int, default=200)
+    parser.add_argument("--request-latency-ms", type=float, default=2.0)
+    parser.add_argument("--handshake-latency-ms", type=float, default=5.0)
+    parser.add_argument("--server-idle-timeout-s", type=float, default=1.0)
+    args = parser.parse_args()
+
+    with PrivateApiStandIn(
+        request_latency_ms=args.request_latency_ms,
+        handshake_latency_ms=args.handshake_latency_ms,
+        server_idle_timeout_s=args.server_idle_timeout_s,
+    ) as api:
+        use_private_api(api)
+        module = load_lambda_module("adapter_router")
+        from shared_runtime import http_pool
+
+        # Primera invocación de cada variante = arranque en frío; se descarta
+        results, connections = {}, {}
+        for name, handler in (("antes", legacy_handler), ("después", module.handler)):
+            measure(handler, 1)
+            api.reset_counters()
+            results[name] = measure(handler, args.invocations)
+            connections[name] = api.connection_count
+
+        # Desglose por fase: pool nuevo por request vs. el pool compartido en caliente
+        url = f"{api.base_url}/atms/medellin"
+        phases = {"conexión nueva": [], "keep-alive": []}
+        for _ in range(args.invocations):
+            phases["conexión nueva"].append(http_pool.ConnectionPool().request("GET", url).timings)
+            phases["keep-alive"].append(http_pool.pool.request("GET", url).timings)
+
+        # El servidor cierra la conexión inactiva; el pool debe reconectar solo
+        stats_before = dict(http_pool.pool.stats)
+        time.sleep(args.server_idle_timeout_s * 1.5)
+        reconnect = http_pool.pool.request("GET", url)
+        reconnected = (
+            reconnect.status == 200
+            and http_pool.pool.stats["opened"] == stats_before["opened"] + 1
+        )
+
+    print(
+        f"\nLatencia por invocación del adapter en caliente ({args.invocations} "
+        f"invocaciones, HTTPS, handshake +{args.handshake_latency_ms:g} ms)\n"
+    )
+    print(f"{'variante':>9} | {'p50 ms':>7} | {'p95 ms':>7} | {'media ms':>8} | {'conexiones':>10}")
+    print("-" * 55)
+    for name, timings in results.items():
+        print(
+            f"{name:>9} | {statistics.median(timings):>7.2f} | "
+            f"{percentile(timings, 95):>7.2f} | {statistics.mean(timings):>8.2f} | "
+            f"{connections[name]:>10}"
+        )
+    speedup = statistics.median(results["antes"]) / statistics.median(results["después"])
+    print(f"\nMejora p50: {speedup:.1f}x")
+
+    print("\nDesglose por fase (p50 ms)\n")
+    print(f"{'conexión':>14} | " + " | ".join(f"{phase[:-3]:>7}" for phase in PHASES))
+    print("-" * 60)
+    for name, samples in phases.items():
+        medians = [statistics.median(sample[phase] for sample in samples) for phase in PHASES]
+        print(f"{name:>14} | " + " | ".join(f"{value:>7.2f}" for value in medians))
+
+    print(f"\nReconexión tras cierre del servidor: {'ok' if reconnected else 'FALLÓ'}")
+    print(f"Estadísticas del pool: {json.dumps(http_pool.pool.stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark del passthrough de bodies en el adapter router (RESPONSE_PASSTHROUGH).
+
+Sirve desde el stand-in de la API privada un listado de datáfonos de
+`--payload-mb` MB y compara los dos modos del handler de `lambdas/adapter_router`:
+    - parse:       json.loads del body, `_meta` en el dict y el runtime lo vuelve
+                   a serializar a JSON
+    - passthrough: el handler retorna los bytes del upstream con `_meta` insertado
+                   y el runtime los publica tal cual
+
+El paso del runtime se emula como lo hace awslambdaric: un resultado `bytes` se
+envía sin tocar y cualquier otro valor se codifica con json.dumps. Reporta
+latencia y CPU por tool call (handler + serialización del runtime) y el pico de
+memoria asignada (tracemalloc, en una pasada aparte para no inflar los tiempos),
+sin caché (cada call va a la API) y con caché (hits). Verifica que ambos modos
+entreguen el mismo JSON.
+
+Uso: python benchmarks/adapter_passthrough_benchmark.py [--payload-mb 5] [--calls 20]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+# harness primero: agrega setup/ y la capa shared_runtime al sys.path
+from harness import gateway_context, load_lambda_module, use_private_api
+from populate_datafonos import generate_datafonos
+from private_api_standin import PrivateApiStandIn
+
+TOOL = "listDatafonos"
+
+
+def build_payload(megabytes: float) -> bytes:
+    """Listado de datáfonos (atributos planos, como los retorna la API) de ~N MB."""
+    datafonos = []
+    while True:
+        for item in generate_datafonos(1000):
+            datafonos.append(
+                {
+                    key: next(iter(value.values()))
+                    for key, value in item.items()
+                    if key not in ("PK", "SK", "geo_cell", "geohash")
+                }
+            )
+        body = json.dumps({"datafonos": datafonos, "count": len(datafonos)})
+        if len(body) >= megabytes * 1024 * 1024:
+            return body.encode("utf-8")
+
+
+def marshal(result) -> bytes:
+    """Lo que hace el runtime de Python con el valor retornado por el handler."""
+    if isinstance(result, bytes):
+        return result
+    return json.dumps(result).encode("utf-8")
+
+
+def invoke(module) -> bytes:
+    return marshal(module.handler({}, gateway_context(TOOL)))
+
+
+def measure(module, calls: int) -> dict:
+    invoke(module)  # calentamiento: conexión keep-alive y, con caché, el MISS
+    wall_ms, cpu_ms = [], []
+    for _ in range(calls):
+        wall, cpu = time.perf_counter(), time.process_time()
+        response = invoke(module)
+        cpu_ms.append((time.process_time() - cpu) * 1000)
+        wall_ms.append((time.perf_counter() - wall) * 1000)
+
+    peaks = []
+    for _ in range(3):
+        tracemalloc.start()
+        invoke(module)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return {
+        "wall_ms": statistics.median(wall_ms),
+        "cpu_ms": statistics.median(cpu_ms),
+        "peak_mb": max(peaks) / 1024 / 1024,
+        "response": response,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--payload-mb", type=float, default=5.0)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--api-latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    payload = build_payload(args.payload_mb)
+    results = {}
+    with PrivateApiStandIn(
+        handler=lambda method, path, body: (200, payload),
+        request_latency_ms=args.api_latency_ms,
+    ) as api:
+        use_private_api(api)
+        for cache, ttl in (("sin caché", "0"), ("con caché", "60")):
+            os.environ["HEALTH_CACHE_TTL_SECONDS"] = ttl
+            for mode, passthrough in (("parse", "false"), ("passthrough", "true")):
+                os.environ["RESPONSE_PASSTHROUGH"] = passthrough
+                module = load_lambda_module("adapter_router")
+                results[(cache, mode)] = measure(module, args.calls)
+
+    for cache in ("sin caché", "con caché"):
+        parsed, passed = (results[(cache, mode)] for mode in ("parse", "passthrough"))
+        expected, actual = (
+            json.loads(result["response"]) for result in (parsed, passed)
+        )
+        for body in (expected, actual):
+            body.pop("_meta")
+        if expected != actual:
+            raise RuntimeError(f"The two modes returned different results ({cache})")
+
+    print(
+        f"\n{args.calls} tool calls {TOOL} con un body de "
+        f"{len(payload) / 1024 / 1024:.1f} MB (p50; handler + serialización del "
+        f"runtime)\n"
+    )
+    print(
+        f"{'caché':>9} | {'modo':>11} | {'p50 ms':>7} | {'CPU ms':>7} | "
+        f"{'pico MB':>7} | {'respuesta MB':>12}"
+    )
+    print("-" * 70)
+    for (cache, mode), result in results.items():
+        print(
+            f"{cache:>9} | {mode:>11} | {result['wall_ms']:>7.1f} | "
+            f"{result['cpu_ms']:>7.1f} | {result['peak_mb']:>7.1f} | "
+            f"{len(result['response']) / 1024 / 1024:>12.2f}"
+        )
+    print("\nMismo JSON en ambos modos (sin _meta).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark de deadlines, timeouts adaptativos y circuit breaker del adapter router.
+
+Simula un incidente contra el stand-in local de las APIs privadas: la API de ATMs
+responde `/atms/{city}` en `--degraded-latency-ms` (más que el timeout de la
+Lambda) mientras `/atms/near`, datáfonos y saldos siguen sanos. Tras calentar el
+estimador de latencia con llamadas sanas, intercala tool calls a la ruta degradada
+y a las sanas, y compara:
+    - sin resiliencia: cada request espera todo el tiempo restante de la Lambda
+    - con resiliencia: timeout adaptativo (EWMA) + circuit breaker por API
+
+Reporta latencia por tool call, códigos de error y los segundos de Lambda
+consumidos (lo que se factura y lo que espera el agente).
+
+Uso: python benchmarks/adapter_resilience_benchmark.py [--calls 30] [--lambda-timeout-ms 3000]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import time
+from collections import Counter
+
+# harness primero: agrega la capa shared_runtime al sys.path
+from harness import gateway_context, load_lambda_module, use_private_api
+from private_api_standin import PrivateApiStandIn
+
+# Cada fail-fast del breaker loguea un WARNING
+logging.disable(logging.WARNING)
+
+WARMUP = ("findNearestAtms", {"lat": 6.2088, "lon": -75.5680})
+WORKLOAD = (
+    ("listAtmsByCity", {"city": "medellin", "status": "online"}),
+    ("listDatafonosByCity", {"city": "bogota"}),
+    ("getBalanceByUsername", {"username": "santi"}),
+)
+DEGRADED_TOOL = "listAtmsByCity"
+
+
+def run(module, calls: int, lambda_timeout_ms: float, warmup: int) -> dict:
+    for _ in range(warmup):
+        tool, event = WARMUP
+        context = gateway_context(tool, remaining_ms=lambda_timeout_ms)
+        module.handler(dict(event), context)
+
+    timings = {"degradada": [], "sanas": []}
+    codes = Counter()
+    for i in range(calls):
+        tool, event = WORKLOAD[i % len(WORKLOAD)]
+        context = gateway_context(tool, remaining_ms=lambda_timeout_ms)
+        started = time.perf_counter()
+        result = module.handler(dict(event), context)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        timings["degradada" if tool == DEGRADED_TOOL else "sanas"].append(elapsed_ms)
+        codes[result.get("code", "OK")] += 1
+    return {"timings": timings, "codes": codes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--calls", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--api-latency-ms", type=float, default=40.0)
+    parser.add_argument("--degraded-latency-ms", type=float, default=5000.0)
+    parser.add_argument("--lambda-timeout-ms", type=float, default=3000.0)
+    parser.add_argument("--min-timeout-s", type=float, default=0.25)
+    args = parser.parse_args()
+
+    os.environ["HEALTH_CACHE_TTL_SECONDS"] = "0"
+    variants = (
+        # Piso = timeout de la Lambda y breaker que nunca abre: el comportamiento previo
+        ("sin resiliencia", args.lambda_timeout_ms / 1000, 10**6),
+        ("con resiliencia", args.min_timeout_s, 5),
+    )
+
+    results = {}
+    with PrivateApiStandIn(
+        request_latency_ms=args.api_latency_ms,
+        path_latency_ms={
+            "/atms/": args.degraded_latency_ms,
+            "/atms/near": args.api_latency_ms,
+        },
+    ) as api:
+        use_private_api(api)
+        for name, min_timeout_s, threshold in variants:
+            os.environ["MIN_REQUEST_TIMEOUT_SECONDS"] = str(min_timeout_s)
+            os.environ["BREAKER_FAILURE_THRESHOLD"] = str(threshold)
+            module = load_lambda_module("adapter_router")
+            results[name] = run(module, args.calls, args.lambda_timeout_ms, args.warmup)
+
+    print(
+        f"\n{args.calls} tool calls durante un incidente de la API de ATMs "
+        f"({args.degraded_latency_ms:g} ms; "
+        f"Lambda con timeout {args.lambda_timeout_ms:g} ms)\n"
+    )
+    print(
+        f"{'variante':>15} | {'degradada p50 ms':>16} | {'sanas p50 ms':>12} | "
+        f"{'Lambda-s':>8} | códigos"
+    )
+    print("-" * 90)
+    for name, result in results.items():
+        timings = result["timings"]
+        lambda_s = sum(timings["degradada"] + timings["sanas"]) / 1000
+        print(
+            f"{name:>15} | {statistics.median(timings['degradada']):>16.1f} | "
+            f"{statistics.median(timings['sanas']):>12.1f} | {lambda_s:>8.2f} | "
+            f"{dict(result['codes'])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
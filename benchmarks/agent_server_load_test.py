@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga del servidor multi-conversación del agente Rufus Bank.
+
+Levanta `real-tests/rufus_bank_server.py` en un proceso aparte, con un pool de
+`--sessions` sesiones MCP contra el stand-in local del MCP Gateway y un modelo
+guionado (latencia fija, dos tools por turno) en lugar de Bedrock. Para cada
+nivel de `--conversations` clientes simultáneos, cada cliente abre una
+conversación, envía `--turns` mensajes con `--think-ms` de pausa entre ellos y
+la cierra. Reporta por nivel:
+    - p50 / p99 de latencia del turno (medido en el cliente HTTP)
+    - CPU del servidor por turno y cores usados (CPU / tiempo de pared)
+    - conversaciones por core: clientes simultáneos / cores usados
+    - tool calls por segundo y máximo de tool calls simultáneos en el gateway
+
+Uso: python benchmarks/agent_server_load_test.py [--conversations 10 50 100 200] [--sessions 4]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import multiprocessing
+import os
+import socket
+import statistics
+import sys
+import time
+
+import httpx
+import uvicorn
+
+# harness primero: mismo sys.path que el resto de los benchmarks
+import harness
+from mcp_standin import McpStandIn
+from scripted_model import ScriptedModel
+
+sys.path.insert(0, os.path.join(harness.ROOT, "real-tests"))
+
+from rufus_bank_server import McpSessionPool, create_app  # noqa: E402
+
+# Dos tools independientes por turno, como "¿cajeros y datáfonos de Medellín?"
+TURN_TOOLS = [
+    ("atm___listAtmsByCity", {"city": "medellin"}),
+    ("datafonos___listDatafonosByCity", {"city": "medellin"}),
+]
+
+
+def percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ServerProcess:
+    """El servidor del agente en un proceso aparte, en un puerto ya reservado."""
+
+    def __init__(self, gateway_url: str, sessions: int, model_latency_ms: float):
+        self.gateway_url = gateway_url
+        self.sessions = sessions
+        self.model_latency_ms = model_latency_ms
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen(1024)
+        self._process = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._socket.getsockname()
+        return f"http://{host}:{port}"
+
+    def _serve(self) -> None:
+        model = ScriptedModel(lambda prompt: TURN_TOOLS, self.model_latency_ms)
+        pool = McpSessionPool(self.gateway_url, "NONE", self.sessions)
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = create_app(model, pool, max_conversations=10_000)
+            # keep-alive largo: el pool de httpx reutiliza conexiones tras las pausas
+            config = uvicorn.Config(
+                app, log_level="error", lifespan="on", timeout_keep_alive=75
+            )
+            uvicorn.Server(config).run(sockets=[self._socket])
+
+    def start(self) -> "ServerProcess":
+        context = multiprocessing.get_context("fork")
+        self._process = context.Process(target=self._serve, daemon=True)
+        self._process.start()
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                if httpx.get(f"{self.base_url}/stats").status_code == 200:
+                    return self
+            except httpx.TransportError:
+                pass
+            time.sleep(0.1)
+        raise RuntimeError("Agent server did not start")
+
+    def stop(self) -> None:
+        self._process.terminate()
+        self._process.join()
+        self._socket.close()
+
+    def __enter__(self) -> "ServerProcess":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+async def customer(client: httpx.AsyncClient, turns: int, think_ms: float) -> tuple:
+    """Una conversación completa. Retorna (latencias de turno en ms, errores)."""
+    latencies, errors = [], 0
+    response = await client.post("/conversations")
+    conversation_id = response.json()["conversation_id"]
+    for turn in range(turns):
+        started = time.perf_counter()
+        response = await client.post(
+            f"/conversations/{conversation_id}/messages",
+            json={"message": f"Turno {turn}: ¿cajeros y datáfonos de Medellín?"},
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200 or response.json()["tool_calls"] != len(
+            TURN_TOOLS
+        ):
+            errors += 1
+        await asyncio.sleep(think_ms / 1000)
+    await client.delete(f"/conversations/{conversation_id}")
+    return latencies, errors
+
+
+async def run_level(base_url: str, conversations: int, turns: int, think_ms: float):
+    limits = httpx.Limits(max_connections=conversations + 1)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120.0
+    ) as client:
+        before = (await client.get("/stats")).json()
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(customer(client, turns, think_ms) for _ in range(conversations))
+        )
+        wall_s = time.perf_counter() - started
+        after = (await client.get("/stats")).json()
+    latencies = [latency for result, _ in results for latency in result]
+    return {
+        "latencies": latencies,
+        "errors": sum(errors for _, errors in results),
+        "wall_s": wall_s,
+        "cpu_s": after["cpu_s"] - before["cpu_s"],
+        "turns": after["turns"] - before["turns"],
+        "cores": (after["cpu_s"] - before["cpu_s"]) / wall_s,
+        "sessions": after["sessions"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--conversations", type=int, nargs="+", default=[10, 50, 100, 200]
+    )
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--think-ms", type=float, default=500.0)
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--model-latency-ms", type=float, default=150.0)
+    parser.add_argument("--tool-latency-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    rows = []
+    with McpStandIn(call_latency_ms=args.tool_latency_ms) as gateway, ServerProcess(
+        gateway.url, args.sessions, args.model_latency_ms
+    ) as server:
+        for conversations in args.conversations:
+            gateway.reset_counters()
+            result = asyncio.run(
+                run_level(server.base_url, conversations, args.turns, args.think_ms)
+            )
+            result.update(
+                conversations=conversations,
+                tool_calls=gateway.tool_call_count,
+                max_concurrent=gateway.max_concurrent_calls,
+            )
+            rows.append(result)
+
+    # Turno ideal: modelo (pide tools) + tools en paralelo + modelo (responde)
+    ideal_ms = 2 * args.model_latency_ms + args.tool_latency_ms
+    print(
+        f"\n{args.turns} turnos por conversación ({len(TURN_TOOLS)} tools por turno, "
+        f"{args.think_ms:g} ms de pausa), {args.sessions} sesiones MCP, "
+        f"{os.cpu_count()} CPU. Turno ideal ~{ideal_ms:g} ms "
+        f"(modelo {args.model_latency_ms:g} ms x2 + "
+        f"tools {args.tool_latency_ms:g} ms)\n"
+    )
+    print(
+        f"{'conversaciones':>14} | {'p50 ms':>7} | {'p99 ms':>7} | {'errores':>7} | "
+        f"{'CPU ms/turno':>12} | {'cores':>5} | {'conv./core':>10} | "
+        f"{'tools/s':>7} | {'máx gateway':>11}"
+    )
+    print("-" * 108)
+    for row in rows:
+        per_core = row["conversations"] / row["cores"] if row["cores"] else 0
+        print(
+            f"{row['conversations']:>14} | "
+            f"{statistics.median(row['latencies']):>7.0f} | "
+            f"{percentile(row['latencies'], 0.99):>7.0f} | {row['errors']:>7} | "
+            f"{row['cpu_s'] * 1000 / row['turns']:>12.1f} | "
+            f"{row['cores']:>5.2f} | {per_core:>10.0f} | "
+            f"{row['tool_calls'] / row['wall_s']:>7.0f} | {row['max_concurrent']:>11}"
+        )
+    calls = [session["calls"] for session in rows[-1]["sessions"]]
+    print(
+        f"\nTool calls por sesión MCP del pool (acumulado): {calls}. "
+        "cores = CPU del proceso del servidor / tiempo de pared."
+    )
+    if (os.cpu_count() or 1) < 3:
+        print(
+            "Con menos de 3 CPU el stand-in y el cliente de carga compiten con el "
+            "servidor: la latencia incluye esa contención."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark del arranque del agente Rufus Bank con y sin catálogo de tools en disco.
+
+Mide el tiempo hasta que el agente puede recibir el primer prompt
+(`connect_gateway` + `create_agent` de `real-tests/rufus_bank_agent.py`) contra
+el stand-in local del MCP Gateway, que pagina `tools/list` con latencia por
+request como el gateway remoto. Tres escenarios:
+    - frío:          sin catálogo; lista todas las páginas antes de crear el agente
+    - caliente:      catálogo vigente; arranca desde el disco y revalida en segundo
+                     plano (hash igual, no cambia nada)
+    - desactualizado: catálogo viejo (falta un tool y otro cambió); arranca desde
+                     el disco, la revalidación detecta el cambio y `apply_pending`
+                     cambia las tools del agente
+
+El modelo Bedrock se crea una sola vez fuera de la medición (no hace llamadas).
+Verifica que el agente termine con el catálogo del gateway en los tres casos.
+
+Uso: python benchmarks/agent_startup_benchmark.py [--runs 10] [--list-latency-ms 150] [--page-size 3]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# harness primero: mismo sys.path que el resto de los benchmarks
+import harness
+from mcp_standin import McpStandIn, load_gateway_tools
+
+sys.path.insert(0, os.path.join(harness.ROOT, "real-tests"))
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from rufus_bank_agent import connect_gateway, create_agent  # noqa: E402
+from strands.models import BedrockModel  # noqa: E402
+from tool_catalog import ToolCatalog  # noqa: E402
+
+SCENARIOS = ("frío", "caliente", "desactualizado")
+
+
+def stale_catalog(tools: list) -> list:
+    """El catálogo de una versión anterior: sin el último tool y otra descripción."""
+    stale = [dict(tool) for tool in tools[:-1]]
+    stale[0]["description"] = "Descripción de una versión anterior del tool."
+    return stale
+
+
+def start_agent(gateway, model, catalog_path: str, scenario: str) -> dict:
+    if scenario == "frío" and os.path.exists(catalog_path):
+        os.remove(catalog_path)
+    catalog = ToolCatalog(gateway.url, catalog_path)
+    if scenario == "desactualizado":
+        catalog.save(stale_catalog(load_gateway_tools()))
+
+    gateway.reset_counters()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        started = time.perf_counter()
+        client, tools = connect_gateway(gateway.url, "NONE", catalog)
+        agent = create_agent(model, tools)
+        startup_ms = (time.perf_counter() - started) * 1000
+        startup_lists = gateway.list_request_count
+
+        catalog.revalidated.wait(timeout=30)
+        revalidated_ms = (time.perf_counter() - started) * 1000
+        swapped = catalog.apply_pending(agent)
+        client.stop(None, None, None)
+
+    expected = sorted(tool["name"] for tool in load_gateway_tools())
+    if sorted(agent.tool_names) != expected:
+        raise RuntimeError(f"Agent tools differ from the gateway ({scenario})")
+    return {
+        "startup_ms": startup_ms,
+        "startup_lists": startup_lists,
+        "revalidated_ms": revalidated_ms,
+        "swapped": swapped,
+        "source": catalog.source,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--list-latency-ms", type=float, default=150.0)
+    parser.add_argument("--page-size", type=int, default=3)
+    args = parser.parse_args()
+
+    model = BedrockModel(model_id="global.anthropic.claude-opus-4-6-v1")
+    results = {scenario: [] for scenario in SCENARIOS}
+    with tempfile.TemporaryDirectory() as directory, McpStandIn(
+        page_size=args.page_size, list_latency_ms=args.list_latency_ms
+    ) as gateway:
+        catalog_path = os.path.join(directory, "tool-catalog.json")
+        start_agent(gateway, model, catalog_path, "frío")  # calentamiento: imports
+        for _ in range(args.runs):
+            for scenario in SCENARIOS:
+                results[scenario].append(
+                    start_agent(gateway, model, catalog_path, scenario)
+                )
+        pages = -(-len(gateway.tools) // args.page_size)
+
+    print(
+        f"\nArranque del agente con {len(load_gateway_tools())} tools en {pages} "
+        f"páginas de tools/list ({args.list_latency_ms:g} ms por página; p50 de "
+        f"{args.runs})\n"
+    )
+    print(
+        f"{'escenario':>14} | {'origen':>7} | {'arranque ms':>11} | "
+        f"{'tools/list antes':>16} | {'revalidado ms':>13} | {'cambio':>6}"
+    )
+    print("-" * 84)
+    for scenario, runs in results.items():
+        print(
+            f"{scenario:>14} | {runs[0]['source']:>7} | "
+            f"{statistics.median(run['startup_ms'] for run in runs):>11.1f} | "
+            f"{statistics.median(run['startup_lists'] for run in runs):>16.0f} | "
+            f"{statistics.median(run['revalidated_ms'] for run in runs):>13.1f} | "
+            f"{'sí' if runs[0]['swapped'] else 'no':>6}"
+        )
+    print("\nEl agente termina con el catálogo del gateway en los tres escenarios.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la caché de resultados de tools del agente Rufus Bank.
+
+Ejecuta una conversación típica (el cliente vuelve a preguntar por los cajeros
+de Medellín, los datáfonos de Bogotá y su saldo) con el agente real de
+`real-tests/rufus_bank_agent.py` contra el stand-in local del MCP Gateway, con
+un modelo guionado en lugar de Bedrock. Tres configuraciones:
+    - sin caché:  cada tool call va al gateway
+    - sesión 1:   `ToolResultCacheHook` vacío; los repetidos salen de la caché
+    - sesión 2:   un agente nuevo (otro proceso en la práctica) que carga la
+                  caché guardada en disco por la sesión 1
+
+Reporta tool calls que llegaron al gateway, hit rate, tiempo total en tools y
+p50 por turno. Verifica que los resultados desde la caché sean iguales a los
+del gateway.
+
+Uso: python benchmarks/agent_tool_cache_benchmark.py [--tool-latency-ms 300]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# harness primero: mismo sys.path que el resto de los benchmarks
+import harness
+from mcp_standin import McpStandIn
+from scripted_model import ScriptedModel
+
+sys.path.insert(0, os.path.join(harness.ROOT, "real-tests"))
+
+from rufus_bank_agent import (  # noqa: E402
+    ToolLoggingHook,
+    connect_gateway,
+    create_agent,
+)
+from tool_result_cache import ToolResultCacheHook  # noqa: E402
+
+ATMS_MEDELLIN = ("atm___listAtmsByCity", {"city": "medellin"})
+DATAFONOS_BOGOTA = ("datafonos___listDatafonosByCity", {"city": "bogota"})
+BALANCE = ("balance___getBalanceByUsername", {"username": "santi"})
+INVESTMENTS = ("investments___getInvestmentsByUsername", {"username": "santi"})
+
+# (prompt del cliente, tool calls que pide el modelo)
+CONVERSATION = (
+    ("¿Cómo están los cajeros de Medellín?", [ATMS_MEDELLIN]),
+    ("¿Y los datáfonos de Bogotá?", [DATAFONOS_BOGOTA]),
+    ("¿Cuánto tengo en mis cuentas?", [BALANCE]),
+    ("¿Y los cajeros de Medellín?", [ATMS_MEDELLIN]),
+    ("¿Qué inversiones tengo?", [INVESTMENTS]),
+    (
+        "Compara los cajeros de Medellín con los datáfonos de Bogotá",
+        [ATMS_MEDELLIN, DATAFONOS_BOGOTA],
+    ),
+    ("¿Mi saldo cambió?", [BALANCE]),
+    ("Otra vez, ¿los cajeros de Medellín?", [ATMS_MEDELLIN]),
+)
+
+
+def tool_results(agent) -> list:
+    return [
+        block["toolResult"]["content"]
+        for message in agent.messages
+        for block in message["content"]
+        if "toolResult" in block
+    ]
+
+
+def run_conversation(gateway, cache) -> dict:
+    plans = dict(CONVERSATION)
+    model = ScriptedModel(lambda prompt: plans[prompt])
+    hooks = [ToolLoggingHook()] + ([cache] if cache else [])
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        client, tools = connect_gateway(gateway.url, "NONE")
+        agent = create_agent(model, tools, hooks=hooks)
+        gateway.reset_counters()
+        timings = []
+        for prompt, _ in CONVERSATION:
+            started = time.perf_counter()
+            agent(prompt)
+            timings.append((time.perf_counter() - started) * 1000)
+        client.stop(None, None, None)
+    return {
+        "gateway_calls": gateway.tool_call_count,
+        "total_ms": sum(timings),
+        "turn_ms": statistics.median(timings),
+        "results": tool_results(agent),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--tool-latency-ms", type=float, default=300.0)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory, McpStandIn(
+        call_latency_ms=args.tool_latency_ms
+    ) as gateway:
+        path = os.path.join(directory, "tool-results.json")
+        results["sin caché"] = (run_conversation(gateway, None), None)
+        for session in ("sesión 1", "sesión 2"):
+            cache = ToolResultCacheHook(
+                path=path, gateway_url=gateway.url, identity="benchmark"
+            )
+            results[session] = (run_conversation(gateway, cache), cache)
+            cache.save()
+
+    expected = results["sin caché"][0]["results"]
+    for session, (result, _) in results.items():
+        if result["results"] != expected:
+            raise RuntimeError(f"Cached results differ from the gateway ({session})")
+
+    tool_calls = sum(len(calls) for _, calls in CONVERSATION)
+    print(
+        f"\nConversación de {len(CONVERSATION)} turnos y {tool_calls} tool calls "
+        f"({args.tool_latency_ms:g} ms por tool call en el gateway)\n"
+    )
+    print(
+        f"{'config':>9} | {'cargados':>8} | {'al gateway':>10} | {'hit rate':>8} | "
+        f"{'total ms':>8} | {'turno p50 ms':>12}"
+    )
+    print("-" * 70)
+    for session, (result, cache) in results.items():
+        loaded = cache.loaded if cache else 0
+        hit_rate = f"{cache.hit_rate:.0%}" if cache else "-"
+        print(
+            f"{session:>9} | {loaded:>8} | {result['gateway_calls']:>10} | "
+            f"{hit_rate:>8} | {result['total_ms']:>8.0f} | {result['turn_ms']:>12.1f}"
+        )
+    print(f"\n{results['sesión 2'][1].report()}")
+    print("Resultados desde la caché iguales a los del gateway.")
+
+
+if __name__ == "__main__":
+    main()
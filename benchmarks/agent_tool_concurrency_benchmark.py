@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark de tool calls concurrentes en el agente Rufus Bank.
+
+Un turno en el que el modelo pide cuatro tools independientes (ATMs cercanos,
+datáfonos por ciudad, inversiones y saldo) se ejecuta con el agente real de
+`real-tests/rufus_bank_agent.py` (hooks, `ToolConcurrencyLimitHook` y sesión MCP)
+contra el stand-in local del MCP Gateway, con un modelo guionado en lugar de
+Bedrock. Compara el límite de concurrencia (`RUFUS_TOOL_CONCURRENCY`): 1 es la
+ejecución en secuencia. Reporta la latencia del turno, el máximo de tool calls
+simultáneos que vio el gateway y el solapamiento reportado por
+`ToolLoggingHook`. Los tools más lentos van primero, así terminan en orden
+inverso: verifica que los resultados lleguen al modelo en el orden pedido.
+
+Uso: python benchmarks/agent_tool_concurrency_benchmark.py [--turns 10] [--limits 1 2 4]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+
+# harness primero: mismo sys.path que el resto de los benchmarks
+import harness
+from mcp_standin import McpStandIn
+from scripted_model import ScriptedModel
+
+sys.path.insert(0, os.path.join(harness.ROOT, "real-tests"))
+
+from rufus_bank_agent import (  # noqa: E402
+    ToolLoggingHook,
+    connect_gateway,
+    create_agent,
+)
+
+# (tool, input, latencia del gateway en ms): del más lento al más rápido
+TOOL_CALLS = (
+    ("atm___findNearestAtms", {"lat": 6.2442, "lon": -75.5812}, 400),
+    ("datafonos___listDatafonosByCity", {"city": "medellin"}, 350),
+    ("investments___getInvestmentsByUsername", {"username": "santi"}, 300),
+    ("balance___getBalanceByUsername", {"username": "santi"}, 250),
+)
+
+
+def result_order(agent) -> tuple:
+    """(ids de los tool uses pedidos, ids de los resultados entregados al modelo)."""
+    for i in range(len(agent.messages) - 1, 0, -1):
+        content = agent.messages[i]["content"]
+        results = [block["toolResult"] for block in content if "toolResult" in block]
+        if results:
+            if any(result["status"] != "success" for result in results):
+                raise RuntimeError(f"Tool call failed: {results}")
+            previous = agent.messages[i - 1]["content"]
+            uses = [block["toolUse"] for block in previous if "toolUse" in block]
+            return (
+                [tool_use["toolUseId"] for tool_use in uses],
+                [result["toolUseId"] for result in results],
+            )
+    raise RuntimeError("No tool results in the conversation")
+
+
+def run(gateway, limit: int, turns: int) -> dict:
+    model = ScriptedModel(lambda prompt: [(name, args) for name, args, _ in TOOL_CALLS])
+    hook = ToolLoggingHook()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        client, tools = connect_gateway(gateway.url, "NONE")
+        agent = create_agent(model, tools, hooks=[hook], max_concurrency=limit)
+        timings, overlap, max_concurrent = [], [], 0
+        for turn in range(turns + 1):
+            gateway.reset_counters()
+            hook.batches.clear()
+            started = time.perf_counter()
+            agent("¿Dónde hay cajeros y datáfonos cerca, y cuánto tengo?")
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            uses, results = result_order(agent)
+            if uses != results:
+                raise RuntimeError(f"Tool results out of order: {uses} vs {results}")
+            if turn:  # el primer turno calienta la sesión
+                timings.append(elapsed_ms)
+                max_concurrent = max(max_concurrent, gateway.max_concurrent_calls)
+                # Suma de los grupos de tool calls solapados del turno
+                overlap.append(
+                    [sum(batch[i] for batch in hook.batches) for i in (1, 2)]
+                )
+            agent.messages.clear()
+        client.stop(None, None, None)
+    return {
+        "turn_ms": statistics.median(timings),
+        "max_concurrent": max_concurrent,
+        "tools_ms": statistics.median(wall_ms for wall_ms, _ in overlap),
+        "sequential_ms": statistics.median(busy_ms for _, busy_ms in overlap),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--limits", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    results = {}
+    with McpStandIn(
+        tool_latency_ms={name: latency for name, _, latency in TOOL_CALLS}
+    ) as gateway:
+        for limit in args.limits:
+            results[limit] = run(gateway, limit, args.turns)
+
+    print(
+        f"\nTurno con {len(TOOL_CALLS)} tool calls independientes "
+        f"({', '.join(f'{latency} ms' for _, _, latency in TOOL_CALLS)}; "
+        f"p50 de {args.turns} turnos)\n"
+    )
+    print(
+        f"{'límite':>6} | {'turno ms':>8} | {'simultáneos':>11} | "
+        f"{'tools ms':>8} | {'en secuencia ms':>15}"
+    )
+    print("-" * 62)
+    for limit, result in results.items():
+        print(
+            f"{limit:>6} | {result['turn_ms']:>8.1f} | "
+            f"{result['max_concurrent']:>11} | {result['tools_ms']:>8.1f} | {result['sequential_ms']:>15.1f}"
+        )
+    print("\nResultados entregados al modelo en el orden de los tool uses.")
+
+
+if __name__ == "__main__":
+    main()
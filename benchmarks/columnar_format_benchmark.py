@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark de `format=columnar` vs. el listado por filas en la API de salud de datáfonos.
+
+Para flotas de 100, 1k y 10k datáfonos (`setup/populate_datafonos.py`) lee el
+listado `GET /datafonos` (páginas de hasta 1000) con el handler real de
+`lambdas/datafonos_health` contra el stand-in local de DynamoDB, en ambos
+formatos. Reporta bytes del body (JSON sin comprimir: lo que llega al modelo),
+tokens estimados (~4 bytes/token), bytes con gzip (lo que viaja por el VPC
+endpoint) y latencia del handler. Verifica que las filas columnar reconstruyan
+exactamente los mismos items.
+
+Uso: python benchmarks/columnar_format_benchmark.py [--sizes 100 1000 10000] [--fields status,city]
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import time
+
+# harness primero: agrega setup/ y la capa shared_runtime al sys.path
+from harness import load_lambda_module, use_standin
+from dynamodb_standin import DynamoDBStandIn
+from populate_datafonos import generate_datafonos
+
+PAGE_LIMIT = 1000
+BYTES_PER_TOKEN = 4
+
+
+def read_listing(module, devices: int, response_format: str, fields: str) -> tuple:
+    """Lee `devices` datáfonos. Retorna (items como dicts, bytes, bytes gzip, ms)."""
+    items, size, gzip_size, elapsed_ms, next_token = [], 0, 0, 0.0, None
+    while True:
+        limit = min(PAGE_LIMIT, devices - len(items))
+        query = {"limit": str(limit), "format": response_format}
+        if fields:
+            query["fields"] = fields
+        if next_token:
+            query["next_token"] = next_token
+        event = {
+            "queryStringParameters": query,
+            "headers": {"Accept-Encoding": "identity"},
+        }
+        started = time.perf_counter()
+        response = module.handler(event, None)
+        elapsed_ms += (time.perf_counter() - started) * 1000
+        if response["statusCode"] != 200:
+            raise RuntimeError(f"Unexpected response: {response}")
+
+        raw = response["body"].encode("utf-8")
+        size += len(raw)
+        gzip_size += len(gzip.compress(raw, 6, mtime=0))
+        body = json.loads(raw)
+        if response_format == "columnar":
+            items.extend(dict(zip(body["columns"], row)) for row in body["datafonos"])
+        else:
+            items.extend(body["datafonos"])
+        next_token = body.get("next_token")
+        if not next_token or len(items) >= devices:
+            return items, size, gzip_size, elapsed_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--fields", help="Proyección ?fields= para ambos formatos")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--request-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    projection = f"?fields={args.fields}" if args.fields else ""
+    print(
+        f"\nListado GET /datafonos{projection}: rows vs. format=columnar "
+        f"(handler p50 de {args.repeat})\n"
+    )
+    print(
+        f"{'datáfonos':>9} | {'formato':>8} | {'KB':>8} | {'tokens':>8} | "
+        f"{'ahorro':>6} | {'KB gzip':>8} | {'handler ms':>10}"
+    )
+    print("-" * 78)
+
+    # Un solo stand-in por proceso: la capa fija el endpoint en el primer import
+    with DynamoDBStandIn(
+        generate_datafonos(max(args.sizes)), request_latency_ms=args.request_latency_ms
+    ) as standin:
+        use_standin(standin)
+        module = load_lambda_module("datafonos_health")
+        module.SCAN_SEGMENTS = 1
+
+        for devices in args.sizes:
+            results = {}
+            for response_format in ("rows", "columnar"):
+                # La primera corrida calienta
+                runs = [
+                    read_listing(module, devices, response_format, args.fields)
+                    for _ in range(args.repeat + 1)
+                ]
+                items, raw_bytes, gzip_bytes, _ = runs[-1]
+                handler_ms = statistics.median(run[3] for run in runs[1:])
+                results[response_format] = (items, raw_bytes, gzip_bytes, handler_ms)
+
+            if results["rows"][0] != results["columnar"][0]:
+                raise RuntimeError(f"Columnar rows differ from the items ({devices})")
+
+            row_bytes = results["rows"][1]
+            for response_format, result in results.items():
+                _, raw_bytes, gzip_bytes, handler_ms = result
+                print(
+                    f"{devices:>9} | {response_format:>8} | {raw_bytes / 1024:>8.1f} | "
+                    f"{raw_bytes / BYTES_PER_TOKEN:>8.0f} | "
+                    f"{1 - raw_bytes / row_bytes:>6.0%} | "
+                    f"{gzip_bytes / 1024:>8.1f} | {handler_ms:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
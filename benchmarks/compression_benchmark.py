@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark de compresión negociada (Accept-Encoding) del listado GET /datafonos.
+
+Lee 1k y 10k datáfonos del listado (páginas de 1000) a través del handler real
+de `lambdas/datafonos_health` contra el stand-in local de DynamoDB, variando el
+Accept-Encoding del request:
+    - identity: JSON sin comprimir (comportamiento anterior)
+    - gzip:     lo que envía el adapter (`lambdas/adapter_router`)
+    - br:       solo si el paquete `brotli` está instalado
+
+Reporta los bytes que cruzan el VPC endpoint (body binario, ya sin base64), la
+latencia del handler (incluye la compresión), el costo de descomprimir en el
+adapter y una estimación del tiempo de transferencia a `--link-mbps`.
+
+Uso: python benchmarks/compression_benchmark.py [--devices 1000,10000] [--link-mbps 100]
+"""
+
+import argparse
+import base64
+import gzip
+import json
+import statistics
+import time
+
+# harness primero: agrega setup/ y la capa shared_runtime al sys.path
+from harness import load_lambda_module, use_standin
+from dynamodb_standin import DynamoDBStandIn
+from populate_datafonos import generate_datafonos
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PAGE_LIMIT = 1000
+
+DECODERS = {"identity": lambda data: data, "gzip": gzip.decompress}
+if brotli is not None:
+    DECODERS["br"] = brotli.decompress
+
+
+def read_listing(module, encoding: str, pages: int) -> tuple:
+    """Lee `pages` páginas. Retorna (bytes en el cable, ms handler, ms decode, items)."""
+    wire_bytes, handler_ms, decode_ms, items, next_token = 0, 0.0, 0.0, [], None
+    for _ in range(pages):
+        query = {"limit": str(PAGE_LIMIT)}
+        if next_token:
+            query["next_token"] = next_token
+        event = {"queryStringParameters": query, "headers": {"Accept-Encoding": encoding}}
+
+        started = time.perf_counter()
+        response = module.handler(event, None)
+        handler_ms += (time.perf_counter() - started) * 1000
+
+        if response.get("isBase64Encoded"):
+            payload = base64.b64decode(response["body"])
+        else:
+            payload = response["body"].encode("utf-8")
+        wire_bytes += len(payload)
+
+        started = time.perf_counter()
+        content_encoding = response["headers"].get("Content-Encoding", "identity")
+        body = json.loads(DECODERS[content_encoding](payload))
+        decode_ms += (time.perf_counter() - started) * 1000
+
+        items.extend(body["datafonos"])
+        next_token = body.get("next_token")
+    return wire_bytes, handler_ms, decode_ms, items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--devices", default="1000,10000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--link-mbps", type=float, default=100.0)
+    parser.add_argument("--request-latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(
+        f"\nListado GET /datafonos por Accept-Encoding "
+        f"(p50 de {args.repeat}, transferencia estimada a {args.link_mbps:g} Mbps)\n"
+    )
+    print(
+        f"{'devices':>7} | {'encoding':>8} | {'KB':>8} | {'ratio':>5} | "
+        f"{'handler ms':>10} | {'decode ms':>9} | {'transfer ms':>11} | {'total ms':>8}"
+    )
+    print("-" * 91)
+
+    fleet_sizes = [int(d) for d in args.devices.split(",")]
+
+    # Un solo stand-in por proceso: la capa fija el endpoint en el primer import
+    with DynamoDBStandIn(
+        generate_datafonos(max(fleet_sizes)), request_latency_ms=args.request_latency_ms
+    ) as standin:
+        use_standin(standin)
+        module = load_lambda_module("datafonos_health")
+        module.SCAN_SEGMENTS = 1
+
+        for devices in fleet_sizes:
+            pages = -(-devices // PAGE_LIMIT)
+            identity_bytes, reference = None, None
+            for encoding in DECODERS:
+                read_listing(module, encoding, pages)  # calentamiento
+                runs = [read_listing(module, encoding, pages) for _ in range(args.repeat)]
+                wire_bytes = runs[0][0]
+                handler_ms = statistics.median(run[1] for run in runs)
+                decode_ms = statistics.median(run[2] for run in runs)
+                transfer_ms = wire_bytes * 8 / (args.link_mbps * 1000)
+
+                device_ids = sorted(item["device_id"] for item in runs[0][3])
+                reference = reference or device_ids
+                if device_ids != reference or len(device_ids) != devices:
+                    raise RuntimeError(f"Result mismatch with {encoding}")
+                identity_bytes = identity_bytes or wire_bytes
+
+                print(
+                    f"{devices:>7} | {encoding:>8} | {wire_bytes / 1024:>8.1f} | "
+                    f"{identity_bytes / wire_bytes:>4.1f}x | {handler_ms:>10.1f} | "
+                    f"{decode_ms:>9.1f} | {transfer_ms:>11.1f} | "
+                    f"{handler_ms + decode_ms + transfer_ms:>8.1f}"
+                )
+
+if __name__ == "__main__":
+    main()
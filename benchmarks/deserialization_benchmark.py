@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark de deserialización: Table resource + Decimal vs FastTable.
+
+Parte de items en formato de bajo nivel de DynamoDB (`{"N": "6.2442"}`), tal
+como los entrega botocore, generados por `setup/populate_datafonos.py`, y mide
+el costo de llevarlos hasta el body JSON de la respuesta:
+    - Decimal: TypeDeserializer (lo que hace el Table resource) + json.dumps con
+               DecimalEncoder, que convierte cada Decimal de vuelta a int/float.
+    - fast:    `shared_runtime.fast_items.deserialize_item` (int/float directo)
+               + json.dumps sin encoder custom.
+
+Verifica que ambos caminos produzcan el mismo JSON.
+
+Uso: python benchmarks/deserialization_benchmark.py [--items 10000] [--repeat 7]
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+# harness primero: agrega setup/ y la capa shared_runtime al sys.path
+from harness import LAYER_PATH  # noqa: F401
+from populate_datafonos import generate_datafonos
+
+from boto3.dynamodb.types import TypeDeserializer
+from shared_runtime.fast_items import deserialize_item
+from shared_runtime.responses import DecimalEncoder
+
+_deserializer = TypeDeserializer()
+
+
+def decimal_path(raw_items: list) -> tuple:
+    started = time.perf_counter()
+    items = [
+        {name: _deserializer.deserialize(value) for name, value in item.items()}
+        for item in raw_items
+    ]
+    deserialized = time.perf_counter()
+    body = json.dumps({"datafonos": items, "count": len(items)}, cls=DecimalEncoder)
+    return body, deserialized - started, time.perf_counter() - deserialized
+
+
+def fast_path(raw_items: list) -> tuple:
+    started = time.perf_counter()
+    items = [deserialize_item(item) for item in raw_items]
+    deserialized = time.perf_counter()
+    body = json.dumps({"datafonos": items, "count": len(items)})
+    return body, deserialized - started, time.perf_counter() - deserialized
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    raw_items = generate_datafonos(args.items)
+
+    results, bodies = {}, {}
+    for name, path in (("Decimal", decimal_path), ("fast", fast_path)):
+        path(raw_items)  # calentamiento
+        runs = [path(raw_items) for _ in range(args.repeat)]
+        bodies[name] = runs[0][0]
+        results[name] = (
+            statistics.median(run[1] for run in runs) * 1000,
+            statistics.median(run[2] for run in runs) * 1000,
+            statistics.median(run[1] + run[2] for run in runs) * 1000,
+        )
+
+    if json.loads(bodies["Decimal"]) != json.loads(bodies["fast"]):
+        raise RuntimeError("Decimal and fast paths produced different JSON")
+
+    print(f"\nDeserialización + json.dumps de {args.items} datáfonos (p50 de {args.repeat})\n")
+    print(f"{'camino':>8} | {'deserialize ms':>14} | {'dumps ms':>8} | {'total ms':>8}")
+    print("-" * 48)
+    for name, (deserialize_ms, dumps_ms, total_ms) in results.items():
+        print(f"{name:>8} | {deserialize_ms:>14.1f} | {dumps_ms:>8.1f} | {total_ms:>8.1f}")
+    speedup = results["Decimal"][2] / results["fast"][2]
+    print(f"\nMejora total: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Stand-in local de DynamoDB para los benchmarks.
+
+Sirve sobre HTTP el subconjunto del protocolo JSON de DynamoDB que usan las
+Lambdas de este repo (Scan con Segment/TotalSegments, Query por llave o GSI,
+FilterExpression de igualdad) sobre una
+tabla en memoria, con latencia simulada por request y por item leído. Así boto3
+ejecuta su camino real (serialización, pool de conexiones, threads) sin AWS.
+El servidor corre en un proceso aparte para no competir por el GIL con el
+código que se está midiendo. Con `tls=True` sirve HTTPS con un certificado
+autofirmado (requiere el CLI `openssl`) para medir también el handshake TLS.
+
+Uso:
+    from dynamodb_standin import DynamoDBStandIn
+
+    with DynamoDBStandIn(items, request_latency_ms=8, item_latency_us=20) as standin:
+        os.environ["AWS_ENDPOINT_URL_DYNAMODB"] = standin.endpoint_url
+        ...
+"""
+
+import json
+import multiprocessing
+import os
+import re
+import ssl
+import subprocess
+import tempfile
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Límite de DynamoDB para una página de Scan/Query
+MAX_PAGE_BYTES = 1024 * 1024
+
+TARGET_PREFIX = "DynamoDB_20120810."
+
+
+class StandInError(Exception):
+    """Error de validación que se devuelve al cliente como ValidationException."""
+
+
+def _item_size(item: dict) -> int:
+    """Aproxima el tamaño de un item con el largo de su representación JSON."""
+    return len(json.dumps(item, separators=(",", ":")))
+
+
+def _scalar(value: dict):
+    """Retorna el valor escalar de un AttributeValue para comparar/ordenar."""
+    if "N" in value:
+        return float(value["N"])
+    return next(iter(value.values()))
+
+
+class InMemoryTable:
+    """Tabla DynamoDB en memoria con partition key PK y sort key SK.
+
+    Los items se ordenan por hash de la partition key (como en DynamoDB), de modo
+    que cada segmento de un Scan paralelo cubre un rango contiguo de hashes.
+    """
+
+    def __init__(self, items: list, indexes: dict = None):
+        self.indexes = indexes or {}
+        self.items = sorted(items, key=self._scan_order)
+        self._hashes = [self._hash(item) for item in self.items]
+        self._segments = {}
+
+    @staticmethod
+    def _hash(item: dict) -> int:
+        return zlib.crc32(item["PK"]["S"].encode("utf-8"))
+
+    def _scan_order(self, item: dict) -> tuple:
+        return (self._hash(item), item["PK"]["S"], item["SK"]["S"])
+
+    def _segment_items(self, segment: int, total_segments: int) -> list:
+        """Items de un segmento (rango contiguo de hashes), cacheados por TotalSegments."""
+        if total_segments not in self._segments:
+            buckets = [[] for _ in range(total_segments)]
+            for item, item_hash in zip(self.items, self._hashes):
+                buckets[item_hash * total_segments // 2**32].append(item)
+            self._segments[total_segments] = buckets
+        return self._segments[total_segments][segment]
+
+    @staticmethod
+    def _key(item: dict, key_names: tuple) -> dict:
+        return {name: item[name] for name in key_names if name in item}
+
+    def scan(self, request: dict) -> tuple:
+        candidates = self._segment_items(
+            request.get("Segment", 0), request.get("TotalSegments", 1)
+        )
+        return self._page(candidates, request, ("PK", "SK"))
+
+    def query(self, request: dict) -> tuple:
+        index_name = request.get("IndexName")
+        key_names = self.indexes.get(index_name, ("PK", "SK"))
+        conditions = _parse_conditions(
+            request["KeyConditionExpression"],
+            request.get("ExpressionAttributeNames", {}),
+            request.get("ExpressionAttributeValues", {}),
+        )
+        candidates = [
+            item
+            for item in self.items
+            if key_names[0] in item and _matches(item, conditions)
+        ]
+        sort_name = key_names[-1]
+
+        def order(item):
+            return (
+                _scalar(item.get(sort_name, {"S": ""})),
+                item["PK"]["S"],
+                item["SK"]["S"],
+            )
+
+        candidates.sort(key=order, reverse=request.get("ScanIndexForward") is False)
+        return self._page(candidates, request, ("PK", "SK") + tuple(key_names))
+
+    def _page(self, candidates: list, request: dict, key_names: tuple) -> tuple:
+        start = 0
+        start_key = request.get("ExclusiveStartKey")
+        if start_key:
+            for position, item in enumerate(candidates):
+                if all(item.get(name) == value for name, value in start_key.items()):
+                    start = position + 1
+                    break
+            else:
+                raise StandInError("ExclusiveStartKey does not match any item")
+
+        limit = request.get("Limit")
+        page, size = [], 0
+        for item in candidates[start:]:
+            if limit is not None and len(page) >= limit:
+                break
+            size += _item_size(item)
+            page.append(item)
+            if size >= MAX_PAGE_BYTES:
+                break
+
+        response = {"Count": len(page), "ScannedCount": len(page)}
+        has_more = start + len(page) < len(candidates)
+        if page and (has_more or len(page) == limit):
+            response["LastEvaluatedKey"] = self._key(page[-1], key_names)
+
+        # FilterExpression se aplica después de Limit, como en DynamoDB
+        if request.get("FilterExpression"):
+            conditions = _parse_conditions(
+                request["FilterExpression"],
+                request.get("ExpressionAttributeNames", {}),
+                request.get("ExpressionAttributeValues", {}),
+            )
+            page = [item for item in page if _matches(item, conditions)]
+            response["Count"] = len(page)
+
+        projection = request.get("ProjectionExpression")
+        if projection:
+            names = request.get("ExpressionAttributeNames", {})
+            attributes = [
+                names.get(part.strip(), part.strip()) for part in projection.split(",")
+            ]
+            page = [
+                {name: item[name] for name in attributes if name in item}
+                for item in page
+            ]
+
+        response["Items"] = page
+        return response, len(response["Items"])
+
+
+_BEGINS_WITH = re.compile(r"^begins_with\(\s*([#\w]+)\s*,\s*(:\w+)\s*\)$")
+_EQUALS = re.compile(r"^([#\w]+)\s*=\s*(:\w+)$")
+
+
+def _parse_conditions(expression: str, names: dict, values: dict) -> list:
+    """Traduce un KeyConditionExpression simple a una lista de (op, atributo, valor)."""
+    conditions = []
+    for part in re.split(r"\s+AND\s+", expression.strip()):
+        part = part.strip()
+        # Quita solo los paréntesis sobrantes del agrupamiento (no los de begins_with)
+        while part.startswith("(") and part.count("(") > part.count(")"):
+            part = part[1:].strip()
+        while part.endswith(")") and part.count(")") > part.count("("):
+            part = part[:-1].strip()
+        match = _EQUALS.match(part)
+        op = "="
+        if not match:
+            match = _BEGINS_WITH.match(part)
+            op = "begins_with"
+        if not match:
+            raise StandInError(f"Unsupported KeyConditionExpression: {expression}")
+        name, placeholder = match.groups()
+        conditions.append((op, names.get(name, name), values[placeholder]))
+    return conditions
+
+
+def _matches(item: dict, conditions: list) -> bool:
+    for op, name, value in conditions:
+        attribute = item.get(name)
+        if attribute is None:
+            return False
+        if op == "=" and attribute != value:
+            return False
+        if op == "begins_with" and not _scalar(attribute).startswith(_scalar(value)):
+            return False
+    return True
+
+
+def generate_self_signed_cert(prefix: str) -> tuple:
+    """Genera un certificado autofirmado para 127.0.0.1. Retorna (cert, key)."""
+    cert_dir = tempfile.mkdtemp(prefix=prefix)
+    cert_path = os.path.join(cert_dir, "cert.pem")
+    key_path = os.path.join(cert_dir, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key_path, "-out", cert_path, "-days", "1",
+            "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )  # fmt: skip
+    return cert_path, key_path
+
+
+class DynamoDBStandIn:
+    """Servidor HTTP local que emula DynamoDB sobre una InMemoryTable.
+
+    Args:
+        items: Items en formato de bajo nivel ({"PK": {"S": ...}, ...}), como los
+            que generan los scripts de `setup/`.
+        request_latency_ms: Latencia fija simulada por request.
+        item_latency_us: Latencia simulada por item leído (throughput por segmento).
+        indexes: GSIs disponibles, {nombre: (partition_key, sort_key)}.
+        tls: Sirve HTTPS con un certificado autofirmado; `ca_bundle` apunta al
+            certificado para usarlo como AWS_CA_BUNDLE.
+    """
+
+    def __init__(
+        self,
+        items: list,
+        request_latency_ms: float = 5.0,
+        item_latency_us: float = 0.0,
+        indexes: dict = None,
+        tls: bool = False,
+    ):
+        self.table = InMemoryTable(items, indexes)
+        self.request_latency_ms = request_latency_ms
+        self.item_latency_us = item_latency_us
+        self._requests = multiprocessing.Value("i", 0)
+        self._items_read = multiprocessing.Value("i", 0)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._process = None
+        self.ca_bundle = self._enable_tls() if tls else None
+
+    def _enable_tls(self) -> str:
+        """Genera un certificado autofirmado para 127.0.0.1 y envuelve el socket."""
+        cert_path, key_path = generate_self_signed_cert("dynamodb-standin-")
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_path, key_path)
+        self._server.socket = context.wrap_socket(
+            self._server.socket, server_side=True
+        )
+        return cert_path
+
+    @property
+    def endpoint_url(self) -> str:
+        host, port = self._server.server_address
+        scheme = "https" if self.ca_bundle else "http"
+        return f"{scheme}://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        return self._requests.value
+
+    @property
+    def items_read(self) -> int:
+        return self._items_read.value
+
+    def reset_counters(self) -> None:
+        self._requests.value = 0
+        self._items_read.value = 0
+
+    def _handle(self, operation: str, request: dict) -> dict:
+        if operation == "Scan":
+            response, read = self.table.scan(request)
+        elif operation == "Query":
+            response, read = self.table.query(request)
+        else:
+            raise StandInError(f"Unsupported operation: {operation}")
+
+        with self._requests.get_lock():
+            self._requests.value += 1
+        with self._items_read.get_lock():
+            self._items_read.value += read
+
+        time.sleep(
+            (self.request_latency_ms * 1000 + self.item_latency_us * read) / 1_000_000
+        )
+        return response
+
+    def _handler_class(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Envía headers + body en un solo segmento (evita Nagle + delayed ACK)
+            disable_nagle_algorithm = True
+            wbufsize = -1
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                operation = self.headers.get("X-Amz-Target", "").replace(
+                    TARGET_PREFIX, ""
+                )
+                try:
+                    status, body = 200, standin._handle(operation, request)
+                except StandInError as e:
+                    status = 400
+                    body = {
+                        "__type": "com.amazonaws.dynamodb.v20120810#ValidationException",
+                        "message": str(e),
+                    }
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/x-amz-json-1.0")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "DynamoDBStandIn":
+        context = multiprocessing.get_context("fork")
+        self._process = context.Process(target=self._server.serve_forever, daemon=True)
+        self._process.start()
+        return self
+
+    def stop(self) -> None:
+        self._process.terminate()
+        self._process.join()
+        self._server.server_close()
+
+    def __enter__(self) -> "DynamoDBStandIn":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
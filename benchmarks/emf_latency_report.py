@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Reporte de latencia por fase a partir de los registros EMF del adapter router.
+
+Con `adapter_phase_metrics` el router escribe una línea JSON (CloudWatch Embedded
+Metric Format) por tool call con DNS, conexión TCP, handshake TLS, time to first
+byte, lectura del body, descompresión y parse. Este script lee logs capturados
+(archivos o stdin; cualquier prefijo antes del JSON se ignora, ej. la salida de
+`aws logs tail`) y arma tablas p50/p95/p99 por tool (o tool + ciudad).
+
+Sin AWS, `--simulate N` ejecuta N tool calls del handler real contra el stand-in
+local de las APIs privadas (con handshake y latencias variables) y reporta sus
+registros.
+
+Uso:
+    aws logs tail /aws/lambda/<adapter> --since 1h > adapter.log
+    python benchmarks/emf_latency_report.py adapter.log [--by city]
+    python benchmarks/emf_latency_report.py --simulate 300
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+# Orden de las fases en la tabla (el resto de las métricas va al final)
+PHASE_ORDER = (
+    "DnsMs",
+    "TcpConnectMs",
+    "TlsHandshakeMs",
+    "SendMs",
+    "TimeToFirstByteMs",
+    "BodyReadMs",
+    "DecompressMs",
+    "UpstreamMs",
+    "DynamoDBQueryMs",
+    "ParseMs",
+    "TotalMs",
+)
+
+SIMULATED_CALLS = (
+    ("listAtmsByCity", {"city": "medellin"}),
+    ("listAtmsByCity", {"city": "bogota", "status": "online"}),
+    ("listDatafonosByCity", {"city": "bogota"}),
+    ("getBalanceByUsername", {"username": "santi"}),
+)
+
+
+def read_records(lines) -> list:
+    """Registros EMF de las líneas; ignora lo que no sea JSON con `_aws`."""
+    records = []
+    for line in lines:
+        start = line.find("{")
+        if start < 0:
+            continue
+        try:
+            record = json.loads(line[start:])
+        except ValueError:
+            continue
+        if isinstance(record, dict) and "_aws" in record:
+            records.append(record)
+    return records
+
+
+def group_timings(records: list, by: str) -> dict:
+    """{grupo: {métrica: [valores]}} con las métricas declaradas en cada registro."""
+    groups = defaultdict(lambda: defaultdict(list))
+    for record in records:
+        group = record.get("Tool", "?")
+        if by == "city":
+            group = f"{group} / {record.get('City', '-')}"
+        for directive in record["_aws"].get("CloudWatchMetrics", []):
+            for metric in directive.get("Metrics", []):
+                value = record.get(metric["Name"])
+                if isinstance(value, (int, float)):
+                    groups[group][metric["Name"]].append(value)
+    return groups
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def print_report(records: list, by: str) -> None:
+    codes = defaultdict(int)
+    for record in records:
+        codes[record.get("Code", "?")] += 1
+    print(f"\n{len(records)} registros EMF; códigos: {dict(codes)}")
+
+    for group, timings in sorted(group_timings(records, by).items()):
+        print(f"\n{group}\n")
+        print(
+            f"{'fase':>18} | {'n':>5} | {'p50 ms':>8} | {'p95 ms':>8} | "
+            f"{'p99 ms':>8} | {'máx ms':>8}"
+        )
+        print("-" * 70)
+        order = {name: i for i, name in enumerate(PHASE_ORDER)}
+        for name in sorted(timings, key=lambda name: order.get(name, len(order))):
+            values = timings[name]
+            print(
+                f"{name:>18} | {len(values):>5} | {percentile(values, 50):>8.2f} | "
+                f"{percentile(values, 95):>8.2f} | {percentile(values, 99):>8.2f} | "
+                f"{max(values):>8.2f}"
+            )
+
+
+def simulate(calls: int) -> list:
+    """Ejecuta el router localmente con PHASE_METRICS y retorna sus líneas EMF."""
+    # harness primero: agrega la capa shared_runtime al sys.path
+    from harness import gateway_context, load_lambda_module, use_private_api
+    from private_api_standin import PrivateApiStandIn
+
+    os.environ.update(
+        {
+            "PHASE_METRICS": "true",
+            "HEALTH_CACHE_TTL_SECONDS": "0",
+            # Conexiones que expiran a menudo, para tener handshakes en la muestra
+            "HTTP_IDLE_TIMEOUT_SECONDS": "0.05",
+        }
+    )
+    rng = random.Random(7)
+    output = io.StringIO()
+    with PrivateApiStandIn(
+        request_latency_ms=8.0,
+        path_latency_ms={"/atms/": 20.0, "/balance/": 4.0},
+        handshake_latency_ms=15.0,
+    ) as api:
+        use_private_api(api)
+        module = load_lambda_module("adapter_router")
+        with contextlib.redirect_stdout(output):
+            for _ in range(calls):
+                tool, event = rng.choice(SIMULATED_CALLS)
+                module.handler(dict(event), gateway_context(tool))
+                if rng.random() < 0.2:
+                    # Pausa ocasional: la siguiente call abre conexión nueva
+                    time.sleep(module.pool.idle_timeout * 1.5)
+    return output.getvalue().splitlines()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("logs", nargs="*", help="Archivos de log (stdin si se omite)")
+    parser.add_argument("--by", choices=("tool", "city"), default="tool")
+    parser.add_argument("--simulate", type=int, metavar="CALLS")
+    args = parser.parse_args()
+
+    if args.simulate:
+        lines = simulate(args.simulate)
+    elif args.logs:
+        lines = []
+        for path in args.logs:
+            with open(path, encoding="utf-8") as log_file:
+                lines.extend(log_file)
+    else:
+        lines = sys.stdin
+
+    records = read_records(lines)
+    if not records:
+        raise SystemExit("No EMF records found")
+    print_report(records, args.by)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Utilidades comunes de los benchmarks: cargar los handlers reales de `lambdas/`
+(con la capa `shared_runtime` en el path, como en Lambda) y apuntar boto3 al
+stand-in local de DynamoDB o el adapter al stand-in de las APIs privadas.
+"""
+
+import importlib.util
+import logging
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+LAYER_PATH = os.path.join(ROOT, "lambdas", "layers", "shared_runtime", "python")
+
+sys.path.insert(0, LAYER_PATH)
+sys.path.insert(0, os.path.join(ROOT, "setup"))
+
+# Los scripts de setup configuran logging INFO; los handlers loguean cada evento
+logging.disable(logging.INFO)
+
+
+def use_standin(standin) -> None:
+    """Configura credenciales ficticias y el endpoint del stand-in para boto3.
+
+    Debe llamarse antes de cargar los handlers: la capa crea sus clientes al
+    importarse, igual que en la fase init de Lambda.
+    """
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "standin")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "standin")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    os.environ["AWS_ENDPOINT_URL_DYNAMODB"] = standin.endpoint_url
+    if standin.ca_bundle:
+        os.environ["AWS_CA_BUNDLE"] = standin.ca_bundle
+
+
+def use_private_api(api) -> None:
+    """Apunta las tres URLs del adapter router al stand-in de las APIs privadas.
+
+    Debe llamarse antes de crear cualquier contexto SSL para que el certificado
+    autofirmado del stand-in sea de confianza.
+    """
+    if api.ca_bundle:
+        os.environ["SSL_CERT_FILE"] = api.ca_bundle
+    for name in ("DATAFONOS_API_URL", "BALANCE_API_URL", "ATM_API_URL"):
+        os.environ[name] = api.base_url
+
+
+def gateway_context(
+    tool_name: str, target: str = "benchmark", remaining_ms: float = None
+):
+    """Contexto Lambda como lo envía AgentCore Gateway: `<target>___<tool>`.
+
+    Con `remaining_ms` expone `get_remaining_time_in_millis()`, que cuenta hacia
+    atrás desde ese valor como el timeout real de la función.
+    """
+    custom = {"bedrockAgentCoreToolName": f"{target}___{tool_name}"}
+    context = SimpleNamespace(client_context=SimpleNamespace(custom=custom))
+    if remaining_ms is not None:
+        expires_at = time.monotonic() + remaining_ms / 1000
+        context.get_remaining_time_in_millis = lambda: max(
+            0, int((expires_at - time.monotonic()) * 1000)
+        )
+    return context
+
+
+def load_lambda_module(lambda_dir: str, table_name: str = "standin-table"):
+    """Importa `lambdas/<lambda_dir>/index.py` como módulo aislado.
+
+    El directorio de la Lambda queda en el sys.path, como LAMBDA_TASK_ROOT, para
+    que `index.py` importe sus módulos hermanos.
+    """
+    os.environ["TABLE_NAME"] = table_name
+    lambda_path = os.path.join(ROOT, "lambdas", lambda_dir)
+    if lambda_path not in sys.path:
+        sys.path.append(lambda_path)
+    path = os.path.join(lambda_path, "index.py")
+    spec = importlib.util.spec_from_file_location(f"{lambda_dir}_index", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
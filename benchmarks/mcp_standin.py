@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Stand-in local del MCP Gateway de AgentCore (MCP sobre streamable HTTP).
+
+Publica los tools de `infrastructure/openapi/agentcore-tool-schema-*.json` con el
+nombre `<target>___<tool>` que usa el gateway, pagina `tools/list` con cursor y
+simula la latencia de cada request (listado y tool calls). Los tool calls
+responden un eco de los argumentos, o lo que retorne `handler`. Cuenta requests
+de listado, tool calls y el máximo de tool calls simultáneos. Corre en un
+proceso aparte (uvicorn), igual que los otros stand-ins.
+
+Uso:
+    from mcp_standin import McpStandIn
+
+    with McpStandIn(page_size=3, list_latency_ms=80) as gateway:
+        client = MCPClient(lambda: streamablehttp_client(gateway.url))
+        ...
+"""
+
+import asyncio
+import glob
+import json
+import multiprocessing
+import os
+import socket
+
+import uvicorn
+from mcp import types
+from mcp.server.fastmcp.server import StreamableHTTPASGIApp
+from mcp.server.lowlevel import Server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.routing import Route
+
+SCHEMA_GLOB = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "infrastructure",
+    "openapi",
+    "agentcore-tool-schema-*.json",
+)
+
+
+def load_gateway_tools() -> list:
+    """Tools de los schemas del repo, nombrados `<target>___<tool>` como el gateway."""
+    tools = []
+    for path in sorted(glob.glob(SCHEMA_GLOB)):
+        target = os.path.basename(path)[: -len(".json")].rsplit("-", 1)[-1]
+        with open(path, encoding="utf-8") as schema_file:
+            for tool in json.load(schema_file):
+                tools.append({**tool, "name": f"{target}___{tool['name']}"})
+    return tools
+
+
+class McpStandIn:
+    """Servidor MCP local con los tools del gateway.
+
+    Args:
+        tools: Specs `{"name", "description", "inputSchema"}`; por defecto los
+            tool schemas del repo (`load_gateway_tools`).
+        page_size: Tools por página de `tools/list` (el resto va con nextCursor).
+        list_latency_ms: Latencia simulada por request de `tools/list`.
+        call_latency_ms: Latencia simulada por tool call.
+        tool_latency_ms: {nombre del tool: latencia} que reemplaza `call_latency_ms`.
+        handler: `handler(name, arguments) -> dict` con el resultado del tool call;
+            sin handler responde `{"tool", "arguments"}`.
+    """
+
+    def __init__(
+        self,
+        tools: list = None,
+        page_size: int = 5,
+        list_latency_ms: float = 0.0,
+        call_latency_ms: float = 0.0,
+        tool_latency_ms: dict = None,
+        handler=None,
+    ):
+        self.tools = [
+            types.Tool.model_validate(tool) for tool in tools or load_gateway_tools()
+        ]
+        self.page_size = page_size
+        self.list_latency_ms = list_latency_ms
+        self.call_latency_ms = call_latency_ms
+        self.tool_latency_ms = tool_latency_ms or {}
+        self.handler = handler
+        self._list_requests = multiprocessing.Value("i", 0)
+        self._tool_calls = multiprocessing.Value("i", 0)
+        self._active_calls = multiprocessing.Value("i", 0)
+        self._max_concurrent_calls = multiprocessing.Value("i", 0)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen(128)
+        self._process = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._socket.getsockname()
+        return f"http://{host}:{port}/mcp"
+
+    @property
+    def list_request_count(self) -> int:
+        return self._list_requests.value
+
+    @property
+    def tool_call_count(self) -> int:
+        return self._tool_calls.value
+
+    @property
+    def max_concurrent_calls(self) -> int:
+        return self._max_concurrent_calls.value
+
+    def reset_counters(self) -> None:
+        for counter in (self._list_requests, self._tool_calls):
+            counter.value = 0
+        self._max_concurrent_calls.value = 0
+
+    def _server(self) -> Server:
+        server = Server("rufus-bank-gateway-standin")
+        standin = self
+
+        @server.list_tools()
+        async def list_tools(request: types.ListToolsRequest) -> types.ListToolsResult:
+            if request is None:
+                # Refresco interno de la caché del SDK (validación de un tool call)
+                return types.ListToolsResult(tools=standin.tools)
+            with standin._list_requests.get_lock():
+                standin._list_requests.value += 1
+            await asyncio.sleep(standin.list_latency_ms / 1000)
+            cursor = request.params.cursor if request.params else None
+            start = int(cursor or 0)
+            end = start + standin.page_size
+            return types.ListToolsResult(
+                tools=standin.tools[start:end],
+                nextCursor=str(end) if end < len(standin.tools) else None,
+            )
+
+        @server.call_tool()
+        async def call_tool(name: str, arguments: dict) -> list:
+            with standin._active_calls.get_lock():
+                standin._active_calls.value += 1
+                standin._tool_calls.value += 1
+                if standin._active_calls.value > standin._max_concurrent_calls.value:
+                    standin._max_concurrent_calls.value = standin._active_calls.value
+            try:
+                latency_ms = standin.tool_latency_ms.get(name, standin.call_latency_ms)
+                await asyncio.sleep(latency_ms / 1000)
+                if standin.handler:
+                    result = standin.handler(name, arguments)
+                else:
+                    result = {"tool": name, "arguments": arguments}
+            finally:
+                with standin._active_calls.get_lock():
+                    standin._active_calls.value -= 1
+            return [types.TextContent(type="text", text=json.dumps(result))]
+
+        return server
+
+    def _serve(self) -> None:
+        manager = StreamableHTTPSessionManager(app=self._server(), json_response=True)
+        app = Starlette(
+            routes=[Route("/mcp", endpoint=StreamableHTTPASGIApp(manager))],
+            lifespan=lambda app: manager.run(),
+        )
+        config = uvicorn.Config(app, log_level="error", lifespan="on")
+        uvicorn.Server(config).run(sockets=[self._socket])
+
+    def start(self) -> "McpStandIn":
+        context = multiprocessing.get_context("fork")
+        self._process = context.Process(target=self._serve, daemon=True)
+        self._process.start()
+        return self
+
+    def stop(self) -> None:
+        self._process.terminate()
+        self._process.join()
+        self._socket.close()
+
+    def __enter__(self) -> "McpStandIn":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
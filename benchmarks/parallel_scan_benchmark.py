@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark del scan paralelo (Segment/TotalSegments) de los listados de salud.
+
+Carga N datáfonos generados por `setup/populate_datafonos.py` en el stand-in
+local de DynamoDB y recorre el listado completo GET /datafonos a través del
+handler real de `lambdas/datafonos_health`, variando SCAN_SEGMENTS. Imprime la
+curva de latencia (p50 del recorrido completo) a medida que crecen los segmentos
+y verifica que todas las configuraciones devuelvan el mismo conjunto de items.
+
+DynamoDB asigna los items a segmentos por hash de la partition key, así que un
+segmento nunca parte una misma PK. Con el modelo actual (PK=CITY#medellin /
+CITY#bogota) la ganancia se satura en 2 segmentos; `--partitions` reparte los
+datáfonos en N particiones sintéticas (CITY#medellin-07, ...) para modelar una
+flota multi-ciudad.
+
+Uso: python benchmarks/parallel_scan_benchmark.py [--devices 20000] [--partitions 64] [--segments 1,2,4,8,16]
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+# harness primero: agrega setup/ y la capa shared_runtime al sys.path
+from harness import load_lambda_module, use_standin
+from dynamodb_standin import DynamoDBStandIn
+from populate_datafonos import generate_datafonos
+
+
+def spread_partitions(items: list, partitions: int) -> list:
+    """Reparte los items en `partitions` particiones sintéticas por ciudad."""
+    if partitions <= 2:
+        return items
+    for index, item in enumerate(items):
+        item["PK"] = {"S": f"{item['PK']['S']}-{index % (partitions // 2):02d}"}
+    return items
+
+
+def read_full_listing(module, page_limit: int) -> tuple:
+    """Recorre todas las páginas de GET /datafonos. Retorna (items, páginas)."""
+    items, pages, next_token = [], 0, None
+    while True:
+        query = {"limit": str(page_limit)}
+        if next_token:
+            query["next_token"] = next_token
+        response = module.handler({"queryStringParameters": query}, None)
+        body = json.loads(response["body"])
+        if response["statusCode"] != 200:
+            raise RuntimeError(f"Unexpected response: {response}")
+        items.extend(body["datafonos"])
+        pages += 1
+        next_token = body.get("next_token")
+        if not next_token:
+            return items, pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--devices", type=int, default=20000)
+    parser.add_argument("--partitions", type=int, default=64)
+    parser.add_argument("--segments", default="1,2,4,8,16")
+    parser.add_argument("--page-limit", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--request-latency-ms", type=float, default=8.0)
+    parser.add_argument("--item-latency-us", type=float, default=100.0)
+    args = parser.parse_args()
+
+    items = spread_partitions(generate_datafonos(args.devices), args.partitions)
+
+    with DynamoDBStandIn(
+        items,
+        request_latency_ms=args.request_latency_ms,
+        item_latency_us=args.item_latency_us,
+    ) as standin:
+        use_standin(standin)
+        module = load_lambda_module("datafonos_health")
+
+        print(
+            f"\nScan completo de {args.devices} datáfonos en {args.partitions} "
+            f"particiones (limit={args.page_limit}, {args.repeat} repeticiones)\n"
+        )
+        print(f"{'segments':>8} | {'pages':>5} | {'requests':>8} | {'p50 ms':>9} | {'speedup':>7}")
+        print("-" * 52)
+
+        baseline, reference_ids = None, None
+        for total_segments in [int(s) for s in args.segments.split(",")]:
+            module.SCAN_SEGMENTS = total_segments
+            timings = []
+            for _ in range(args.repeat):
+                standin.reset_counters()
+                started = time.perf_counter()
+                listed, pages = read_full_listing(module, args.page_limit)
+                timings.append((time.perf_counter() - started) * 1000)
+
+            device_ids = sorted(item["device_id"] for item in listed)
+            if reference_ids is None:
+                reference_ids = device_ids
+            if device_ids != reference_ids or len(device_ids) != args.devices:
+                raise RuntimeError(f"Result mismatch with {total_segments} segments")
+
+            p50 = statistics.median(timings)
+            baseline = baseline or p50
+            print(
+                f"{total_segments:>8} | {pages:>5} | {standin.request_count:>8} | "
+                f"{p50:>9.1f} | {baseline / p50:>6.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Stand-in local de las APIs privadas (API Gateway detrás del VPC endpoint).
+
+Sirve por HTTPS (certificado autofirmado, requiere el CLI `openssl`) respuestas
+JSON para las rutas que consulta el adapter, con latencia simulada por request
+y por handshake (los RTT extra de TCP + TLS hasta el endpoint). Cuenta requests y
+conexiones aceptadas para verificar el reuso keep-alive, y cierra las conexiones
+inactivas tras `server_idle_timeout_s`, como lo haría el endpoint. Corre en un
+proceso aparte, igual que `dynamodb_standin.py`.
+
+Uso:
+    from private_api_standin import PrivateApiStandIn
+
+    with PrivateApiStandIn(request_latency_ms=5, handshake_latency_ms=10) as api:
+        use_private_api(api)  # harness.py: SSL_CERT_FILE + URLs del adapter
+        ...
+"""
+
+import json
+import multiprocessing
+import ssl
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from dynamodb_standin import generate_self_signed_cert
+
+
+class _Server(ThreadingHTTPServer):
+    """Hace el handshake TLS en el thread de cada conexión, no en el accept."""
+
+    daemon_threads = True
+
+    def __init__(self, standin, handler_class):
+        super().__init__(("127.0.0.1", 0), handler_class)
+        self.standin = standin
+
+    def finish_request(self, request, client_address):
+        standin = self.standin
+        time.sleep(standin.handshake_latency_ms / 1000)
+        if standin.ssl_context is not None:
+            request = standin.ssl_context.wrap_socket(request, server_side=True)
+        with standin._connections.get_lock():
+            standin._connections.value += 1
+        self.RequestHandlerClass(request, client_address, self)
+
+    def handle_error(self, request, client_address):
+        pass
+
+
+class PrivateApiStandIn:
+    """Servidor local que responde las rutas de las APIs privadas.
+
+    Args:
+        payloads: {prefijo de ruta: body JSON}; gana el prefijo más largo. Sin
+            coincidencia responde un eco del request (method, path, query, body).
+        handler: `handler(method, path, body) -> (status, body bytes)`; si se
+            define, reemplaza `payloads` (ej. el handler real de una Lambda de datos).
+        request_latency_ms: Latencia fija simulada por request.
+        path_latency_ms: {prefijo de ruta: latencia} que reemplaza
+            `request_latency_ms` (ej. simular una API degradada).
+        handshake_latency_ms: Latencia extra por conexión nueva (TCP + TLS).
+        server_idle_timeout_s: Cierra las conexiones keep-alive inactivas.
+        tls: Sirve HTTPS; `ca_bundle` apunta al certificado (SSL_CERT_FILE).
+    """
+
+    def __init__(
+        self,
+        payloads: dict = None,
+        handler=None,
+        request_latency_ms: float = 5.0,
+        path_latency_ms: dict = None,
+        handshake_latency_ms: float = 0.0,
+        server_idle_timeout_s: float = 60.0,
+        tls: bool = True,
+    ):
+        self.payloads = payloads or {}
+        self.handler = handler
+        self.request_latency_ms = request_latency_ms
+        self.path_latency_ms = path_latency_ms or {}
+        self.handshake_latency_ms = handshake_latency_ms
+        self.server_idle_timeout_s = server_idle_timeout_s
+        self._requests = multiprocessing.Value("i", 0)
+        self._connections = multiprocessing.Value("i", 0)
+        self._server = _Server(self, self._handler_class())
+        self._process = None
+        self.ssl_context, self.ca_bundle = None, None
+        if tls:
+            cert_path, key_path = generate_self_signed_cert("private-api-standin-")
+            self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            self.ssl_context.load_cert_chain(cert_path, key_path)
+            self.ca_bundle = cert_path
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        scheme = "https" if self.ssl_context else "http"
+        return f"{scheme}://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        return self._requests.value
+
+    @property
+    def connection_count(self) -> int:
+        return self._connections.value
+
+    def reset_counters(self) -> None:
+        self._requests.value = 0
+        self._connections.value = 0
+
+    def _respond(self, method: str, path: str, body: bytes) -> dict:
+        url = urlsplit(path)
+        matches = [prefix for prefix in self.payloads if url.path.startswith(prefix)]
+        if matches:
+            return self.payloads[max(matches, key=len)]
+        return {
+            "method": method,
+            "path": url.path,
+            "query": {key: values[0] for key, values in parse_qs(url.query).items()},
+            "body": json.loads(body) if body else None,
+        }
+
+    def _latency_ms(self, path: str) -> float:
+        path = urlsplit(path).path
+        matches = [prefix for prefix in self.path_latency_ms if path.startswith(prefix)]
+        if matches:
+            return self.path_latency_ms[max(matches, key=len)]
+        return self.request_latency_ms
+
+    def _handler_class(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            wbufsize = -1
+            timeout = standin.server_idle_timeout_s
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                if standin.handler:
+                    status, payload = standin.handler(self.command, self.path, body)
+                else:
+                    status = 200
+                    payload = json.dumps(
+                        standin._respond(self.command, self.path, body)
+                    ).encode("utf-8")
+
+                with standin._requests.get_lock():
+                    standin._requests.value += 1
+                time.sleep(standin._latency_ms(self.path) / 1000)
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = _serve
+            do_POST = _serve
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "PrivateApiStandIn":
+        context = multiprocessing.get_context("fork")
+        self._process = context.Process(target=self._server.serve_forever, daemon=True)
+        self._process.start()
+        return self
+
+    def stop(self) -> None:
+        self._process.terminate()
+        self._process.join()
+        self._server.server_close()
+
+    def __enter__(self) -> "PrivateApiStandIn":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
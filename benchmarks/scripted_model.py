@@ -0,0 +1,75 @@
+"""
+Modelo de Strands sin Bedrock para los benchmarks del agente Rufus Bank.
+
+Responde cada prompt con un turno de tool uses (los que retorne `plan`) y, cuando
+llegan sus resultados, con un texto que resume cuántos recibió. Emite los mismos
+eventos de streaming que la API Converse, así el agente ejecuta su ciclo real:
+hooks, tool executor y sesión MCP.
+
+Uso:
+    from scripted_model import ScriptedModel
+
+    model = ScriptedModel(lambda prompt: [("atm___listAtms", {"limit": 10})])
+    agent = create_agent(model, tools)
+"""
+
+import asyncio
+import itertools
+import json
+
+from strands.models import Model
+
+_tool_use_ids = itertools.count(1)
+
+
+class ScriptedModel(Model):
+    """Modelo determinista.
+
+    Args:
+        plan: `plan(prompt) -> [(tool, input), ...]` con los tool uses que el
+            modelo pide en un solo turno para el texto del prompt.
+        latency_ms: Latencia simulada por respuesta del modelo.
+    """
+
+    def __init__(self, plan, latency_ms: float = 0.0):
+        self.plan = plan
+        self.config = {"latency_ms": latency_ms}
+
+    def update_config(self, **model_config) -> None:
+        self.config.update(model_config)
+
+    def get_config(self) -> dict:
+        return self.config
+
+    async def structured_output(
+        self, output_model, prompt, system_prompt=None, **kwargs
+    ):
+        raise NotImplementedError("ScriptedModel does not support structured output")
+        yield  # pragma: no cover
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        await asyncio.sleep(self.config["latency_ms"] / 1000)
+        content = messages[-1]["content"]
+        results = [block["toolResult"] for block in content if "toolResult" in block]
+        prompt = "".join(block.get("text", "") for block in content)
+        tool_uses = [] if results else self.plan(prompt)
+
+        yield {"messageStart": {"role": "assistant"}}
+        if not tool_uses:
+            text = f"Listo: {len(results)} resultados de tools." if results else "Hola."
+            yield {"contentBlockDelta": {"delta": {"text": text}}}
+            yield {"contentBlockStop": {}}
+            yield {"messageStop": {"stopReason": "end_turn"}}
+            return
+
+        for name, tool_input in tool_uses:
+            tool_use_id = f"tooluse_{next(_tool_use_ids)}"
+            yield {
+                "contentBlockStart": {
+                    "start": {"toolUse": {"toolUseId": tool_use_id, "name": name}}
+                }
+            }
+            delta = {"toolUse": {"input": json.dumps(tool_input)}}
+            yield {"contentBlockDelta": {"delta": delta}}
+            yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "tool_use"}}
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark de `mode=summary` vs. listados completos en la API de salud de datáfonos.
+
+Para la pregunta "¿qué tan sanos están los datáfonos?" compara, con el handler
+real de `lambdas/datafonos_health` contra el stand-in local de DynamoDB:
+    - full:    el agente lee el listado (todas las páginas de 1000) y cuenta él
+    - summary: una sola respuesta con conteos por status/ciudad y los más inactivos
+
+sobre la flota completa (GET /datafonos) y una ciudad (GET /datafonos/medellin).
+Reporta bytes del body (JSON sin comprimir: lo que llega al modelo), tokens
+estimados (~4 bytes/token), tool calls necesarias y latencia del handler.
+
+La latencia del agente se estima como handler + `--turn-overhead-ms` por tool call
+(un turno del modelo por página) + tokens / `--prefill-tokens-per-s` (leer el
+resultado). Es un modelo, no una medición contra Bedrock.
+
+Uso: python benchmarks/summary_mode_benchmark.py [--devices 10000]
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+# harness primero: agrega setup/ y la capa shared_runtime al sys.path
+from harness import load_lambda_module, use_standin
+from dynamodb_standin import DynamoDBStandIn
+from populate_datafonos import generate_datafonos
+
+PAGE_LIMIT = 1000
+BYTES_PER_TOKEN = 4
+
+
+def call(module, query: dict, city: str = None) -> tuple:
+    """Invoca el handler. Retorna (body, bytes del body, ms del handler)."""
+    event = {"queryStringParameters": query, "headers": {"Accept-Encoding": "identity"}}
+    if city:
+        event["pathParameters"] = {"city": city}
+    started = time.perf_counter()
+    response = module.handler(event, None)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if response["statusCode"] != 200:
+        raise RuntimeError(f"Unexpected response: {response}")
+    size = len(response["body"].encode("utf-8"))
+    return json.loads(response["body"]), size, elapsed_ms
+
+
+def read_full(module, city: str = None) -> tuple:
+    """Lee el listado completo. Retorna (conteo por status, bytes, tool calls, ms)."""
+    if city:
+        body, size, elapsed_ms = call(module, {}, city)
+        return count_statuses(body["datafonos"]), size, 1, elapsed_ms
+
+    by_status, total_bytes, calls, total_ms, next_token = {}, 0, 0, 0.0, None
+    while True:
+        query = {"limit": str(PAGE_LIMIT)}
+        if next_token:
+            query["next_token"] = next_token
+        body, size, elapsed_ms = call(module, query)
+        for status, count in count_statuses(body["datafonos"]).items():
+            by_status[status] = by_status.get(status, 0) + count
+        total_bytes += size
+        calls += 1
+        total_ms += elapsed_ms
+        next_token = body.get("next_token")
+        if not next_token:
+            return by_status, total_bytes, calls, total_ms
+
+
+def read_summary(module, city: str = None) -> tuple:
+    body, size, elapsed_ms = call(module, {"mode": "summary"}, city)
+    return body["by_status"], size, 1, elapsed_ms
+
+
+def count_statuses(items: list) -> dict:
+    by_status = {}
+    for item in items:
+        by_status[item["status"]] = by_status.get(item["status"], 0) + 1
+    return by_status
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--devices", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--request-latency-ms", type=float, default=2.0)
+    parser.add_argument("--turn-overhead-ms", type=float, default=800.0)
+    parser.add_argument("--prefill-tokens-per-s", type=float, default=5000.0)
+    args = parser.parse_args()
+
+    print(
+        f"\n{args.devices} datáfonos: listado completo vs. mode=summary "
+        f"(p50 de {args.repeat}; agente: "
+        f"+{args.turn_overhead_ms:g} ms por tool call, "
+        f"{args.prefill_tokens_per_s:g} tokens/s de prefill)\n"
+    )
+    print(
+        f"{'ruta':>19} | {'modo':>7} | {'KB':>8} | {'tokens':>8} | "
+        f"{'calls':>5} | {'handler ms':>10} | {'agente ms':>9}"
+    )
+    print("-" * 86)
+
+    with DynamoDBStandIn(
+        generate_datafonos(args.devices), request_latency_ms=args.request_latency_ms
+    ) as standin:
+        use_standin(standin)
+        module = load_lambda_module("datafonos_health")
+        module.SCAN_SEGMENTS = 1
+
+        for route, city in (("/datafonos", None), ("/datafonos/medellin", "medellin")):
+            for mode, read in (("full", read_full), ("summary", read_summary)):
+                runs = []
+                # La primera corrida calienta; la caché por ciudad se vacía en cada una
+                for _ in range(args.repeat + 1):
+                    module.city_cache.invalidate()
+                    runs.append(read(module, city))
+                by_status, size, calls, _ = runs[-1]
+                handler_ms = statistics.median(run[3] for run in runs[1:])
+                tokens = size / BYTES_PER_TOKEN
+                agent_ms = (
+                    handler_ms
+                    + calls * args.turn_overhead_ms
+                    + tokens / args.prefill_tokens_per_s * 1000
+                )
+                if mode == "full":
+                    reference = by_status
+                elif by_status != reference:
+                    raise RuntimeError(f"Summary mismatch on {route}")
+                print(
+                    f"{route:>19} | {mode:>7} | {size / 1024:>8.1f} | {tokens:>8.0f} | "
+                    f"{calls:>5} | {handler_ms:>10.1f} | {agent_ms:>9.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
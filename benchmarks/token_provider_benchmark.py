@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark del TokenProvider (OAuth client credentials) de los clientes del gateway.
+
+Sirve tokens con `expires_in` de una hora desde un endpoint local (el stand-in
+HTTP de `private_api_standin.py` con latencia de Cognito) y simula `--hours`
+horas de tool calls: cada `--interval-s` segundos (reloj simulado) `--callers`
+threads piden un token a la vez. Compara:
+    - por llamada: `fetch_token` en cada tool call (lo que hacía
+                   `fetch_access_token`); se mide sobre `--sample` llamadas
+    - provider:    `TokenProvider` compartido; cachea el token, lo renueva en
+                   segundo plano 5 min antes de expirar y agrupa los callers
+                   concurrentes en una sola renovación
+
+Reporta requests al endpoint de tokens (por hora simulada) y la latencia de
+obtener el token.
+
+Uso: python benchmarks/token_provider_benchmark.py [--hours 4] [--callers 8] [--interval-s 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# harness primero: mismo sys.path que el resto de los benchmarks
+import harness
+from private_api_standin import PrivateApiStandIn
+
+sys.path.insert(0, os.path.join(harness.ROOT, "real-tests"))
+
+from token_provider import TokenProvider, fetch_token  # noqa: E402
+
+EXPIRES_IN = 3600
+
+
+def token_endpoint():
+    """Handler del stand-in: un token nuevo por request, válido una hora."""
+    issued = iter(range(1, 1_000_000))
+
+    def handle(method: str, path: str, body: bytes) -> tuple:
+        payload = {
+            "access_token": f"token-{next(issued)}",
+            "expires_in": EXPIRES_IN,
+            "token_type": "Bearer",
+        }
+        return 200, json.dumps(payload).encode("utf-8")
+
+    return handle
+
+
+class SimulatedClock:
+    """Reloj monotónico que avanza el benchmark, no el tiempo real."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        with self._lock:
+            return self.now
+
+    def advance(self, seconds: float) -> None:
+        with self._lock:
+            self.now += seconds
+
+
+def timed(function) -> float:
+    started = time.perf_counter()
+    function()
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--hours", type=float, default=4.0)
+    parser.add_argument("--callers", type=int, default=8)
+    parser.add_argument("--interval-s", type=float, default=10.0)
+    parser.add_argument("--sample", type=int, default=50)
+    parser.add_argument("--token-latency-ms", type=float, default=60.0)
+    args = parser.parse_args()
+
+    ticks = int(args.hours * 3600 / args.interval_s)
+    calls = ticks * args.callers
+    with PrivateApiStandIn(
+        handler=token_endpoint(), request_latency_ms=args.token_latency_ms, tls=False
+    ) as endpoint:
+        token_url = f"{endpoint.base_url}/oauth2/token"
+
+        # Por llamada: un POST por tool call
+        per_call_ms = [
+            timed(lambda: fetch_token("rufus", "secret", token_url))
+            for _ in range(args.sample)
+        ]
+
+        endpoint.reset_counters()
+        clock = SimulatedClock()
+        provider = TokenProvider("rufus", "secret", token_url, clock=clock)
+        tokens, provider_ms = set(), []
+        with ThreadPoolExecutor(max_workers=args.callers) as pool:
+            for _ in range(ticks):
+                results = list(
+                    pool.map(
+                        lambda _: (time.perf_counter(), provider.get_token()),
+                        range(args.callers),
+                    )
+                )
+                finished = time.perf_counter()
+                for started, token in results:
+                    provider_ms.append((finished - started) * 1000)
+                    tokens.add(token)
+                clock.advance(args.interval_s)
+        # La última renovación en segundo plano puede seguir en curso
+        time.sleep(args.token_latency_ms / 1000 * 3)
+        provider_fetches = endpoint.request_count
+
+    print(
+        f"\n{args.hours:g} h simuladas, {args.callers} callers cada "
+        f"{args.interval_s:g} s: {calls} tokens pedidos (expires_in {EXPIRES_IN} s, "
+        f"endpoint {args.token_latency_ms:g} ms)\n"
+    )
+    print(
+        f"{'modo':>11} | {'requests al endpoint':>20} | {'por hora':>8} | "
+        f"{'p50 ms':>7} | {'máx ms':>7}"
+    )
+    print("-" * 66)
+    print(
+        f"{'por llamada':>11} | {calls:>20} | {calls / args.hours:>8.0f} | "
+        f"{statistics.median(per_call_ms):>7.2f} | {max(per_call_ms):>7.2f}"
+    )
+    print(
+        f"{'provider':>11} | {provider_fetches:>20} | "
+        f"{provider_fetches / args.hours:>8.2f} | "
+        f"{statistics.median(provider_ms):>7.2f} | {max(provider_ms):>7.2f}"
+    )
+    print(
+        f"\nPor llamada: medido sobre {args.sample} llamadas (un request por token). "
+        f"Provider: {len(tokens)} tokens distintos entregados."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark antes/después de la capa `shared_runtime` (latencia por invocación).
+
+Compara, sobre el stand-in local de DynamoDB servido por HTTPS:
+    - antes:   el patrón original de los handlers, que crea `boto3.resource`
+               dentro de `handler` en cada invocación (cliente nuevo, pool nuevo,
+               conexión TCP + handshake TLS por request).
+    - después: el handler actual de `lambdas/get_balance`, que reutiliza el
+               cliente module-scope de la capa y su conexión keep-alive.
+
+Uso: python benchmarks/warm_start_benchmark.py [--invocations 200]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from decimal import Decimal
+
+# harness primero: agrega setup/ y la capa shared_runtime al sys.path
+from harness import load_lambda_module, use_standin
+from dynamodb_standin import DynamoDBStandIn
+from populate_balances import USER_ACCOUNTS, generate_balances
+
+import boto3
+from boto3.dynamodb.conditions import Key
+
+
+class LegacyDecimalEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            if obj % 1 == 0:
+                return int(obj)
+            return float(obj)
+        return super().default(obj)
+
+
+def legacy_handler(event, context):
+    """Réplica del handler de get_balance antes de la capa compartida."""
+    table = boto3.resource("dynamodb").Table(os.environ["TABLE_NAME"])
+    username = event["pathParameters"]["username"]
+    response = table.query(KeyConditionExpression=Key("PK").eq(f"USER#{username}"))
+    items = response.get("Items", [])
+    return {
+        "statusCode": 200,
+        "headers": {"Content-Type": "application/json"},
+        "body": json.dumps(
+            {"accounts": items, "username": username, "count": len(items)},
+            cls=LegacyDecimalEncoder,
+        ),
+    }
+
+
+def measure(handler, invocations: int) -> list:
+    usernames = list(USER_ACCOUNTS)
+    timings = []
+    for index in range(invocations):
+        event = {"pathParameters": {"username": usernames[index % len(usernames)]}}
+        started = time.perf_counter()
+        response = handler(event, None)
+        timings.append((time.perf_counter() - started) * 1000)
+        if response["statusCode"] != 200:
+            raise RuntimeError(f"Unexpected response: {response}")
+    return timings
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--invocations", type=int, default=200)
+    parser.add_argument("--request-latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with DynamoDBStandIn(
+        generate_balances(), request_latency_ms=args.request_latency_ms, tls=True
+    ) as standin:
+        use_standin(standin)
+        module = load_lambda_module("get_balance")
+
+        # Primera invocación de cada variante = arranque en frío; se descarta
+        results = {}
+        for name, handler in (("antes", legacy_handler), ("después", module.handler)):
+            measure(handler, 1)
+            standin.reset_counters()
+            results[name] = measure(handler, args.invocations)
+
+    print(f"\nLatencia por invocación en caliente ({args.invocations} invocaciones, HTTPS)\n")
+    print(f"{'variante':>9} | {'p50 ms':>7} | {'p95 ms':>7} | {'media ms':>8}")
+    print("-" * 42)
+    for name, timings in results.items():
+        print(
+            f"{name:>9} | {statistics.median(timings):>7.2f} | "
+            f"{percentile(timings, 95):>7.2f} | {statistics.mean(timings):>8.2f}"
+        )
+    speedup = statistics.median(results["antes"]) / statistics.median(results["después"])
+    print(f"\nMejora p50: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -58,7 +58,7 @@ api_atm_stack = ApiAtmStack(
     config=config,
 )
 
-# AgentCore Gateway adapter Lambdas (proxy to Private APIs from VPC)
+# AgentCore Gateway adapter Lambda (routes every tool to its Private API from VPC)
 adapters_stack = AgentCoreGatewayAdaptersStack(
     app,
     "AgentCoreGatewayAdaptersStack",
@@ -66,6 +66,9 @@ adapters_stack = AgentCoreGatewayAdaptersStack(
     datafonos_api_url=api_datafonos_stack.api_url,
     balance_api_url=api_balance_stack.api_url,
     atm_api_url=api_atm_stack.api_url,
+    datafonos_table=api_datafonos_stack.table,
+    balance_table=api_balance_stack.table,
+    atm_table=api_atm_stack.table,
     config=config,
 )
 
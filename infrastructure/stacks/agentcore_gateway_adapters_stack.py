@@ -2,19 +2,26 @@ import os
 
 import aws_cdk as cdk
 from aws_cdk import (
+    aws_dynamodb as dynamodb,
     aws_ec2 as ec2,
     aws_iam as iam,
     aws_lambda as _lambda,
+    custom_resources as cr,
 )
 from constructs import Construct
 
+from infrastructure.stacks.api_datafonos_stack import STATUS_INDEX_NAME
+
 
 class AgentCoreGatewayAdaptersStack(cdk.Stack):
-    """CDK Stack for Lambda adapter functions that proxy requests from
+    """CDK Stack for the Lambda adapter that proxies requests from
     AgentCore Gateway to Private API Gateways inside the VPC.
 
-    These Lambdas run in the VPC private subnets so they can reach
-    the Private APIs via the execute-api VPC Endpoint.
+    A single router Lambda serves every tool (dispatching on the gateway tool
+    name), so one warm container handles the whole conversation. It runs in the
+    VPC private subnets so it can reach the Private APIs via the execute-api
+    VPC Endpoint. Tools listed in `adapter_direct_dynamodb_tools` skip the
+    Private API and read their DynamoDB table through the gateway endpoint.
     """
 
     def __init__(
@@ -25,6 +32,9 @@ class AgentCoreGatewayAdaptersStack(cdk.Stack):
         datafonos_api_url: str,
         balance_api_url: str,
         atm_api_url: str,
+        datafonos_table: dynamodb.ITable,
+        balance_table: dynamodb.ITable,
+        atm_table: dynamodb.ITable,
         config: dict,
         **kwargs,
     ) -> None:
@@ -32,8 +42,32 @@ class AgentCoreGatewayAdaptersStack(cdk.Stack):
 
         prefix = config["resources_name"]
         env_suffix = config["deployment_environment"]
+        http_idle_timeout_cfg = config["adapter_http_idle_timeout_seconds"]
+        cache_health_ttl_cfg = config["adapter_cache_health_ttl_seconds"]
+        cache_balance_ttl_cfg = config["adapter_cache_balance_ttl_seconds"]
+        cache_max_entries_cfg = config["adapter_cache_max_entries"]
+        min_request_timeout_cfg = config["adapter_min_request_timeout_seconds"]
+        breaker_threshold_cfg = config["adapter_breaker_failure_threshold"]
+        breaker_cooldown_cfg = config["adapter_breaker_cooldown_seconds"]
+        direct_tools_cfg = config["adapter_direct_dynamodb_tools"]
+        response_passthrough_cfg = config["adapter_response_passthrough"]
+        phase_metrics_cfg = config["adapter_phase_metrics"]
+
+        # Tools whose Private API call is a single-key Query the router can run
+        # itself (DIRECT_QUERIES in lambdas/adapter_router/direct_dynamodb.py)
+        direct_tables = {
+            "listDatafonosByCity": datafonos_table,
+            "listAtmsByCity": atm_table,
+            "getBalanceByUsername": balance_table,
+        }
+        unsupported = set(direct_tools_cfg) - set(direct_tables)
+        if unsupported:
+            raise ValueError(
+                "adapter_direct_dynamodb_tools only supports "
+                f"{', '.join(direct_tables)}; got {', '.join(sorted(unsupported))}"
+            )
 
-        # Security group for adapter Lambdas - needs HTTPS outbound to VPC
+        # Security group for the adapter Lambda - needs HTTPS outbound to VPC
         adapter_sg = ec2.SecurityGroup(
             self,
             "AdapterSecurityGroup",
@@ -50,45 +84,97 @@ class AgentCoreGatewayAdaptersStack(cdk.Stack):
             description="Allow HTTPS to VPC for Private API access",
         )
 
-        # ── Datafonos Adapter Lambda ──
-        self.datafonos_adapter = _lambda.Function(
+        # Direct reads reach DynamoDB through the gateway endpoint, whose IPs are
+        # outside the VPC CIDR. Egress is limited to the regional DynamoDB prefix
+        # list, so the other gateway endpoints (S3) stay closed to the adapter.
+        # The stacks are environment-agnostic, so the prefix list id is resolved
+        # at deploy time (PrefixList.from_lookup needs an explicit account/region).
+        if direct_tools_cfg:
+            dynamodb_prefix_list_name = f"com.amazonaws.{self.region}.dynamodb"
+            dynamodb_prefix_list = cr.AwsCustomResource(
+                self,
+                "DynamoDbPrefixListLookup",
+                on_update=cr.AwsSdkCall(
+                    service="EC2",
+                    action="describeManagedPrefixLists",
+                    parameters={
+                        "Filters": [
+                            {
+                                "Name": "prefix-list-name",
+                                "Values": [dynamodb_prefix_list_name],
+                            }
+                        ]
+                    },
+                    physical_resource_id=cr.PhysicalResourceId.of(
+                        dynamodb_prefix_list_name
+                    ),
+                    output_paths=["PrefixLists.0.PrefixListId"],
+                ),
+                policy=cr.AwsCustomResourcePolicy.from_sdk_calls(
+                    resources=cr.AwsCustomResourcePolicy.ANY_RESOURCE
+                ),
+            )
+            adapter_sg.add_egress_rule(
+                peer=ec2.Peer.prefix_list(
+                    dynamodb_prefix_list.get_response_field(
+                        "PrefixLists.0.PrefixListId"
+                    )
+                ),
+                connection=ec2.Port.tcp(443),
+                description="Allow HTTPS to the DynamoDB gateway endpoint",
+            )
+
+        # Shared runtime layer (keep-alive connection pool to the Private APIs)
+        shared_runtime_layer = _lambda.LayerVersion(
             self,
-            "DatafonosAdapterFunction",
-            function_name=f"{prefix}-adapter-datafonos-{env_suffix}",
-            runtime=_lambda.Runtime.PYTHON_3_12,
-            handler="index.handler",
+            "SharedRuntimeLayer",
             code=_lambda.Code.from_asset(
                 os.path.join(
                     os.path.dirname(__file__),
                     "..",
                     "..",
                     "lambdas",
-                    "adapter_datafonos",
+                    "layers",
+                    "shared_runtime",
                 )
             ),
-            environment={"API_BASE_URL": datafonos_api_url},
-            vpc=vpc,
-            vpc_subnets=ec2.SubnetSelection(
-                subnet_type=ec2.SubnetType.PRIVATE_ISOLATED,
-            ),
-            security_groups=[adapter_sg],
-            timeout=cdk.Duration.seconds(30),
-            memory_size=256,
+            compatible_runtimes=[_lambda.Runtime.PYTHON_3_12],
+            description="Shared warm-start runtime for the adapter Lambda",
         )
 
-        # ── Balance Adapter Lambda ──
-        self.balance_adapter = _lambda.Function(
+        # ── Router Adapter Lambda (single target for every tool) ──
+        self.router_adapter = _lambda.Function(
             self,
-            "BalanceAdapterFunction",
-            function_name=f"{prefix}-adapter-balance-{env_suffix}",
+            "RouterAdapterFunction",
+            function_name=f"{prefix}-adapter-router-{env_suffix}",
             runtime=_lambda.Runtime.PYTHON_3_12,
             handler="index.handler",
             code=_lambda.Code.from_asset(
                 os.path.join(
-                    os.path.dirname(__file__), "..", "..", "lambdas", "adapter_balance"
+                    os.path.dirname(__file__), "..", "..", "lambdas", "adapter_router"
                 )
             ),
-            environment={"API_BASE_URL": balance_api_url},
+            environment={
+                "DATAFONOS_API_URL": datafonos_api_url,
+                "BALANCE_API_URL": balance_api_url,
+                "ATM_API_URL": atm_api_url,
+                "HTTP_IDLE_TIMEOUT_SECONDS": str(http_idle_timeout_cfg),
+                "HEALTH_CACHE_TTL_SECONDS": str(cache_health_ttl_cfg),
+                "BALANCE_CACHE_TTL_SECONDS": str(cache_balance_ttl_cfg),
+                "RESPONSE_CACHE_MAX_ENTRIES": str(cache_max_entries_cfg),
+                "MIN_REQUEST_TIMEOUT_SECONDS": str(min_request_timeout_cfg),
+                "BREAKER_FAILURE_THRESHOLD": str(breaker_threshold_cfg),
+                "BREAKER_COOLDOWN_SECONDS": str(breaker_cooldown_cfg),
+                "DIRECT_DYNAMODB_TOOLS": ",".join(direct_tools_cfg),
+                "RESPONSE_PASSTHROUGH": str(response_passthrough_cfg).lower(),
+                "PHASE_METRICS": str(phase_metrics_cfg).lower(),
+                "METRICS_NAMESPACE": f"{prefix}/adapter-{env_suffix}",
+                "DATAFONOS_TABLE_NAME": datafonos_table.table_name,
+                "BALANCE_TABLE_NAME": balance_table.table_name,
+                "ATM_TABLE_NAME": atm_table.table_name,
+                "STATUS_INDEX_NAME": STATUS_INDEX_NAME,
+            },
+            layers=[shared_runtime_layer],
             vpc=vpc,
             vpc_subnets=ec2.SubnetSelection(
                 subnet_type=ec2.SubnetType.PRIVATE_ISOLATED,
@@ -98,44 +184,14 @@ class AgentCoreGatewayAdaptersStack(cdk.Stack):
             memory_size=256,
         )
 
-        # ── ATM Adapter Lambda ──
-        self.atm_adapter = _lambda.Function(
-            self,
-            "AtmAdapterFunction",
-            function_name=f"{prefix}-adapter-atm-{env_suffix}",
-            runtime=_lambda.Runtime.PYTHON_3_12,
-            handler="index.handler",
-            code=_lambda.Code.from_asset(
-                os.path.join(
-                    os.path.dirname(__file__), "..", "..", "lambdas", "adapter_atm"
-                )
-            ),
-            environment={"API_BASE_URL": atm_api_url},
-            vpc=vpc,
-            vpc_subnets=ec2.SubnetSelection(
-                subnet_type=ec2.SubnetType.PRIVATE_ISOLATED,
-            ),
-            security_groups=[adapter_sg],
-            timeout=cdk.Duration.seconds(30),
-            memory_size=256,
-        )
+        # Read access only for the tables of the tools served directly
+        for tool in direct_tools_cfg:
+            direct_tables[tool].grant_read_data(self.router_adapter)
 
-        # ── CfnOutputs for Lambda ARNs (useful for AgentCore Gateway config) ──
-        cdk.CfnOutput(
-            self,
-            "DatafonosAdapterArn",
-            value=self.datafonos_adapter.function_arn,
-            description="ARN of the Datafonos adapter Lambda",
-        )
-        cdk.CfnOutput(
-            self,
-            "BalanceAdapterArn",
-            value=self.balance_adapter.function_arn,
-            description="ARN of the Balance adapter Lambda",
-        )
+        # ── CfnOutput for the Lambda ARN (useful for AgentCore Gateway config) ──
         cdk.CfnOutput(
             self,
-            "AtmAdapterArn",
-            value=self.atm_adapter.function_arn,
-            description="ARN of the ATM adapter Lambda",
+            "RouterAdapterArn",
+            value=self.router_adapter.function_arn,
+            description="ARN of the router adapter Lambda (target for every tool)",
         )
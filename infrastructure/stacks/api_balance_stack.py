@@ -29,6 +29,7 @@ class ApiBalanceStack(cdk.Stack):
         table_name_cfg = config["balance_table_name"]
         lambda_name_cfg = config["balance_lambda_name"]
         api_name_cfg = config["balance_api_name"]
+        fast_deserialize_cfg = config["balance_fast_deserialize"]
 
         # DynamoDB table with Single Table Design (PK + SK)
         table = dynamodb.Table(
@@ -43,6 +44,24 @@ class ApiBalanceStack(cdk.Stack):
             removal_policy=cdk.RemovalPolicy.DESTROY,
         )
 
+        # Shared warm-start runtime layer (module-scope clients, serializer, pagination)
+        shared_runtime_layer = _lambda.LayerVersion(
+            self,
+            "SharedRuntimeLayer",
+            code=_lambda.Code.from_asset(
+                os.path.join(
+                    os.path.dirname(__file__),
+                    "..",
+                    "..",
+                    "lambdas",
+                    "layers",
+                    "shared_runtime",
+                )
+            ),
+            compatible_runtimes=[_lambda.Runtime.PYTHON_3_12],
+            description="Shared warm-start runtime for the data Lambdas",
+        )
+
         # Lambda function for get balance API
         balance_lambda = _lambda.Function(
             self,
@@ -55,7 +74,11 @@ class ApiBalanceStack(cdk.Stack):
                     os.path.dirname(__file__), "..", "..", "lambdas", "get_balance"
                 )
             ),
-            environment={"TABLE_NAME": table.table_name},
+            environment={
+                "TABLE_NAME": table.table_name,
+                "FAST_DESERIALIZE": str(fast_deserialize_cfg).lower(),
+            },
+            layers=[shared_runtime_layer],
         )
 
         # Grant Lambda read access to the DynamoDB table
@@ -103,8 +126,9 @@ class ApiBalanceStack(cdk.Stack):
             source_arn=api.arn_for_execute_api(),
         )
 
-        # Expose table name for setup scripts
+        # Expose table name for setup scripts and the table for direct adapter reads
         self.table_name = table.table_name
+        self.table = table
 
         # Expose API URL for adapter Lambdas
         self.api_url = api.url
@@ -11,6 +11,12 @@ from aws_cdk import (
 )
 from constructs import Construct
 
+# GSI keyed on city + status, queried by the handler when ?status= is present
+STATUS_INDEX_NAME = "CityStatusIndex"
+
+# GSI keyed on geohash cell + full geohash, queried by GET /datafonos/near
+GEO_INDEX_NAME = "GeoIndex"
+
 
 class ApiDatafonosStack(cdk.Stack):
     def __init__(
@@ -29,6 +35,13 @@ class ApiDatafonosStack(cdk.Stack):
         table_name_cfg = config["datafonos_table_name"]
         lambda_name_cfg = config["datafonos_lambda_name"]
         api_name_cfg = config["datafonos_api_name"]
+        scan_segments_cfg = config["datafonos_scan_segments"]
+        fast_deserialize_cfg = config["datafonos_fast_deserialize"]
+        cache_ttl_cfg = config["health_cache_ttl_seconds"]
+        cache_stale_cfg = config["health_cache_stale_seconds"]
+        cache_max_entries_cfg = config["health_cache_max_entries"]
+        compression_min_bytes_cfg = config["health_compression_min_bytes"]
+        lambda_timeout_cfg = config["health_lambda_timeout_seconds"]
 
         # DynamoDB table with Single Table Design (PK + SK)
         table = dynamodb.Table(
@@ -43,6 +56,48 @@ class ApiDatafonosStack(cdk.Stack):
             removal_policy=cdk.RemovalPolicy.DESTROY,
         )
 
+        # GSI for status-filtered city queries (GET /{city}?status=)
+        table.add_global_secondary_index(
+            index_name=STATUS_INDEX_NAME,
+            partition_key=dynamodb.Attribute(
+                name="city", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="status", type=dynamodb.AttributeType.STRING
+            ),
+            projection_type=dynamodb.ProjectionType.ALL,
+        )
+
+        # GSI for proximity search: 5-char geohash cell + full geohash (shared_runtime.geohash)
+        table.add_global_secondary_index(
+            index_name=GEO_INDEX_NAME,
+            partition_key=dynamodb.Attribute(
+                name="geo_cell", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="geohash", type=dynamodb.AttributeType.STRING
+            ),
+            projection_type=dynamodb.ProjectionType.ALL,
+        )
+
+        # Shared warm-start runtime layer (module-scope clients, serializer, pagination)
+        shared_runtime_layer = _lambda.LayerVersion(
+            self,
+            "SharedRuntimeLayer",
+            code=_lambda.Code.from_asset(
+                os.path.join(
+                    os.path.dirname(__file__),
+                    "..",
+                    "..",
+                    "lambdas",
+                    "layers",
+                    "shared_runtime",
+                )
+            ),
+            compatible_runtimes=[_lambda.Runtime.PYTHON_3_12],
+            description="Shared warm-start runtime for the data Lambdas",
+        )
+
         # Lambda function for datafonos health API
         datafonos_lambda = _lambda.Function(
             self,
@@ -50,12 +105,26 @@ class ApiDatafonosStack(cdk.Stack):
             function_name=f"{prefix}-{lambda_name_cfg}-{env_suffix}",
             runtime=_lambda.Runtime.PYTHON_3_12,
             handler="index.handler",
+            # mode=summary scans the whole table; the 3 s default does not cover
+            # a single DynamoDB call retried (3 x (2 s connect + 5 s read))
+            timeout=cdk.Duration.seconds(lambda_timeout_cfg),
             code=_lambda.Code.from_asset(
                 os.path.join(
                     os.path.dirname(__file__), "..", "..", "lambdas", "datafonos_health"
                 )
             ),
-            environment={"TABLE_NAME": table.table_name},
+            environment={
+                "TABLE_NAME": table.table_name,
+                "SCAN_SEGMENTS": str(scan_segments_cfg),
+                "FAST_DESERIALIZE": str(fast_deserialize_cfg).lower(),
+                "STATUS_INDEX_NAME": STATUS_INDEX_NAME,
+                "GEO_INDEX_NAME": GEO_INDEX_NAME,
+                "CITY_CACHE_TTL_SECONDS": str(cache_ttl_cfg),
+                "CITY_CACHE_STALE_SECONDS": str(cache_stale_cfg),
+                "CITY_CACHE_MAX_ENTRIES": str(cache_max_entries_cfg),
+                "COMPRESSION_MIN_BYTES": str(compression_min_bytes_cfg),
+            },
+            layers=[shared_runtime_layer],
         )
 
         # Grant Lambda read access to the DynamoDB table
@@ -103,8 +172,9 @@ class ApiDatafonosStack(cdk.Stack):
             source_arn=api.arn_for_execute_api(),
         )
 
-        # Expose table name for setup scripts
+        # Expose table name for setup scripts and the table for direct adapter reads
         self.table_name = table.table_name
+        self.table = table
 
         # Expose API URL for adapter Lambdas
         self.api_url = api.url
@@ -23,6 +23,7 @@ class ApiInvestmentsStack(cdk.Stack):
 
         prefix = config["resources_name"]
         env_suffix = config["deployment_environment"]
+        fast_deserialize_cfg = config["investments_fast_deserialize"]
 
         # DynamoDB table
         table = dynamodb.Table(
@@ -37,6 +38,24 @@ class ApiInvestmentsStack(cdk.Stack):
             removal_policy=cdk.RemovalPolicy.DESTROY,
         )
 
+        # Shared warm-start runtime layer (module-scope clients, serializer, pagination)
+        shared_runtime_layer = _lambda.LayerVersion(
+            self,
+            "SharedRuntimeLayer",
+            code=_lambda.Code.from_asset(
+                os.path.join(
+                    os.path.dirname(__file__),
+                    "..",
+                    "..",
+                    "lambdas",
+                    "layers",
+                    "shared_runtime",
+                )
+            ),
+            compatible_runtimes=[_lambda.Runtime.PYTHON_3_12],
+            description="Shared warm-start runtime for the data Lambdas",
+        )
+
         # Lambda function
         investments_lambda = _lambda.Function(
             self,
@@ -53,7 +72,11 @@ class ApiInvestmentsStack(cdk.Stack):
                     "investment_products",
                 )
             ),
-            environment={"TABLE_NAME": table.table_name},
+            environment={
+                "TABLE_NAME": table.table_name,
+                "FAST_DESERIALIZE": str(fast_deserialize_cfg).lower(),
+            },
+            layers=[shared_runtime_layer],
         )
 
         table.grant_read_data(investments_lambda)
@@ -0,0 +1,204 @@
+"""
+Direct DynamoDB reads for the tools whose Private API call is a single-key Query.
+
+For the tools listed in DIRECT_DYNAMODB_TOOLS the router skips the VPC endpoint,
+API Gateway and the data Lambda, and queries the table itself through the
+DynamoDB gateway endpoint. Each query mirrors its data Lambda route (same
+validation, key condition, projection and body), so the tool result has the same
+shape in both modes.
+"""
+
+import json
+import os
+
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import BotoCoreError, ClientError
+from shared_runtime.clients import get_table
+from shared_runtime.projection import parse_fields, projection_kwargs
+from shared_runtime.responses import parse_format, to_columnar
+from shared_runtime.summary import parse_mode, parse_stale_limit, summarize
+
+TABLE_NAMES = {
+    "datafonos": os.environ.get("DATAFONOS_TABLE_NAME", ""),
+    "balance": os.environ.get("BALANCE_TABLE_NAME", ""),
+    "atm": os.environ.get("ATM_TABLE_NAME", ""),
+}
+
+# GSI keyed on city + status of the device tables; without it status is a filter
+STATUS_INDEX_NAME = os.environ.get("STATUS_INDEX_NAME")
+
+# Same ?fields= allow-lists, statuses and summary attributes as the data Lambdas
+# (lambdas/datafonos_health, lambdas/atm_machines_health, lambdas/get_balance)
+DEVICE_ROUTES = {
+    "listDatafonosByCity": {
+        "api": "datafonos",
+        "items_key": "datafonos",
+        "label": "datafonos",
+        "fields": (
+            "device_id",
+            "merchant_name",
+            "address",
+            "latitude",
+            "longitude",
+            "status",
+            "last_transaction",
+            "city",
+        ),
+        "statuses": ("active", "inactive", "maintenance"),
+        "summary_fields": (
+            "device_id",
+            "merchant_name",
+            "address",
+            "status",
+            "city",
+            "last_transaction",
+        ),
+        "stale_field": "last_transaction",
+    },
+    "listAtmsByCity": {
+        "api": "atm",
+        "items_key": "atms",
+        "label": "ATMs",
+        "fields": (
+            "atm_id",
+            "address",
+            "latitude",
+            "longitude",
+            "status",
+            "cash_level",
+            "last_service",
+            "city",
+        ),
+        "statuses": ("online", "offline", "low_cash", "maintenance"),
+        "summary_fields": (
+            "atm_id",
+            "address",
+            "status",
+            "cash_level",
+            "city",
+            "last_service",
+        ),
+        "stale_field": "last_service",
+    },
+}
+
+BALANCE_FIELDS = ("username", "account_type", "balance", "currency", "last_updated")
+
+
+class DirectQueryError(Exception):
+    """A request the data Lambda would have answered with a 4xx status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class DynamoDBError(Exception):
+    """The query itself failed (throttling, network, permissions)."""
+
+
+def _table(api):
+    # FastTable: int/float numbers, so the body serializes without DecimalEncoder
+    return get_table(TABLE_NAMES[api], fast=True)
+
+
+def _projection(value, allowed):
+    try:
+        return projection_kwargs(parse_fields(value, allowed))
+    except ValueError as e:
+        raise DirectQueryError(400, str(e))
+
+
+def _parse_format(value):
+    try:
+        return parse_format(value)
+    except ValueError as e:
+        raise DirectQueryError(400, str(e))
+
+
+def _shape(body, response_format):
+    return to_columnar(body) if response_format == "columnar" else body
+
+
+def list_devices_by_city(tool_name, event):
+    """GET /datafonos/{city} or /atms/{city}, with ?status=, ?mode= and ?format=."""
+    route = DEVICE_ROUTES[tool_name]
+    city = event["city"]
+    projection = _projection(event.get("fields"), route["fields"])
+    try:
+        mode = parse_mode(event.get("mode"))
+        stale_limit = parse_stale_limit(event.get("stale_limit"))
+        response_format = parse_format(event.get("format"))
+    except ValueError as e:
+        raise DirectQueryError(400, str(e))
+    if mode == "summary":
+        projection = projection_kwargs(route["summary_fields"])
+
+    status = event.get("status")
+    if status and status not in route["statuses"]:
+        raise DirectQueryError(
+            400, f"Invalid status: {status}. Allowed: {', '.join(route['statuses'])}"
+        )
+
+    if status and STATUS_INDEX_NAME:
+        query_kwargs = {
+            "IndexName": STATUS_INDEX_NAME,
+            "KeyConditionExpression": Key("city").eq(city) & Key("status").eq(status),
+        }
+    elif status:
+        query_kwargs = {
+            "KeyConditionExpression": Key("PK").eq(f"CITY#{city}"),
+            "FilterExpression": Attr("status").eq(status),
+        }
+    else:
+        query_kwargs = {"KeyConditionExpression": Key("PK").eq(f"CITY#{city}")}
+
+    items = _table(route["api"]).query(**query_kwargs, **projection).get("Items", [])
+
+    # A status with no matching devices is an empty result, not a missing city
+    if not items and not status:
+        raise DirectQueryError(404, f"No {route['label']} found for city: {city}")
+
+    if mode == "summary":
+        body = summarize(items, route["stale_field"], stale_limit)
+    else:
+        body = {route["items_key"]: items, "count": len(items)}
+    return _shape(body, response_format)
+
+
+def get_balance_by_username(tool_name, event):
+    """GET /balance/{username}."""
+    username = event["username"]
+    projection = _projection(event.get("fields"), BALANCE_FIELDS)
+    response_format = _parse_format(event.get("format"))
+    items = (
+        _table("balance")
+        .query(KeyConditionExpression=Key("PK").eq(f"USER#{username}"), **projection)
+        .get("Items", [])
+    )
+    if not items:
+        raise DirectQueryError(404, f"No accounts found for user: {username}")
+    body = {"accounts": items, "username": username, "count": len(items)}
+    return _shape(body, response_format)
+
+
+# Tools that can be served directly; the others always go through their Private API
+DIRECT_QUERIES = {
+    "listDatafonosByCity": list_devices_by_city,
+    "listAtmsByCity": list_devices_by_city,
+    "getBalanceByUsername": get_balance_by_username,
+}
+
+
+def query(tool_name, event):
+    """Run the tool's query and return the JSON body bytes, as the Private API would.
+
+    Raises DirectQueryError for the requests the data Lambda rejects with a 4xx
+    and DynamoDBError when the query fails.
+    """
+    try:
+        body = DIRECT_QUERIES[tool_name](tool_name, event)
+    except (BotoCoreError, ClientError) as e:
+        raise DynamoDBError(str(e)) from e
+    return json.dumps(body).encode("utf-8")
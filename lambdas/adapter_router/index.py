@@ -0,0 +1,604 @@
+"""
+Lambda Adapter that routes every AgentCore Gateway tool to its Private API.
+A single function serves the Datafonos, ATM and Balance tools, so one warm
+container (and its keep-alive connections) is shared by the whole conversation.
+Successful responses are cached per tool TTL, so repeated calls for hot keys
+skip the Private API hop entirely. The batchInvoke tool fans several tool calls
+out concurrently within one invocation. Each request's timeout is derived from
+the invocation's remaining time and the upstream's usual latency, and a circuit
+breaker per Private API fails fast while that API keeps failing. Tools listed in
+DIRECT_DYNAMODB_TOOLS skip the Private API and query their table directly. With
+RESPONSE_PASSTHROUGH the upstream body is returned as bytes, never parsed. With
+PHASE_METRICS every tool call logs its per-phase latency as an EMF record.
+"""
+
+import json
+import os
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlencode
+from http.client import HTTPException
+
+from shared_runtime import metrics
+from shared_runtime.cache import TTLCache
+from shared_runtime.http_pool import pool
+from shared_runtime.resilience import CircuitBreaker, Deadline, LatencyEstimator
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+API_BASE_URLS = {
+    "datafonos": os.environ.get("DATAFONOS_API_URL", ""),
+    "balance": os.environ.get("BALANCE_API_URL", ""),
+    "atm": os.environ.get("ATM_API_URL", ""),
+}
+
+# AgentCore Gateway sends the tool name as "<target name>___<tool name>"
+TOOL_NAME_DELIMITER = "___"
+
+# Per-tool cache lifetimes: device health changes slowly, balances must be fresh
+HEALTH_CACHE_TTL_SECONDS = float(os.environ.get("HEALTH_CACHE_TTL_SECONDS", "60"))
+BALANCE_CACHE_TTL_SECONDS = float(os.environ.get("BALANCE_CACHE_TTL_SECONDS", "0"))
+
+# Entries hold the raw response bytes (parsed on every hit), which keeps a full
+# 1000-device listing page at a few hundred KB
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", "128"))
+
+# Request budget: never below the floor (a data Lambda cold start), never past
+# the invocation deadline; without a Lambda context the deadline is this default
+MIN_REQUEST_TIMEOUT_SECONDS = float(os.environ.get("MIN_REQUEST_TIMEOUT_SECONDS", "3"))
+DEFAULT_DEADLINE_MS = 30000
+
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_COOLDOWN_SECONDS = float(os.environ.get("BREAKER_COOLDOWN_SECONDS", "30"))
+
+# Tools served by querying their DynamoDB table directly (see direct_dynamodb.py)
+DIRECT_DYNAMODB_TOOLS = frozenset(
+    name for name in os.environ.get("DIRECT_DYNAMODB_TOOLS", "").split(",") if name
+)
+
+# Return single tool results as the upstream JSON bytes with `_meta` spliced in:
+# the Python runtime posts a bytes result verbatim instead of re-encoding a dict
+RESPONSE_PASSTHROUGH = os.environ.get("RESPONSE_PASSTHROUGH", "false").lower() == "true"
+
+# One EMF record per tool call (Tool and Tool + City dimensions)
+PHASE_METRICS = os.environ.get("PHASE_METRICS", "false").lower() == "true"
+METRICS_NAMESPACE = os.environ.get("METRICS_NAMESPACE", "AgentCorePrivateApis/Adapter")
+
+# Recorded timing -> EMF metric name. DNS, TCP and TLS are only published for
+# calls that opened a new connection, so their percentiles are per handshake.
+PHASE_METRIC_NAMES = {
+    "dns_ms": "DnsMs",
+    "tcp_ms": "TcpConnectMs",
+    "tls_ms": "TlsHandshakeMs",
+    "send_ms": "SendMs",
+    "wait_ms": "TimeToFirstByteMs",
+    "read_ms": "BodyReadMs",
+    "decompress_ms": "DecompressMs",
+    "total_ms": "UpstreamMs",
+    "query_ms": "DynamoDBQueryMs",
+    "parse_ms": "ParseMs",
+}
+HANDSHAKE_PHASES = ("dns_ms", "tcp_ms", "tls_ms")
+
+# batchInvoke runs up to MAX_BATCH_CALLS tool calls, BATCH_MAX_WORKERS at a time
+BATCH_TOOL_NAME = "batchInvoke"
+MAX_BATCH_CALLS = 10
+BATCH_MAX_WORKERS = 8
+
+# Cache status for lookups that never reach the cache
+BYPASS = "BYPASS"
+DISABLED = "DISABLED"
+
+# Tool name -> private API, method, path template, forwarded parameters and
+# cache TTL. Path placeholders come from the tool input; GET params go in the
+# query string and POST params in the JSON body.
+ROUTES = {
+    "listDatafonos": {
+        "api": "datafonos",
+        "method": "GET",
+        "path": "/datafonos",
+        "params": ("limit", "next_token", "fields", "mode", "stale_limit", "format"),
+        "cache_ttl": HEALTH_CACHE_TTL_SECONDS,
+    },
+    "listDatafonosByCity": {
+        "api": "datafonos",
+        "method": "GET",
+        "path": "/datafonos/{city}",
+        "params": ("status", "fields", "mode", "stale_limit", "format"),
+        "cache_ttl": HEALTH_CACHE_TTL_SECONDS,
+    },
+    "findNearestDatafonos": {
+        "api": "datafonos",
+        "method": "GET",
+        "path": "/datafonos/near",
+        "params": ("lat", "lon", "radius_m", "status", "limit", "fields", "format"),
+        "cache_ttl": HEALTH_CACHE_TTL_SECONDS,
+    },
+    "listAtms": {
+        "api": "atm",
+        "method": "GET",
+        "path": "/atms",
+        "params": ("limit", "next_token", "fields", "mode", "stale_limit", "format"),
+        "cache_ttl": HEALTH_CACHE_TTL_SECONDS,
+    },
+    "listAtmsByCity": {
+        "api": "atm",
+        "method": "GET",
+        "path": "/atms/{city}",
+        "params": ("status", "fields", "mode", "stale_limit", "format"),
+        "cache_ttl": HEALTH_CACHE_TTL_SECONDS,
+    },
+    "findNearestAtms": {
+        "api": "atm",
+        "method": "GET",
+        "path": "/atms/near",
+        "params": ("lat", "lon", "radius_m", "status", "limit", "fields", "format"),
+        "cache_ttl": HEALTH_CACHE_TTL_SECONDS,
+    },
+    "getBalanceByUsername": {
+        "api": "balance",
+        "method": "GET",
+        "path": "/balance/{username}",
+        "params": ("fields", "format"),
+        "cache_ttl": BALANCE_CACHE_TTL_SECONDS,
+    },
+    "getBalances": {
+        "api": "balance",
+        "method": "POST",
+        "path": "/balance:batch",
+        "params": ("usernames", "fields"),
+        "cache_ttl": BALANCE_CACHE_TTL_SECONDS,
+    },
+}
+
+# Path parameters of each route, e.g. ("city",) for "/atms/{city}"
+PATH_PARAMS = {
+    name: tuple(
+        segment[1:-1] for segment in route["path"].split("/") if segment.startswith("{")
+    )
+    for name, route in ROUTES.items()
+}
+
+
+# Shared by every tool; keys start with the route's API so it can be invalidated
+response_cache = TTLCache(
+    max_entries=RESPONSE_CACHE_MAX_ENTRIES, ttl=HEALTH_CACHE_TTL_SECONDS
+)
+
+
+# Per Private API: rolling latency estimate and circuit breaker
+latency_estimators = {api: LatencyEstimator() for api in API_BASE_URLS}
+circuit_breakers = {
+    api: CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN_SECONDS)
+    for api in API_BASE_URLS
+}
+
+
+# boto3 is only imported (init phase) when some tool reads DynamoDB directly
+if DIRECT_DYNAMODB_TOOLS:
+    import direct_dynamodb
+
+    unsupported = DIRECT_DYNAMODB_TOOLS - set(direct_dynamodb.DIRECT_QUERIES)
+    if unsupported:
+        raise ValueError(
+            f"No direct DynamoDB query for: {', '.join(sorted(unsupported))}"
+        )
+
+
+class PrivateApiError(Exception):
+    """A failed Private API call; `payload` is returned to the gateway as-is.
+
+    Raised from the cache loader so failures are never cached. `timings` holds the
+    pool's per-phase timings when the API did respond.
+    """
+
+    def __init__(self, payload, timings=None):
+        super().__init__(payload["error"])
+        self.payload = payload
+        self.timings = timings or {}
+
+
+def get_tool_name(context):
+    """Return the invoked tool name without the gateway target prefix."""
+    client_context = getattr(context, "client_context", None)
+    custom = getattr(client_context, "custom", None) or {}
+    tool_name = custom.get("bedrockAgentCoreToolName", "")
+    return tool_name.split(TOOL_NAME_DELIMITER, 1)[-1]
+
+
+def build_request(tool_name, event):
+    """Map a tool call to (method, url, body). Raises ValueError on bad input."""
+    route = ROUTES.get(tool_name)
+    if route is None:
+        raise ValueError(f"Unknown tool: {tool_name or '(missing)'}")
+
+    path_values = {}
+    for name in PATH_PARAMS[tool_name]:
+        if not event.get(name):
+            raise ValueError(f"Missing required parameter: {name}")
+        path_values[name] = quote(str(event[name]), safe="")
+
+    url = API_BASE_URLS[route["api"]] + route["path"].format(**path_values)
+    params = {key: event[key] for key in route["params"] if event.get(key) is not None}
+
+    if route["method"] == "POST":
+        return "POST", url, json.dumps(params).encode("utf-8")
+    if params:
+        url = f"{url}?{urlencode(params)}"
+    return "GET", url, None
+
+
+def _elapsed_ms(started):
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def call_private_api(api, method, url, body, deadline):
+    """Send one request through the keep-alive pool; returns (raw body, timings).
+
+    Raises PrivateApiError with a `code`: DEADLINE_EXCEEDED, CIRCUIT_OPEN,
+    TIMEOUT, UNREACHABLE or UPSTREAM_ERROR. Timeouts, connection errors and 5xx
+    responses count as failures for the API's circuit breaker.
+    """
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise PrivateApiError(
+            {
+                "error": f"No time left to call the {api} Private API",
+                "code": "DEADLINE_EXCEEDED",
+            }
+        )
+
+    breaker = circuit_breakers[api]
+    if not breaker.allow():
+        logger.warning("Circuit open for %s, failing fast", api)
+        raise PrivateApiError(
+            {
+                "error": f"Private API {api} is unavailable (circuit open)",
+                "code": "CIRCUIT_OPEN",
+                "retry_after_s": round(breaker.retry_after(), 1),
+            }
+        )
+
+    estimator = latency_estimators[api]
+    timeout = estimator.timeout(MIN_REQUEST_TIMEOUT_SECONDS, remaining)
+
+    try:
+        logger.info("Proxying %s request to: %s (timeout %.2fs)", method, url, timeout)
+
+        response = pool.request(
+            method,
+            url,
+            body=body,
+            headers={"Content-Type": "application/json"},
+            timeout=timeout,
+        )
+        # Per-phase timings: connect_ms is 0 when a warm connection was reused
+        logger.info(
+            "Private API responded with status: %s, timings: %s",
+            response.status,
+            json.dumps(response.timings),
+        )
+
+    except TimeoutError:
+        breaker.record_failure()
+        estimator.observe(timeout * 1000)
+        logger.error("Private API %s timed out after %.2fs", api, timeout)
+        raise PrivateApiError(
+            {
+                "error": f"Private API {api} timed out",
+                "code": "TIMEOUT",
+                "timeout_s": round(timeout, 2),
+            }
+        )
+
+    except (HTTPException, OSError) as e:
+        breaker.record_failure()
+        logger.error("Connection error to Private API: %s", str(e))
+        raise PrivateApiError(
+            {
+                "error": "Cannot reach Private API",
+                "code": "UNREACHABLE",
+                "details": str(e),
+            }
+        )
+
+    except BaseException:
+        # Any other error (e.g. a corrupt gzip body) must still settle the
+        # breaker, or a claimed HALF_OPEN trial would keep it rejecting calls
+        breaker.record_failure()
+        raise
+
+    if response.status >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+        estimator.observe(response.timings["total_ms"])
+
+    if response.status >= 400:
+        error_body = response.text()
+        logger.error(
+            "HTTP error from Private API: %s - %s", response.status, error_body
+        )
+        raise PrivateApiError(
+            {
+                "error": f"Private API returned {response.status}",
+                "code": "UPSTREAM_ERROR",
+                "status": response.status,
+                "details": error_body,
+            },
+            response.timings,
+        )
+    return response.body, response.timings
+
+
+def query_dynamodb(tool_name, event, deadline):
+    """Serve a DIRECT_DYNAMODB_TOOLS tool from its table; returns the JSON body.
+
+    Raises PrivateApiError with the codes of call_private_api: a request the data
+    Lambda would reject is an UPSTREAM_ERROR with the same status and body.
+    """
+    if deadline.remaining() <= 0:
+        raise PrivateApiError(
+            {
+                "error": f"No time left to query DynamoDB for {tool_name}",
+                "code": "DEADLINE_EXCEEDED",
+            }
+        )
+
+    started = time.perf_counter()
+    try:
+        body = direct_dynamodb.query(tool_name, event)
+    except direct_dynamodb.DirectQueryError as e:
+        raise PrivateApiError(
+            {
+                "error": f"Private API returned {e.status}",
+                "code": "UPSTREAM_ERROR",
+                "status": e.status,
+                "details": json.dumps({"message": e.message}),
+            }
+        )
+    except direct_dynamodb.DynamoDBError as e:
+        logger.error("DynamoDB query failed for %s: %s", tool_name, str(e))
+        raise PrivateApiError(
+            {
+                "error": "Cannot query DynamoDB",
+                "code": "UNREACHABLE",
+                "details": str(e),
+            }
+        )
+
+    logger.info(
+        "DynamoDB answered %s directly in %.1f ms",
+        tool_name,
+        (time.perf_counter() - started) * 1000,
+    )
+    return body
+
+
+def handler(event, context):
+    """Proxy handler that forwards each tool call to the Private API of its route.
+
+    Supports every tool in ROUTES, e.g.:
+        - listAtmsByCity(city, status, fields) -> GET {ATM_API_URL}/atms/{city}?status=&fields=
+        - getBalances(usernames, fields) -> POST {BALANCE_API_URL}/balance:batch
+        - findNearestDatafonos(lat, lon, ...) -> GET {DATAFONOS_API_URL}/datafonos/near?...
+    plus batchInvoke(calls) -> several of the above concurrently (see batch_invoke).
+
+    Cache control flags in the event (never forwarded to the API):
+        - bypass_cache: skip the lookup, call the API and store the fresh response
+        - invalidate_cache: drop every cached response of the tool's API first
+    The result carries `_meta` with the cache status (HIT, MISS, BYPASS or
+    DISABLED), the age of the data, the tool's TTL and its source ("api", or
+    "dynamodb" for DIRECT_DYNAMODB_TOOLS). With RESPONSE_PASSTHROUGH a successful
+    single tool result is returned as JSON bytes (see with_meta). Failures are
+    returned as {"error", "code", ...}; see call_private_api for the upstream codes.
+    """
+    tool_name = get_tool_name(context)
+    logger.info("Adapter received tool %s with event: %s", tool_name, json.dumps(event))
+
+    deadline = Deadline.from_context(context, DEFAULT_DEADLINE_MS)
+    if tool_name == BATCH_TOOL_NAME:
+        return batch_invoke(event, deadline)
+    return invoke_tool(tool_name, event, deadline, passthrough=RESPONSE_PASSTHROUGH)
+
+
+def record_phases(tool_name, event, source, phases, started, **properties):
+    """Emit the EMF record of one tool call (no-op unless PHASE_METRICS)."""
+    if not PHASE_METRICS:
+        return
+    values = {
+        name: phases.get(key)
+        for key, name in PHASE_METRIC_NAMES.items()
+        if not (phases.get("reused") and key in HANDSHAKE_PHASES)
+    }
+    values["TotalMs"] = _elapsed_ms(started)
+    metrics.emit(
+        METRICS_NAMESPACE,
+        {"Tool": tool_name, "City": event.get("city")},
+        values,
+        {
+            "Source": source,
+            "Reused": phases.get("reused"),
+            "Retried": phases.get("retried"),
+            **properties,
+        },
+    )
+
+
+def with_meta(raw_body, meta):
+    """Return the JSON object in `raw_body` with `_meta` as its first key, as bytes.
+
+    The body is not parsed: `_meta` is spliced in after the opening brace, so the
+    cost is one copy of the body. Returns None when the body is not an object.
+    """
+    body = memoryview(raw_body.lstrip())
+    if body[:1] != b"{":
+        return None
+    rest = body[1:]
+    separator = b"" if bytes(rest[:1024]).lstrip().startswith(b"}") else b", "
+    return b"".join((b'{"_meta": ', json.dumps(meta).encode("utf-8"), separator, rest))
+
+
+def invoke_tool(tool_name, event, deadline, passthrough=False):
+    """Run one tool call (through the response cache) and return its result.
+
+    With `passthrough` the result is the upstream body as bytes plus `_meta`;
+    error results are always dicts.
+    """
+    try:
+        method, url, body = build_request(tool_name, event)
+    except ValueError as e:
+        logger.error("Invalid tool call: %s", str(e))
+        return {"error": str(e), "code": "INVALID_REQUEST"}
+
+    route = ROUTES[tool_name]
+    ttl = route["cache_ttl"]
+    cache_key = (route["api"], method, url, body)
+
+    if event.get("invalidate_cache"):
+        dropped = response_cache.invalidate(lambda key: key[0] == route["api"])
+        logger.info("Invalidated %s cached %s responses", dropped, route["api"])
+
+    source = "dynamodb" if tool_name in DIRECT_DYNAMODB_TOOLS else "api"
+    started = time.perf_counter()
+    phases = {}
+
+    def load():
+        if source == "dynamodb":
+            phase = time.perf_counter()
+            raw_body = query_dynamodb(tool_name, event, deadline)
+            phases["query_ms"] = _elapsed_ms(phase)
+            return raw_body, time.time()
+        raw_body, timings = call_private_api(route["api"], method, url, body, deadline)
+        phases.update(timings)
+        return raw_body, time.time()
+
+    try:
+        if ttl <= 0:
+            (raw_body, fetched_at), cache_status = load(), DISABLED
+        elif event.get("bypass_cache") or event.get("invalidate_cache"):
+            (raw_body, fetched_at), cache_status = load(), BYPASS
+            response_cache.put(cache_key, (raw_body, fetched_at))
+        else:
+            (raw_body, fetched_at), cache_status = response_cache.get_or_load(
+                cache_key, load, ttl=ttl
+            )
+
+    except PrivateApiError as e:
+        phases.update(e.timings)
+        record_phases(tool_name, event, source, phases, started, Code=e.payload["code"])
+        return e.payload
+
+    except Exception as e:
+        logger.error("Unexpected error: %s", str(e))
+        record_phases(tool_name, event, source, phases, started, Code="INTERNAL")
+        return {
+            "error": "Internal adapter error",
+            "code": "INTERNAL",
+            "details": str(e),
+        }
+
+    logger.info("Response cache %s for %s", cache_status, tool_name)
+    meta = {
+        "cache": cache_status,
+        "age_s": round(time.time() - fetched_at, 1),
+        "ttl_s": ttl,
+        "source": source,
+    }
+    phase = time.perf_counter()
+    result = with_meta(raw_body, meta) if passthrough else None
+    if result is None:
+        try:
+            result = json.loads(raw_body)
+        except ValueError as e:
+            logger.error("Invalid JSON from %s: %s", tool_name, str(e))
+            record_phases(tool_name, event, source, phases, started, Code="INTERNAL")
+            return {
+                "error": "Internal adapter error",
+                "code": "INTERNAL",
+                "details": str(e),
+            }
+        result["_meta"] = meta
+    phases["parse_ms"] = _elapsed_ms(phase)
+
+    record_phases(
+        tool_name, event, source, phases, started, Cache=cache_status, Code="OK"
+    )
+    return result
+
+
+def _invoke_batch_item(tool_name, arguments_json, deadline):
+    if tool_name == BATCH_TOOL_NAME:
+        return {
+            "error": f"{BATCH_TOOL_NAME} cannot be nested",
+            "code": "INVALID_REQUEST",
+        }
+    arguments = json.loads(arguments_json)
+    if not isinstance(arguments, dict):
+        return {"error": "arguments must be an object", "code": "INVALID_REQUEST"}
+    # Each item is embedded in the batch result, so it is always parsed
+    return invoke_tool(tool_name, arguments, deadline)
+
+
+def batch_invoke(event, deadline):
+    """Run `event["calls"]` ([{tool, arguments}, ...]) concurrently.
+
+    Identical calls (same tool and arguments) run once and share their result.
+    Results come back in request order; a failed call only sets `error`, `code`
+    (and `details`) on its own item instead of failing the batch. Every call
+    shares the invocation's deadline.
+    """
+    calls = event.get("calls")
+    if not isinstance(calls, list) or not calls:
+        return {"error": "Missing required parameter: calls", "code": "INVALID_REQUEST"}
+    if len(calls) > MAX_BATCH_CALLS:
+        return {
+            "error": f"At most {MAX_BATCH_CALLS} calls per batch",
+            "code": "INVALID_REQUEST",
+        }
+
+    keys = []
+    for call in calls:
+        call = call if isinstance(call, dict) else {}
+        arguments = call.get("arguments")
+        keys.append(
+            (str(call.get("tool", "")), json.dumps(arguments or {}, sort_keys=True))
+        )
+    unique_keys = list(dict.fromkeys(keys))
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(unique_keys), BATCH_MAX_WORKERS)
+    ) as executor:
+        results = dict(
+            zip(
+                unique_keys,
+                executor.map(
+                    lambda key: _invoke_batch_item(*key, deadline), unique_keys
+                ),
+            )
+        )
+
+    items = []
+    for tool_name, arguments_json in keys:
+        result = results[(tool_name, arguments_json)]
+        if "error" in result:
+            item = {"tool": tool_name, **result}
+        else:
+            item = {"tool": tool_name, "result": result}
+        items.append(item)
+
+    errors = sum(1 for item in items if "error" in item)
+    logger.info(
+        "Batch of %s calls (%s unique) finished with %s errors",
+        len(keys),
+        len(unique_keys),
+        errors,
+    )
+    return {
+        "results": items,
+        "count": len(items),
+        "unique_calls": len(unique_keys),
+        "errors": errors,
+    }
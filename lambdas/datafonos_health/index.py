@@ -1,65 +1,239 @@
 import json
 import os
 import logging
-from decimal import Decimal
 
-import boto3
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
+from shared_runtime.cache import TTLCache
+from shared_runtime.clients import get_table, thread_safe
+from shared_runtime.geo import parse_near_params, query_nearby
+from shared_runtime.pagination import (
+    decode_next_token,
+    decode_segment_cursor,
+    encode_next_token,
+    parallel_scan_page,
+    parse_limit,
+    scan_all,
+)
+from shared_runtime.projection import parse_fields, projection_kwargs
+from shared_runtime.responses import build_response, parse_format, with_compression
+from shared_runtime.summary import parse_mode, parse_stale_limit, summarize
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-
-class DecimalEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles DynamoDB Decimal types."""
-
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            if obj % 1 == 0:
-                return int(obj)
-            return float(obj)
-        return super().default(obj)
-
-
-def build_response(status_code, body):
-    """Build an API Gateway compatible response."""
-    return {
-        "statusCode": status_code,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(body, cls=DecimalEncoder),
-    }
-
-
+# Attributes that can be requested with ?fields=
+DATAFONO_FIELDS = (
+    "device_id",
+    "merchant_name",
+    "address",
+    "latitude",
+    "longitude",
+    "status",
+    "last_transaction",
+    "city",
+)
+
+# Values accepted by ?status= on the city and near routes
+DATAFONO_STATUSES = ("active", "inactive", "maintenance")
+
+# Attributes read for ?mode=summary: the counts plus what identifies a stale device
+SUMMARY_FIELDS = (
+    "device_id",
+    "merchant_name",
+    "address",
+    "status",
+    "city",
+    "last_transaction",
+)
+
+# Timestamp of the last activity; the oldest values are reported as most stale
+STALE_FIELD = "last_transaction"
+
+# GSI keyed on city + status; without it the status filter runs as a FilterExpression
+STATUS_INDEX_NAME = os.environ.get("STATUS_INDEX_NAME")
+
+# GSI keyed on geo_cell + geohash, used by the proximity search
+GEO_INDEX_NAME = os.environ.get("GEO_INDEX_NAME")
+
+# Number of DynamoDB scan segments read concurrently for full listings (1 = sequential)
+SCAN_SEGMENTS = max(1, int(os.environ.get("SCAN_SEGMENTS", "1")))
+
+# Read through the Decimal-free FastTable (int/float numbers) instead of the Table resource
+FAST_DESERIALIZE = os.environ.get("FAST_DESERIALIZE", "false").lower() == "true"
+
+# Per-city results cached across warm invocations, keyed by city, status, fields, mode
+city_cache = TTLCache(
+    max_entries=int(os.environ.get("CITY_CACHE_MAX_ENTRIES", "64")),
+    ttl=float(os.environ.get("CITY_CACHE_TTL_SECONDS", "30")),
+    stale_ttl=float(os.environ.get("CITY_CACHE_STALE_SECONDS", "120")),
+)
+
+
+@with_compression
 def handler(event, context):
     """Lambda handler for datafonos health API.
 
     Routes:
-        GET /datafonos        -> scan all datafonos
-        GET /datafonos/{city} -> query datafonos by city (PK=CITY#{city})
+        GET /datafonos        -> scan datafonos one page at a time (?limit=&next_token=&fields=),
+                              in parallel segments when SCAN_SEGMENTS > 1
+        GET /datafonos/{city} -> query datafonos by city (PK=CITY#{city}), served from
+                              an in-memory TTL cache (X-Cache* response headers)
+        GET /datafonos/near   -> nearest datafonos within ?radius_m= of ?lat=&lon=, from the
+                              GeoIndex GSI (geohash cells + haversine ranking)
+
+    `fields` (comma-separated) projects the returned attributes; unknown names -> 400.
+    `mode=summary` on /datafonos and /datafonos/{city} returns counts by status and city
+    plus the `stale_limit` devices with the oldest last_transaction instead of the rows
+    (the full listing then scans every page).
+    `status` on the city route queries the city+status GSI (STATUS_INDEX_NAME); on the
+    near route it filters the candidates before ranking.
+    `format=columnar` returns the item list as row arrays under one `columns` header.
+    Bodies above COMPRESSION_MIN_BYTES are gzip/br encoded per Accept-Encoding.
     """
     logger.info("Received event: %s", json.dumps(event))
 
     try:
-        table_name = os.environ["TABLE_NAME"]
-        dynamodb = boto3.resource("dynamodb")
-        table = dynamodb.Table(table_name)
+        table = get_table(os.environ["TABLE_NAME"], fast=FAST_DESERIALIZE)
 
         path_parameters = event.get("pathParameters") or {}
+        query_parameters = event.get("queryStringParameters") or {}
         city = path_parameters.get("city")
 
-        if city:
-            response = table.query(KeyConditionExpression=Key("PK").eq(f"CITY#{city}"))
-            items = response.get("Items", [])
+        try:
+            fields = parse_fields(query_parameters.get("fields"), DATAFONO_FIELDS)
+        except ValueError as e:
+            return build_response(400, {"message": str(e)})
+        projection = projection_kwargs(fields)
+
+        try:
+            mode = parse_mode(query_parameters.get("mode"))
+            stale_limit = parse_stale_limit(query_parameters.get("stale_limit"))
+            response_format = parse_format(query_parameters.get("format"))
+        except ValueError as e:
+            return build_response(400, {"message": str(e)})
+
+        status = query_parameters.get("status")
+        if status and status not in DATAFONO_STATUSES:
+            return build_response(
+                400,
+                {
+                    "message": f"Invalid status: {status}. "
+                    f"Allowed: {', '.join(DATAFONO_STATUSES)}"
+                },
+            )
+
+        if event.get("resource") == "/datafonos/near":
+            try:
+                lat, lon, radius_m, limit = parse_near_params(query_parameters)
+            except ValueError as e:
+                return build_response(400, {"message": str(e)})
+
+            filter_kwargs = {}
+            if status:
+                filter_kwargs["FilterExpression"] = Attr("status").eq(status)
+            items = query_nearby(
+                table,
+                GEO_INDEX_NAME,
+                lat,
+                lon,
+                radius_m,
+                limit,
+                fields=fields,
+                **filter_kwargs,
+            )
+            return build_response(
+                200,
+                {"datafonos": items, "count": len(items), "radius_m": radius_m},
+                response_format=response_format,
+            )
+
+        # The summary only needs a few attributes of each item, whatever `fields` says
+        if mode == "summary":
+            projection = projection_kwargs(SUMMARY_FIELDS)
 
-            if not items:
+        if city:
+            if status and STATUS_INDEX_NAME:
+                query_kwargs = {
+                    "IndexName": STATUS_INDEX_NAME,
+                    "KeyConditionExpression": Key("city").eq(city)
+                    & Key("status").eq(status),
+                }
+            elif status:
+                query_kwargs = {
+                    "KeyConditionExpression": Key("PK").eq(f"CITY#{city}"),
+                    "FilterExpression": Attr("status").eq(status),
+                }
+            else:
+                query_kwargs = {"KeyConditionExpression": Key("PK").eq(f"CITY#{city}")}
+
+            # Keyed only on what changes the query: format, stale_limit, limit and
+            # next_token reshape or are ignored by this route, so they share entries
+            cache_key = (city, status, tuple(fields or ()), mode)
+            # Stale entries are reloaded on a background thread: never touch the
+            # shared Table resource from there
+            query = thread_safe(table, "query")
+            items, cache_status = city_cache.get_or_load(
+                cache_key,
+                lambda: query(**query_kwargs, **projection).get("Items", []),
+            )
+            cache_headers = city_cache.metrics_headers(cache_status)
+
+            # A status with no matching devices is an empty result, not a missing city
+            if not items and not status:
                 return build_response(
-                    404, {"message": f"No datafonos found for city: {city}"}
+                    404,
+                    {"message": f"No datafonos found for city: {city}"},
+                    cache_headers,
                 )
+
+            if mode == "summary":
+                body = summarize(items, STALE_FIELD, stale_limit)
+            else:
+                body = {"datafonos": items, "count": len(items)}
+            return build_response(200, body, cache_headers, response_format)
+
+        if mode == "summary":
+            items = scan_all(table, SCAN_SEGMENTS, **projection)
+            return build_response(
+                200,
+                summarize(items, STALE_FIELD, stale_limit),
+                response_format=response_format,
+            )
+
+        try:
+            limit = parse_limit(query_parameters.get("limit"))
+            next_token = query_parameters.get("next_token")
+            if SCAN_SEGMENTS > 1:
+                cursor = (
+                    decode_segment_cursor(next_token, SCAN_SEGMENTS)
+                    if next_token
+                    else None
+                )
+            else:
+                scan_kwargs = {"Limit": limit, **projection}
+                if next_token:
+                    scan_kwargs["ExclusiveStartKey"] = decode_next_token(next_token)
+        except ValueError as e:
+            return build_response(400, {"message": str(e)})
+
+        if SCAN_SEGMENTS > 1:
+            items, next_cursor = parallel_scan_page(
+                table, SCAN_SEGMENTS, limit, cursor, **projection
+            )
+            next_token = encode_next_token(
+                next_cursor
+                and {"segments": next_cursor, "total_segments": SCAN_SEGMENTS}
+            )
         else:
-            response = table.scan()
+            response = table.scan(**scan_kwargs)
             items = response.get("Items", [])
+            next_token = encode_next_token(response.get("LastEvaluatedKey"))
+
+        body = {"datafonos": items, "count": len(items)}
+        if next_token:
+            body["next_token"] = next_token
 
-        return build_response(200, {"datafonos": items, "count": len(items)})
+        return build_response(200, body, response_format=response_format)
 
     except Exception as e:
         logger.error("Error processing request: %s", str(e))
@@ -1,47 +1,50 @@
+import base64
 import json
 import os
 import logging
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 
-import boto3
 from boto3.dynamodb.conditions import Key
+from shared_runtime.clients import get_table, thread_safe
+from shared_runtime.projection import parse_fields, projection_kwargs
+from shared_runtime.responses import build_response, parse_format
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Attributes that can be requested with ?fields=
+BALANCE_FIELDS = (
+    "username",
+    "account_type",
+    "balance",
+    "currency",
+    "last_updated",
+)
 
-class DecimalEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles DynamoDB Decimal types."""
+# Upper bound on usernames per POST /balance:batch request (one Query each)
+MAX_BATCH_USERNAMES = 25
 
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            if obj % 1 == 0:
-                return int(obj)
-            return float(obj)
-        return super().default(obj)
-
-
-def build_response(status_code, body):
-    """Build an API Gateway compatible response."""
-    return {
-        "statusCode": status_code,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(body, cls=DecimalEncoder),
-    }
+# Read through the Decimal-free FastTable (int/float numbers) instead of the Table resource
+FAST_DESERIALIZE = os.environ.get("FAST_DESERIALIZE", "false").lower() == "true"
 
 
 def handler(event, context):
     """Lambda handler for get balance API.
 
     Routes:
-        GET /balance/{username} -> query accounts by username (PK=USER#{username})
+        GET /balance/{username} -> query accounts by username (PK=USER#{username}),
+                                   optionally projected with ?fields= and returned
+                                   as row arrays with ?format=columnar
+        POST /balance:batch     -> {"usernames": [...], "fields": "..."}; one Query per
+                                   user, run concurrently, returned as a keyed map
     """
     logger.info("Received event: %s", json.dumps(event))
 
     try:
-        table_name = os.environ["TABLE_NAME"]
-        dynamodb = boto3.resource("dynamodb")
-        table = dynamodb.Table(table_name)
+        table = get_table(os.environ["TABLE_NAME"], fast=FAST_DESERIALIZE)
+
+        if event.get("resource") == "/balance:batch":
+            return batch_balances(table, event)
 
         path_parameters = event.get("pathParameters") or {}
         username = path_parameters.get("username")
@@ -51,7 +54,18 @@ def handler(event, context):
                 400, {"message": "Missing required parameter: username"}
             )
 
-        response = table.query(KeyConditionExpression=Key("PK").eq(f"USER#{username}"))
+        query_parameters = event.get("queryStringParameters") or {}
+        try:
+            projection = projection_kwargs(
+                parse_fields(query_parameters.get("fields"), BALANCE_FIELDS)
+            )
+            response_format = parse_format(query_parameters.get("format"))
+        except ValueError as e:
+            return build_response(400, {"message": str(e)})
+
+        response = table.query(
+            KeyConditionExpression=Key("PK").eq(f"USER#{username}"), **projection
+        )
         items = response.get("Items", [])
 
         if not items:
@@ -60,9 +74,69 @@ def handler(event, context):
             )
 
         return build_response(
-            200, {"accounts": items, "username": username, "count": len(items)}
+            200,
+            {"accounts": items, "username": username, "count": len(items)},
+            response_format=response_format,
         )
 
     except Exception as e:
         logger.error("Error processing request: %s", str(e))
         return build_response(500, {"message": f"Internal server error: {str(e)}"})
+
+
+def batch_balances(table, event):
+    """Handle POST /balance:batch.
+
+    Returns {"balances": {username: {"accounts": [...], "count": n}}, "not_found": [...],
+    "count": n}, preserving the request order and dropping duplicate usernames.
+    """
+    try:
+        body = event.get("body") or "{}"
+        if event.get("isBase64Encoded"):
+            body = base64.b64decode(body).decode("utf-8")
+        payload = json.loads(body)
+    except (ValueError, UnicodeDecodeError):
+        return build_response(400, {"message": "Request body must be valid JSON"})
+
+    usernames = payload.get("usernames") if isinstance(payload, dict) else None
+    if (
+        not isinstance(usernames, list)
+        or not usernames
+        or not all(isinstance(username, str) and username for username in usernames)
+    ):
+        return build_response(
+            400, {"message": "usernames must be a non-empty list of strings"}
+        )
+    usernames = list(dict.fromkeys(usernames))
+    if len(usernames) > MAX_BATCH_USERNAMES:
+        return build_response(
+            400, {"message": f"At most {MAX_BATCH_USERNAMES} usernames per request"}
+        )
+
+    fields = payload.get("fields")
+    if isinstance(fields, list):
+        fields = ",".join(str(field) for field in fields)
+    try:
+        projection = projection_kwargs(parse_fields(fields, BALANCE_FIELDS))
+    except ValueError as e:
+        return build_response(400, {"message": str(e)})
+
+    query = thread_safe(table, "query")
+
+    def query_user(username):
+        return query(
+            KeyConditionExpression=Key("PK").eq(f"USER#{username}"), **projection
+        ).get("Items", [])
+
+    with ThreadPoolExecutor(max_workers=len(usernames)) as executor:
+        results = dict(zip(usernames, executor.map(query_user, usernames)))
+
+    balances = {
+        username: {"accounts": items, "count": len(items)}
+        for username, items in results.items()
+        if items
+    }
+    not_found = [username for username, items in results.items() if not items]
+    return build_response(
+        200, {"balances": balances, "not_found": not_found, "count": len(balances)}
+    )
@@ -1,45 +1,46 @@
 """Lambda handler for Investment Products API.
 
 Routes:
-    GET /investments/{username} -> query investment products by username (PK=USER#{username})
+    GET /investments/{username} -> query investment products by username (PK=USER#{username}),
+                                   optionally projected with ?fields= and returned
+                                   as row arrays with ?format=columnar
 """
 
 import json
 import os
 import logging
-from decimal import Decimal
 
-import boto3
 from boto3.dynamodb.conditions import Key
+from shared_runtime.clients import get_table
+from shared_runtime.projection import parse_fields, projection_kwargs
+from shared_runtime.responses import build_response, parse_format
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Attributes that can be requested with ?fields=
+INVESTMENT_FIELDS = (
+    "username",
+    "product_type",
+    "product_name",
+    "invested_amount",
+    "current_value",
+    "currency",
+    "return_rate",
+    "start_date",
+    "maturity_date",
+    "status",
+)
 
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            if obj % 1 == 0:
-                return int(obj)
-            return float(obj)
-        return super().default(obj)
-
-
-def build_response(status_code, body):
-    return {
-        "statusCode": status_code,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(body, cls=DecimalEncoder),
-    }
+# Read through the Decimal-free FastTable (int/float numbers) instead of the Table resource
+FAST_DESERIALIZE = os.environ.get("FAST_DESERIALIZE", "false").lower() == "true"
 
 
 def handler(event, context):
     logger.info("Received event: %s", json.dumps(event))
 
     try:
-        table_name = os.environ["TABLE_NAME"]
-        dynamodb = boto3.resource("dynamodb")
-        table = dynamodb.Table(table_name)
+        table = get_table(os.environ["TABLE_NAME"], fast=FAST_DESERIALIZE)
 
         path_parameters = event.get("pathParameters") or {}
         username = path_parameters.get("username")
@@ -49,7 +50,18 @@ def handler(event, context):
                 400, {"message": "Missing required parameter: username"}
             )
 
-        response = table.query(KeyConditionExpression=Key("PK").eq(f"USER#{username}"))
+        query_parameters = event.get("queryStringParameters") or {}
+        try:
+            projection = projection_kwargs(
+                parse_fields(query_parameters.get("fields"), INVESTMENT_FIELDS)
+            )
+            response_format = parse_format(query_parameters.get("format"))
+        except ValueError as e:
+            return build_response(400, {"message": str(e)})
+
+        response = table.query(
+            KeyConditionExpression=Key("PK").eq(f"USER#{username}"), **projection
+        )
         items = response.get("Items", [])
 
         if not items:
@@ -58,7 +70,9 @@ def handler(event, context):
             )
 
         return build_response(
-            200, {"investments": items, "username": username, "count": len(items)}
+            200,
+            {"investments": items, "username": username, "count": len(items)},
+            response_format=response_format,
         )
 
     except Exception as e:
@@ -0,0 +1,17 @@
+"""Shared warm-start runtime for the data and adapter Lambdas (deployed as a Lambda layer).
+
+Modules are imported individually so each function only loads what it uses:
+    - clients:    module-scope DynamoDB resource with a tuned connection pool
+    - responses:  DecimalEncoder, the API Gateway response builder, compression and
+                  the `format=columnar` listing shape
+    - pagination: limit/next_token handling, the parallel scan engine and full scans
+    - cache:      bounded TTL cache with stale-while-revalidate
+    - fast_items: Decimal-free FastTable reader over the low-level client
+    - projection: `fields` query parameter -> ProjectionExpression
+    - geohash:    dependency-free geohash encoder shared with the setup scripts
+    - geo:        geohash cells + haversine ranking for proximity search
+    - http_pool:  keep-alive HTTPS connection pool for the adapter router
+    - resilience: invocation deadline, adaptive timeouts and circuit breakers
+    - summary:    `mode=summary` aggregation (counts + most stale devices)
+    - metrics:    CloudWatch Embedded Metric Format lines (per-phase latency)
+"""
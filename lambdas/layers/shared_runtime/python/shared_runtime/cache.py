@@ -0,0 +1,134 @@
+"""Bounded in-process TTL cache with stale-while-revalidate.
+
+The cache lives in the execution environment, so it only helps warm containers
+and is never shared between concurrent instances. Lambda freezes the container
+once the response is returned: a background refresh started by a stale read may
+finish at the beginning of the next invocation instead of right away. Loaders run
+on that background thread, so they must be thread-safe (for DynamoDB, build them
+from `shared_runtime.clients.thread_safe`, never the shared Table resource).
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger()
+
+HIT = "HIT"
+MISS = "MISS"
+STALE = "STALE"
+
+
+class TTLCache:
+    """LRU cache whose entries are fresh for `ttl` seconds.
+
+    Once an entry expires it is still served for up to `stale_ttl` extra seconds
+    (status STALE) while a single background thread reloads it. A refresh that has
+    not finished after `refresh_timeout` seconds (e.g. its thread was frozen with
+    the container mid-request) is considered abandoned and the next stale read
+    starts a new one. A `ttl` of 0 disables caching and every lookup calls the
+    loader.
+    """
+
+    def __init__(
+        self, max_entries, ttl, stale_ttl=0, refresh_timeout=30, clock=time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.refresh_timeout = refresh_timeout
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._refreshing = {}  # key -> clock value when its refresh started
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+    def get_or_load(self, key, loader, ttl=None):
+        """Return `(value, status)` for `key`, calling `loader()` on a miss.
+
+        `ttl` overrides the cache-wide TTL for this lookup, so one bounded cache
+        can hold keys with different lifetimes.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.max_entries <= 0:
+            with self._lock:
+                self.misses += 1
+            return loader(), MISS
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                now = self._clock()
+                age = now - stored_at
+                if age < ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value, HIT
+                if age < ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self.stale_hits += 1
+                    started_at = self._refreshing.get(key)
+                    if started_at is None or now - started_at > self.refresh_timeout:
+                        self._refreshing[key] = now
+                        threading.Thread(
+                            target=self._refresh,
+                            args=(key, loader, now),
+                            daemon=True,
+                        ).start()
+                    return value, STALE
+                del self._entries[key]
+            self.misses += 1
+
+        value = loader()
+        self.put(key, value)
+        return value, MISS
+
+    def put(self, key, value):
+        """Store `value` under `key`, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (value, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, match=None):
+        """Drop every entry, or only those whose key satisfies `match(key)`.
+
+        Returns the number of entries removed.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if match is None or match(key)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def _refresh(self, key, loader, started_at):
+        try:
+            value = loader()
+        except Exception as e:
+            logger.error("Background cache refresh failed for %s: %s", key, str(e))
+            value = None
+            failed = True
+        else:
+            failed = False
+        with self._lock:
+            # An abandoned refresh that finishes late must not overwrite the
+            # result of the refresh that replaced it
+            if self._refreshing.get(key) != started_at:
+                return
+            del self._refreshing[key]
+        if not failed:
+            self.put(key, value)
+
+    def metrics_headers(self, status):
+        """Response headers with the lookup status and the container's hit/miss counters."""
+        return {
+            "X-Cache": status,
+            "X-Cache-Hits": str(self.hits),
+            "X-Cache-Stale-Hits": str(self.stale_hits),
+            "X-Cache-Misses": str(self.misses),
+        }
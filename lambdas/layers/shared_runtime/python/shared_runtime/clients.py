@@ -0,0 +1,67 @@
+"""Module-scope AWS clients reused across warm invocations.
+
+Creating a boto3 resource costs tens of milliseconds and every new client opens
+its own connection pool (TCP + TLS handshake on first use). Building them once at
+import time means the init phase pays that cost and warm invocations reuse both
+the client and its open keep-alive connections.
+"""
+
+from functools import partial
+
+import boto3
+from botocore.config import Config
+
+from shared_runtime.fast_items import FastTable
+
+# Large enough for the parallel scan thread pool; connections are opened lazily
+MAX_POOL_CONNECTIONS = 50
+
+BOTO_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=5,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+
+dynamodb = boto3.resource("dynamodb", config=BOTO_CONFIG)
+
+# Low-level client for the Decimal-free path, created on first use only
+_dynamodb_client = None
+
+_tables = {}
+
+
+def get_dynamodb_client():
+    """Return the module-scope low-level DynamoDB client (no Decimal transforms)."""
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        _dynamodb_client = boto3.client("dynamodb", config=BOTO_CONFIG)
+    return _dynamodb_client
+
+
+def get_table(table_name, fast=False):
+    """Return the cached table reader for `table_name`.
+
+    With `fast=True` the reader is a FastTable, which returns numbers as int/float
+    instead of Decimal; otherwise it is the regular boto3 Table resource.
+    """
+    table = _tables.get((table_name, fast))
+    if table is None:
+        if fast:
+            table = FastTable(get_dynamodb_client(), table_name)
+        else:
+            table = dynamodb.Table(table_name)
+        _tables[(table_name, fast)] = table
+    return table
+
+
+def thread_safe(table, operation):
+    """Return a thread-safe callable for `operation` ("query" or "scan") on `table`.
+
+    Table resources must not be shared across threads; their low-level client and
+    FastTable can be.
+    """
+    if isinstance(table, FastTable):
+        return getattr(table, operation)
+    return partial(getattr(table.meta.client, operation), TableName=table.name)
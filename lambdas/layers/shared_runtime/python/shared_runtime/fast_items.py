@@ -0,0 +1,124 @@
+"""Decimal-free read path for DynamoDB items.
+
+The Table resource deserializes every number into `Decimal`, and DecimalEncoder
+then converts each one back during `json.dumps`. FastTable reads through the
+low-level client instead and turns `{"N": "..."}` attributes straight into int or
+float, so the response is JSON-serializable without a custom encoder.
+"""
+
+import base64
+
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeSerializer
+
+_serializer = TypeSerializer()
+
+
+def _number(raw):
+    if "." in raw or "e" in raw or "E" in raw:
+        return float(raw)
+    return int(raw)
+
+
+def deserialize_value(value):
+    """Convert one low-level AttributeValue into a JSON-friendly Python value."""
+    (tag, raw) = next(iter(value.items()))
+    if tag == "S" or tag == "BOOL":
+        return raw
+    if tag == "N":
+        return _number(raw)
+    if tag == "M":
+        return deserialize_item(raw)
+    if tag == "L":
+        return [deserialize_value(element) for element in raw]
+    if tag == "NULL":
+        return None
+    if tag == "SS":
+        return list(raw)
+    if tag == "NS":
+        return [_number(element) for element in raw]
+    if tag == "B":
+        return base64.b64encode(raw).decode("ascii")
+    if tag == "BS":
+        return [base64.b64encode(element).decode("ascii") for element in raw]
+    raise TypeError(f"Unsupported DynamoDB type: {tag}")
+
+
+def deserialize_item(item):
+    """Convert a low-level item, with an inline fast path for S and N attributes."""
+    result = {}
+    for name, value in item.items():
+        if "S" in value:
+            result[name] = value["S"]
+        elif "N" in value:
+            result[name] = _number(value["N"])
+        else:
+            result[name] = deserialize_value(value)
+    return result
+
+
+def _serialize_key(key):
+    return {name: _serializer.serialize(value) for name, value in key.items()}
+
+
+class FastTable:
+    """Read-only, Table-like wrapper over the low-level DynamoDB client.
+
+    Accepts the same `query`/`scan` keyword arguments as the Table resource
+    (including `Key(...)`/`Attr(...)` conditions) and returns items without
+    Decimal. Unlike the resource it is safe to share across threads.
+    """
+
+    def __init__(self, client, table_name):
+        self._client = client
+        self.name = table_name
+
+    def query(self, **kwargs):
+        return self._read(self._client.query, kwargs)
+
+    def scan(self, **kwargs):
+        return self._read(self._client.scan, kwargs)
+
+    def _read(self, operation, kwargs):
+        response = operation(**self._build_request(kwargs))
+        response["Items"] = [deserialize_item(item) for item in response.get("Items", [])]
+        if "LastEvaluatedKey" in response:
+            response["LastEvaluatedKey"] = deserialize_item(response["LastEvaluatedKey"])
+        return response
+
+    def _build_request(self, kwargs):
+        request = dict(kwargs, TableName=self.name)
+        names = dict(request.pop("ExpressionAttributeNames", {}))
+        values = {
+            placeholder: _serializer.serialize(value)
+            for placeholder, value in request.pop(
+                "ExpressionAttributeValues", {}
+            ).items()
+        }
+
+        builder = ConditionExpressionBuilder()
+        for param, is_key_condition in (
+            ("KeyConditionExpression", True),
+            ("FilterExpression", False),
+        ):
+            condition = request.get(param)
+            if isinstance(condition, ConditionBase):
+                built = builder.build_expression(
+                    condition, is_key_condition=is_key_condition
+                )
+                request[param] = built.condition_expression
+                names.update(built.attribute_name_placeholders)
+                values.update(
+                    {
+                        placeholder: _serializer.serialize(value)
+                        for placeholder, value in built.attribute_value_placeholders.items()
+                    }
+                )
+
+        if names:
+            request["ExpressionAttributeNames"] = names
+        if values:
+            request["ExpressionAttributeValues"] = values
+        if request.get("ExclusiveStartKey"):
+            request["ExclusiveStartKey"] = _serialize_key(request["ExclusiveStartKey"])
+        return request
@@ -0,0 +1,164 @@
+"""Geohash proximity search over the GeoIndex GSI.
+
+Items carry `geo_cell` (5-char geohash prefix, GSI partition key) and `geohash`
+(9-char geohash, GSI sort key), written by the setup/populate_* scripts with the
+same encoder (`shared_runtime.geohash`). A search picks the finest geohash
+precision whose cells still cover the radius, queries the 3x3 block of cells
+around the point (bounded: at most 9 queries) and ranks the candidates by exact
+haversine distance.
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+from boto3.dynamodb.conditions import Key
+
+from shared_runtime.clients import thread_safe
+from shared_runtime.geohash import GEO_CELL_PRECISION, encode
+from shared_runtime.projection import projection_kwargs
+
+MAX_SEARCH_PRECISION = 7
+DEFAULT_RADIUS_M = 1000
+DEFAULT_NEAR_LIMIT = 10
+MAX_NEAR_LIMIT = 100
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE = 111320.0
+
+
+def cell_size_deg(precision):
+    """Return the (lat, lon) size in degrees of a geohash cell."""
+    total_bits = 5 * precision
+    lat_bits = total_bits // 2
+    lon_bits = total_bits - lat_bits
+    return 180.0 / 2**lat_bits, 360.0 / 2**lon_bits
+
+
+def coverage_radius_m(lat, precision):
+    """Largest radius fully covered by the 3x3 cell block around any point at `lat`."""
+    lat_deg, lon_deg = cell_size_deg(precision)
+    return METERS_PER_DEGREE * min(lat_deg, lon_deg * math.cos(math.radians(lat)))
+
+
+def haversine_m(lat1, lon1, lat2, lon2):
+    """Great-circle distance in meters between two coordinates."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def parse_near_params(query_parameters):
+    """Parse `lat`, `lon`, `radius_m` and `limit` for a proximity search.
+
+    Returns (lat, lon, radius_m, limit); raises ValueError on missing or
+    out-of-range values, including radii the cell search cannot cover.
+    """
+    try:
+        lat = float(query_parameters["lat"])
+        lon = float(query_parameters["lon"])
+    except KeyError:
+        raise ValueError("lat and lon are required")
+    except ValueError:
+        raise ValueError("lat and lon must be numbers")
+    if not -90.0 <= lat <= 90.0 or not -180.0 <= lon <= 180.0:
+        raise ValueError("lat must be within [-90, 90] and lon within [-180, 180]")
+
+    try:
+        radius_m = float(query_parameters.get("radius_m", DEFAULT_RADIUS_M))
+        limit = int(query_parameters.get("limit", DEFAULT_NEAR_LIMIT))
+    except ValueError:
+        raise ValueError("radius_m and limit must be numbers")
+
+    max_radius = coverage_radius_m(lat, GEO_CELL_PRECISION)
+    if radius_m <= 0 or radius_m > max_radius:
+        raise ValueError(f"radius_m must be between 1 and {int(max_radius)} at this latitude")
+    if limit < 1 or limit > MAX_NEAR_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_NEAR_LIMIT}")
+    return lat, lon, radius_m, limit
+
+
+def search_cells(lat, lon, radius_m):
+    """Return the geohash prefixes (center + neighbours) that cover `radius_m`.
+
+    Raises ValueError when the radius exceeds what a 3x3 block of GEO_CELL_PRECISION
+    cells can cover, since larger searches would need more than nine partitions.
+    """
+    max_radius = coverage_radius_m(lat, GEO_CELL_PRECISION)
+    if radius_m > max_radius:
+        raise ValueError(f"radius_m must be at most {int(max_radius)} at this latitude")
+
+    precision = GEO_CELL_PRECISION
+    while (
+        precision < MAX_SEARCH_PRECISION
+        and coverage_radius_m(lat, precision + 1) >= radius_m
+    ):
+        precision += 1
+
+    lat_deg, lon_deg = cell_size_deg(precision)
+    cells = []
+    for d_lat in (-1, 0, 1):
+        cell_lat = lat + d_lat * lat_deg
+        if not -90.0 <= cell_lat <= 90.0:
+            continue
+        for d_lon in (-1, 0, 1):
+            cell_lon = (lon + d_lon * lon_deg + 180.0) % 360.0 - 180.0
+            cell = encode(cell_lat, cell_lon, precision)
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def query_nearby(
+    table, index_name, lat, lon, radius_m, limit, fields=None, **query_kwargs
+):
+    """Return up to `limit` items within `radius_m`, nearest first.
+
+    Each item gets a `distance_m` attribute. `fields` projects the items (the
+    coordinates are read for ranking and dropped unless requested); extra
+    `query_kwargs` such as a status FilterExpression go with every cell query.
+    Cells are queried concurrently.
+    """
+    query = thread_safe(table, "query")
+    if fields:
+        coordinates = [name for name in ("latitude", "longitude") if name not in fields]
+        query_kwargs.update(projection_kwargs(list(fields) + coordinates))
+
+    def query_cell(cell):
+        request = {
+            **query_kwargs,
+            "IndexName": index_name,
+            "KeyConditionExpression": Key("geo_cell").eq(cell[:GEO_CELL_PRECISION])
+            & Key("geohash").begins_with(cell),
+        }
+        items = []
+        while True:
+            response = query(**request)
+            items.extend(response.get("Items", []))
+            if not response.get("LastEvaluatedKey"):
+                return items
+            request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    cells = search_cells(lat, lon, radius_m)
+    with ThreadPoolExecutor(max_workers=len(cells)) as executor:
+        candidates = [item for items in executor.map(query_cell, cells) for item in items]
+
+    ranked = []
+    for item in candidates:
+        distance = haversine_m(
+            lat, lon, float(item["latitude"]), float(item["longitude"])
+        )
+        if distance <= radius_m:
+            item["distance_m"] = round(distance)
+            ranked.append((distance, item))
+    ranked.sort(key=lambda pair: pair[0])
+
+    items = [item for _, item in ranked[:limit]]
+    if fields:
+        for item in items:
+            for name in coordinates:
+                item.pop(name, None)
+    return items
@@ -0,0 +1,42 @@
+"""Geohash encoding shared by the GeoIndex writers and readers.
+
+The setup/populate_* scripts write `geo_cell` + `geohash` with `geo_keys` and the
+proximity search in `shared_runtime.geo` queries the same cells, so both sides
+must encode identically. This module has no dependencies (no boto3) so the setup
+scripts can import it straight from the layer directory.
+"""
+
+# Full geohash stored as the GeoIndex sort key (~5 m cells)
+GEOHASH_PRECISION = 9
+
+# Geohash prefix stored as the GeoIndex partition key (~4.9 km cells)
+GEO_CELL_PRECISION = 5
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode(lat, lon, precision=GEOHASH_PRECISION):
+    """Encode a coordinate as a geohash of `precision` characters."""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit_count, even = [], 0, 0, True
+    while len(chars) < precision:
+        interval, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (interval[0] + interval[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            interval[0] = mid
+        else:
+            interval[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def geo_keys(lat, lon):
+    """Return the `(geo_cell, geohash)` GeoIndex keys of a coordinate."""
+    geohash = encode(lat, lon)
+    return geohash[:GEO_CELL_PRECISION], geohash
@@ -0,0 +1,274 @@
+"""Module-scope keep-alive HTTP(S) connection pool for the adapter Lambda.
+
+`urllib.request.urlopen` opens a new TCP connection and TLS session on every call,
+so each tool call paid the handshake to the execute-api VPC endpoint even on warm
+containers. The pool keeps idle connections per host between invocations: only the
+first call after init (or after the idle timeout) connects. Each response carries
+per-phase timings (DNS, TCP, TLS, time to first byte, body read) so reuse and the
+source of slow calls are visible in the logs and metrics.
+"""
+
+import gzip
+import http.client
+import os
+import select
+import socket
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# Idle connections older than this are closed instead of reused; keep it below the
+# idle timeout of the VPC endpoint / API Gateway so the server rarely closes first
+IDLE_TIMEOUT_SECONDS = float(os.environ.get("HTTP_IDLE_TIMEOUT_SECONDS", "60"))
+
+MAX_IDLE_PER_HOST = 10
+
+REQUEST_TIMEOUT_SECONDS = 30
+
+READ_CHUNK_BYTES = 64 * 1024
+
+# getaddrinfo has no timeout of its own: it runs here so the caller can stop waiting
+_resolver = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dns")
+
+# Raised when the server already closed a kept-alive connection
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+    ssl.SSLEOFError,
+)
+
+
+def _elapsed_ms(started):
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+class _Budget:
+    """Absolute deadline shared by every phase of one request."""
+
+    def __init__(self, timeout):
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self):
+        """Seconds left; raises TimeoutError once the budget is spent."""
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Request deadline exceeded")
+        return remaining
+
+
+def _peer_closed(connection):
+    """Return True if an idle connection's socket is gone or readable (EOF)."""
+    if connection.sock is None:
+        return True
+    readable, _, _ = select.select([connection.sock], [], [], 0)
+    return bool(readable)
+
+
+class PooledResponse:
+    """A fully-read HTTP response; `body` is already gunzipped when compressed."""
+
+    def __init__(self, status, headers, body, timings):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.timings = timings
+
+    def text(self):
+        return self.body.decode("utf-8")
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive connections keyed by (scheme, host, port).
+
+    A reused connection that turns out to be stale is closed and the request is
+    retried once on a fresh connection; failures on fresh connections propagate.
+    """
+
+    def __init__(
+        self,
+        idle_timeout=IDLE_TIMEOUT_SECONDS,
+        max_idle_per_host=MAX_IDLE_PER_HOST,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+    ):
+        self.idle_timeout = idle_timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.timeout = timeout
+        self.stats = {"opened": 0, "reused": 0, "expired": 0, "stale": 0}
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._ssl_context = None
+
+    def _checkout(self, key):
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                connection, last_used = idle.pop()
+                if now - last_used < self.idle_timeout and not _peer_closed(connection):
+                    self.stats["reused"] += 1
+                    return connection
+                connection.close()
+                self.stats["expired"] += 1
+        return None
+
+    def _checkin(self, key, connection):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((connection, time.monotonic()))
+                return
+        connection.close()
+
+    def _connect(self, scheme, host, port, budget, timings):
+        """Open a connection, timing DNS, TCP and TLS separately into `timings`.
+
+        Does what HTTP(S)Connection.connect does (resolve, connect, TCP_NODELAY,
+        TLS with SNI), one step at a time; the connection then uses the socket.
+        Every step is bounded by what is left of `budget`.
+        """
+        port = port or (443 if scheme == "https" else 80)
+
+        phase = time.perf_counter()
+        lookup = _resolver.submit(socket.getaddrinfo, host, port, 0, socket.SOCK_STREAM)
+        try:
+            addresses = lookup.result(timeout=budget.remaining())
+        except TimeoutError:
+            raise TimeoutError(f"DNS lookup for {host} exceeded the deadline")
+        timings["dns_ms"] = _elapsed_ms(phase)
+
+        phase = time.perf_counter()
+        error = None
+        for family, sock_type, proto, _, address in addresses:
+            sock = socket.socket(family, sock_type, proto)
+            try:
+                sock.settimeout(budget.remaining())
+                sock.connect(address)
+                break
+            except OSError as e:
+                sock.close()
+                sock, error = None, e
+        if sock is None:
+            raise error
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        timings["tcp_ms"] = _elapsed_ms(phase)
+
+        phase = time.perf_counter()
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            try:
+                sock.settimeout(budget.remaining())
+                sock = self._ssl_context.wrap_socket(sock, server_hostname=host)
+            except Exception:
+                sock.close()
+                raise
+            connection = http.client.HTTPSConnection(
+                host, port, context=self._ssl_context
+            )
+        else:
+            connection = http.client.HTTPConnection(host, port)
+        connection.sock = sock
+        timings["tls_ms"] = _elapsed_ms(phase)
+
+        with self._lock:
+            self.stats["opened"] += 1
+        return connection
+
+    def request(self, method, url, body=None, headers=None, timeout=None):
+        """Send a request over a pooled connection and return a PooledResponse.
+
+        `Accept-Encoding: gzip` is sent unless overridden. `timeout` (seconds,
+        default REQUEST_TIMEOUT_SECONDS) bounds the whole request: DNS, connect,
+        TLS, send, first byte, body read and the stale-connection retry share one
+        absolute deadline, and each socket operation only gets what is left of it.
+        On expiry TimeoutError propagates and the connection is discarded. Timings
+        (ms): dns, tcp, tls and their sum connect (all 0 when reused), send, wait
+        (time to first byte), read, decompress and total.
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        headers = {"Accept-Encoding": "gzip", **(headers or {})}
+        budget = _Budget(self.timeout if timeout is None else timeout)
+
+        started = time.perf_counter()
+        connection = self._checkout(key)
+        retried = False
+        while True:
+            reused = connection is not None
+            timings = {"dns_ms": 0.0, "tcp_ms": 0.0, "tls_ms": 0.0}
+            phase = time.perf_counter()
+            if connection is None:
+                connection = self._connect(
+                    parts.scheme, parts.hostname, parts.port, budget, timings
+                )
+            timings["connect_ms"] = _elapsed_ms(phase) if not reused else 0.0
+            try:
+                phase = time.perf_counter()
+                connection.sock.settimeout(budget.remaining())
+                connection.request(method, path, body=body, headers=headers)
+                timings["send_ms"] = _elapsed_ms(phase)
+
+                phase = time.perf_counter()
+                connection.sock.settimeout(budget.remaining())
+                response = connection.getresponse()
+                timings["wait_ms"] = _elapsed_ms(phase)
+
+                phase = time.perf_counter()
+                data = self._read_body(connection, response, budget)
+                timings["read_ms"] = _elapsed_ms(phase)
+                break
+            except STALE_CONNECTION_ERRORS:
+                connection.close()
+                if not reused:
+                    raise
+                with self._lock:
+                    self.stats["stale"] += 1
+                # Only retry on a fresh connection if the deadline still allows it
+                budget.remaining()
+                connection, retried = None, True
+            except Exception:
+                connection.close()
+                raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._checkin(key, connection)
+
+        phase = time.perf_counter()
+        if response.getheader("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        timings["decompress_ms"] = _elapsed_ms(phase)
+        timings["total_ms"] = _elapsed_ms(started)
+        timings["reused"] = reused
+        timings["retried"] = retried
+        return PooledResponse(response.status, response.headers, data, timings)
+
+    @staticmethod
+    def _read_body(connection, response, budget):
+        """Read the body in chunks, re-arming the socket timeout before each one.
+
+        A single read() only bounds each recv; a slow server trickling bytes
+        could otherwise keep it going well past the deadline. Unlike read(),
+        read1() does not close the response at the end of the body; it is closed
+        here so the connection accepts the next request when reused.
+        """
+        chunks = []
+        while True:
+            connection.sock.settimeout(budget.remaining())
+            chunk = response.read1(READ_CHUNK_BYTES)
+            if not chunk:
+                response.close()
+                return b"".join(chunks)
+            chunks.append(chunk)
+
+
+# Shared by every invocation of the container
+pool = ConnectionPool()
@@ -0,0 +1,55 @@
+"""CloudWatch Embedded Metric Format (EMF) lines for per-phase latency.
+
+A log line shaped as EMF is turned into CloudWatch metrics by the Logs service
+itself: no PutMetricData call, no extra latency on the invocation and no IAM
+permission beyond writing logs. Each line is also a structured log record, so
+the raw timings stay queryable with Logs Insights.
+"""
+
+import json
+import time
+
+DEFAULT_UNIT = "Milliseconds"
+
+
+def emf_record(namespace, dimensions, metrics, properties=None, timestamp=None):
+    """Build one EMF record.
+
+    `dimensions` maps dimension names to values; None values are left out. Every
+    metric is published under each prefix of the dimension names, e.g. both
+    [Tool] and [Tool, City], so the aggregate per tool needs no metric math.
+    `metrics` maps names to values and `properties` are logged alongside without
+    becoming metrics; None values are skipped in both.
+    """
+    dimensions = {name: str(value) for name, value in dimensions.items() if value}
+    properties = {
+        name: value for name, value in (properties or {}).items() if value is not None
+    }
+    names = list(dimensions)
+    metrics = {name: value for name, value in metrics.items() if value is not None}
+    return {
+        "_aws": {
+            "Timestamp": int((timestamp or time.time()) * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": namespace,
+                    "Dimensions": [names[:size] for size in range(1, len(names) + 1)],
+                    "Metrics": [
+                        {"Name": name, "Unit": DEFAULT_UNIT} for name in metrics
+                    ],
+                }
+            ],
+        },
+        **properties,
+        **dimensions,
+        **metrics,
+    }
+
+
+def emit(namespace, dimensions, metrics, properties=None):
+    """Write one EMF record to stdout as a single line (the Lambda log stream).
+
+    Goes through print rather than the logging module: the runtime's log format
+    prefixes each logger line, and CloudWatch only parses lines that are JSON.
+    """
+    print(json.dumps(emf_record(namespace, dimensions, metrics, properties)))
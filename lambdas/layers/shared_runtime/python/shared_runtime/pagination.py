@@ -0,0 +1,131 @@
+"""Cursor pagination and the parallel segmented scan used by the listing endpoints."""
+
+import base64
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from shared_runtime.clients import thread_safe
+from shared_runtime.responses import DecimalEncoder
+
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+
+def parse_limit(value):
+    """Parse the `limit` query parameter into a DynamoDB page size."""
+    if value is None:
+        return DEFAULT_PAGE_LIMIT
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if limit < 1 or limit > MAX_PAGE_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}")
+    return limit
+
+
+def encode_next_token(last_evaluated_key):
+    """Encode a DynamoDB LastEvaluatedKey as an opaque, URL-safe token."""
+    if not last_evaluated_key:
+        return None
+    raw = json.dumps(last_evaluated_key, cls=DecimalEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_next_token(token):
+    """Decode a `next_token` query parameter back into an ExclusiveStartKey."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        key = json.loads(raw)
+    except ValueError:
+        raise ValueError("Invalid next_token")
+    if not isinstance(key, dict) or not key:
+        raise ValueError("Invalid next_token")
+    return key
+
+
+def decode_segment_cursor(token, total_segments):
+    """Decode a parallel-scan `next_token` into a {segment: ExclusiveStartKey} map.
+
+    The token comes from the client: every segment id must be a distinct integer
+    in range(total_segments) and at least one segment must be left to read.
+    """
+    state = decode_next_token(token)
+    segments = state.get("segments")
+    if state.get("total_segments") != total_segments or not isinstance(segments, dict):
+        raise ValueError("Invalid next_token")
+    try:
+        cursor = {int(segment): key for segment, key in segments.items()}
+    except ValueError:
+        raise ValueError("Invalid next_token")
+    if (
+        not cursor
+        or len(cursor) != len(segments)
+        or any(not 0 <= segment < total_segments for segment in cursor)
+    ):
+        raise ValueError("Invalid next_token")
+    return cursor
+
+
+def parallel_scan_page(table, total_segments, limit, cursor=None, **scan_kwargs):
+    """Scan one page of the table with Segment/TotalSegments across a thread pool.
+
+    `cursor` maps each unfinished segment to its ExclusiveStartKey (None when the
+    segment has not been read yet). The page limit is split across the unfinished
+    segments and results are merged in segment order, so paging is stable.
+    Extra `scan_kwargs` (e.g. a ProjectionExpression) are sent with every segment.
+    Returns the page items and the cursor for the next page ({} when done).
+    """
+    if cursor is None:
+        cursor = {segment: None for segment in range(total_segments)}
+
+    segments = sorted(cursor)
+    quotas = {
+        segment: limit // len(segments) + (1 if index < limit % len(segments) else 0)
+        for index, segment in enumerate(segments)
+    }
+    scheduled = [segment for segment in segments if quotas[segment] > 0]
+
+    scan = thread_safe(table, "scan")
+
+    def scan_segment(segment):
+        request = {
+            **scan_kwargs,
+            "Segment": segment,
+            "TotalSegments": total_segments,
+            "Limit": quotas[segment],
+        }
+        if cursor[segment]:
+            request["ExclusiveStartKey"] = cursor[segment]
+        return scan(**request)
+
+    with ThreadPoolExecutor(max_workers=len(scheduled)) as executor:
+        responses = dict(zip(scheduled, executor.map(scan_segment, scheduled)))
+
+    items = []
+    next_cursor = {}
+    for segment in segments:
+        if segment not in responses:
+            next_cursor[segment] = cursor[segment]
+            continue
+        items.extend(responses[segment].get("Items", []))
+        last_evaluated_key = responses[segment].get("LastEvaluatedKey")
+        if last_evaluated_key:
+            next_cursor[segment] = last_evaluated_key
+
+    return items, next_cursor
+
+
+def scan_all(table, total_segments, **scan_kwargs):
+    """Read the whole table in MAX_PAGE_LIMIT pages (parallel when total_segments > 1).
+
+    Used by aggregations that need every item; `scan_kwargs` should project only
+    the attributes the aggregation reads.
+    """
+    items, cursor = [], None
+    while cursor is None or cursor:
+        page, cursor = parallel_scan_page(
+            table, total_segments, MAX_PAGE_LIMIT, cursor, **scan_kwargs
+        )
+        items.extend(page)
+    return items
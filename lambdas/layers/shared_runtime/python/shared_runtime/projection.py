@@ -0,0 +1,40 @@
+"""Sparse fieldsets: `?fields=a,b` mapped to a DynamoDB ProjectionExpression."""
+
+
+def parse_fields(value, allowed):
+    """Parse the comma-separated `fields` query parameter.
+
+    Returns the requested attribute names in order (duplicates dropped), or None
+    when `value` is empty so the full item is returned. Raises ValueError for
+    names outside `allowed`.
+    """
+    if not value:
+        return None
+
+    fields = []
+    for name in value.split(","):
+        name = name.strip()
+        if name and name not in fields:
+            fields.append(name)
+
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+    return fields or None
+
+
+def projection_kwargs(fields):
+    """Build the query/scan kwargs that project `fields`.
+
+    Every name goes through an ExpressionAttributeNames placeholder because some
+    attributes (`status`) are DynamoDB reserved words.
+    """
+    if not fields:
+        return {}
+    names = {f"#f{index}": name for index, name in enumerate(fields)}
+    return {
+        "ProjectionExpression": ", ".join(names),
+        "ExpressionAttributeNames": names,
+    }
@@ -0,0 +1,127 @@
+"""Deadlines, adaptive timeouts and circuit breaking for calls to upstream APIs.
+
+A fixed request timeout equal to the Lambda timeout means a slow upstream burns
+the whole invocation and the caller only sees the Lambda time out. Instead the
+adapter derives each request's budget from the invocation's remaining time,
+tightens it to what the upstream usually needs (EWMA of its latency), and stops
+calling an upstream that keeps failing until a cooldown has passed.
+"""
+
+import threading
+import time
+
+# Time reserved to build and return the error response before Lambda times out
+DEADLINE_MARGIN_MS = 500
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+
+class Deadline:
+    """Absolute deadline of the current invocation, minus a safety margin."""
+
+    def __init__(
+        self, remaining_ms, margin_ms=DEADLINE_MARGIN_MS, clock=time.monotonic
+    ):
+        self._clock = clock
+        self.expires_at = clock() + max(0, remaining_ms - margin_ms) / 1000
+
+    @classmethod
+    def from_context(cls, context, default_ms):
+        """Deadline from `context.get_remaining_time_in_millis()`, or `default_ms`."""
+        get_remaining = getattr(context, "get_remaining_time_in_millis", None)
+        return cls(get_remaining() if callable(get_remaining) else default_ms)
+
+    def remaining(self):
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.expires_at - self._clock())
+
+
+class LatencyEstimator:
+    """Rolling latency estimate of one upstream: EWMA of the mean and deviation.
+
+    The timeout follows TCP's retransmission timeout: mean + 4 * deviation, so it
+    tracks the upstream's usual latency while tolerating its normal jitter.
+    """
+
+    def __init__(self, alpha=0.125, beta=0.25):
+        self.alpha = alpha
+        self.beta = beta
+        self.mean_ms = None
+        self.deviation_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, latency_ms):
+        with self._lock:
+            if self.mean_ms is None:
+                self.mean_ms, self.deviation_ms = latency_ms, latency_ms / 2
+                return
+            error = abs(latency_ms - self.mean_ms)
+            self.deviation_ms += self.beta * (error - self.deviation_ms)
+            self.mean_ms += self.alpha * (latency_ms - self.mean_ms)
+
+    def timeout(self, floor_s, ceiling_s):
+        """Adaptive timeout in seconds, clamped to [floor_s, ceiling_s].
+
+        Without samples yet the whole `ceiling_s` budget is used.
+        """
+        with self._lock:
+            if self.mean_ms is None:
+                return ceiling_s
+            estimate_s = (self.mean_ms + 4 * self.deviation_ms) / 1000
+        return min(ceiling_s, max(floor_s, estimate_s))
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one upstream.
+
+    CLOSED lets every call through. After `failure_threshold` consecutive failures
+    the breaker is OPEN and calls fail fast for `cooldown_s`; then it is HALF_OPEN
+    and a single trial call decides whether it closes again or re-opens.
+    """
+
+    def __init__(self, failure_threshold, cooldown_s, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.cooldown_s = cooldown_s
+        self._clock = clock
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return True if a call may proceed now (claims the HALF_OPEN trial)."""
+        with self._lock:
+            elapsed_s = self._clock() - self._opened_at
+            if self.state == OPEN and elapsed_s >= self.cooldown_s:
+                self.state = HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == HALF_OPEN:
+                if self._trial_in_flight:
+                    return False
+                self._trial_in_flight = True
+                return True
+            return self.state == CLOSED
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self._opened_at = self._clock()
+
+    def retry_after(self):
+        """Seconds until an OPEN breaker lets a trial call through."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.cooldown_s - (self._clock() - self._opened_at))
@@ -0,0 +1,144 @@
+"""JSON serialization and API Gateway proxy responses shared by the data Lambdas.
+
+Bodies are JSON objects; listings can be requested as `format=columnar`, where
+the item list becomes row arrays under a single `columns` header instead of
+repeating every attribute name in every item.
+"""
+
+import base64
+import functools
+import gzip
+import json
+import os
+from decimal import Decimal
+
+try:
+    import brotli
+except ImportError:  # optional: only offered when packaged with the function
+    brotli = None
+
+# Bodies smaller than this are returned uncompressed (0 disables compression)
+COMPRESSION_MIN_BYTES = int(os.environ.get("COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+_ENCODERS = {"gzip": lambda data: gzip.compress(data, GZIP_LEVEL, mtime=0)}
+if brotli is not None:
+    _ENCODERS["br"] = lambda data: brotli.compress(data, quality=BROTLI_QUALITY)
+
+# Server-side preference when the client accepts several encodings
+_PREFERENCE = ("br", "gzip")
+
+# `format` query parameter values; "rows" is the default list of objects
+FORMATS = ("rows", "columnar")
+
+
+class DecimalEncoder(json.JSONEncoder):
+    """Custom JSON encoder that handles DynamoDB Decimal types."""
+
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            if obj % 1 == 0:
+                return int(obj)
+            return float(obj)
+        return super().default(obj)
+
+
+def parse_format(value):
+    """Parse the `format` query parameter ("rows" when omitted)."""
+    if not value:
+        return "rows"
+    if value not in FORMATS:
+        raise ValueError(f"Invalid format: {value}. Allowed: {', '.join(FORMATS)}")
+    return value
+
+
+def to_columnar(body):
+    """Return `body` with its item list as row arrays under one `columns` header.
+
+    The item list is the only top-level list of objects (e.g. `datafonos`,
+    `accounts` or the summary's `most_stale`); the other keys are kept as-is.
+    Columns are the union of the item attributes in order of first appearance,
+    and an attribute missing from an item is null in its row. Bodies without
+    exactly one item list are returned unchanged.
+    """
+    keys = [
+        key
+        for key, value in body.items()
+        if isinstance(value, list) and all(isinstance(item, dict) for item in value)
+    ]
+    if len(keys) != 1:
+        return body
+    items = body[keys[0]]
+    columns = list(dict.fromkeys(name for item in items for name in item))
+    rows = [[item.get(name) for name in columns] for item in items]
+    return {"format": "columnar", "columns": columns, **body, keys[0]: rows}
+
+
+def build_response(status_code, body, headers=None, response_format="rows"):
+    """Build an API Gateway compatible response.
+
+    `response_format` is the parsed `format` parameter; "columnar" reshapes the
+    body with to_columnar.
+    """
+    if response_format == "columnar":
+        body = to_columnar(body)
+    return {
+        "statusCode": status_code,
+        "headers": {"Content-Type": "application/json", **(headers or {})},
+        "body": json.dumps(body, cls=DecimalEncoder),
+    }
+
+
+def accepted_encodings(headers):
+    """Return the encodings the client accepts (q > 0) from its Accept-Encoding header."""
+    value = next(
+        (v for k, v in (headers or {}).items() if k.lower() == "accept-encoding"), ""
+    )
+    accepted = set()
+    for part in (value or "").split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name and quality > 0:
+            accepted.add("gzip" if name == "*" else name)
+    return accepted
+
+
+def compress_response(response, headers):
+    """Compress a build_response() result for the request `headers`, when worthwhile.
+
+    Bodies of at least COMPRESSION_MIN_BYTES are encoded with the preferred encoding
+    the client accepts (br when brotli is available, else gzip) and base64-encoded
+    for API Gateway, which returns them as binary (x-amazon-apigateway-binary-media-types).
+    """
+    if COMPRESSION_MIN_BYTES <= 0 or response.get("isBase64Encoded"):
+        return response
+
+    response["headers"] = {**response.get("headers", {}), "Vary": "Accept-Encoding"}
+    accepted = accepted_encodings(headers)
+    encoding = next((e for e in _PREFERENCE if e in accepted and e in _ENCODERS), None)
+    raw = response["body"].encode("utf-8")
+    if encoding is None or len(raw) < COMPRESSION_MIN_BYTES:
+        return response
+
+    response["headers"]["Content-Encoding"] = encoding
+    response["body"] = base64.b64encode(_ENCODERS[encoding](raw)).decode("ascii")
+    response["isBase64Encoded"] = True
+    return response
+
+
+def with_compression(handler):
+    """Decorate a Lambda handler so its responses honour the request's Accept-Encoding."""
+
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        return compress_response(handler(event, context), event.get("headers"))
+
+    return wrapper
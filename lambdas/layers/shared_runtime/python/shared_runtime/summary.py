@@ -0,0 +1,60 @@
+"""Server-side `mode=summary` for the health listings: counts instead of rows.
+
+Answering "how healthy are the datafonos in Medellín?" from a full listing makes
+the model count statuses over every row. A summary is a few hundred bytes no
+matter the fleet size: totals by status and by city plus the few devices whose
+last activity is oldest.
+"""
+
+import heapq
+from collections import Counter
+
+MODES = ("full", "summary")
+
+DEFAULT_STALE_LIMIT = 5
+MAX_STALE_LIMIT = 50
+
+
+def parse_mode(value):
+    """Parse the `mode` query parameter ("full" when omitted)."""
+    if not value:
+        return "full"
+    if value not in MODES:
+        raise ValueError(f"Invalid mode: {value}. Allowed: {', '.join(MODES)}")
+    return value
+
+
+def parse_stale_limit(value):
+    """Parse the `stale_limit` query parameter (devices listed in most_stale)."""
+    if value is None:
+        return DEFAULT_STALE_LIMIT
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError("stale_limit must be an integer")
+    if limit < 0 or limit > MAX_STALE_LIMIT:
+        raise ValueError(f"stale_limit must be between 0 and {MAX_STALE_LIMIT}")
+    return limit
+
+
+def summarize(items, stale_field, stale_limit=DEFAULT_STALE_LIMIT):
+    """Aggregate device items into counts and the `stale_limit` most stale devices.
+
+    `stale_field` holds an ISO-8601 UTC timestamp, so the oldest activity sorts
+    first as a plain string; items without it are never reported as stale.
+    """
+    by_status = Counter(item.get("status", "unknown") for item in items)
+    by_city = Counter(item.get("city", "unknown") for item in items)
+    most_stale = heapq.nsmallest(
+        stale_limit,
+        (item for item in items if item.get(stale_field)),
+        key=lambda item: item[stale_field],
+    )
+    return {
+        "mode": "summary",
+        "total": len(items),
+        "by_status": dict(by_status.most_common()),
+        "by_city": dict(by_city.most_common()),
+        "stale_field": stale_field,
+        "most_stale": most_stale,
+    }
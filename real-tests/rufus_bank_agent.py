@@ -9,12 +9,21 @@ from strands.models import BedrockModel
 from strands.hooks import (
     HookProvider,
     HookRegistry,
+    BeforeInvocationEvent,
     BeforeToolCallEvent,
     AfterToolCallEvent,
+    MessageAddedEvent,
 )
 from strands.tools.mcp.mcp_client import MCPClient
 from mcp.client.streamable_http import streamablehttp_client
+from tool_catalog import ToolCatalog
+from tool_result_cache import ToolResultCacheHook
+from token_provider import BearerTokenAuth, TokenProvider
+from collections import deque
+import asyncio
 import json
+import os
+import time
 
 
 # ──────────────────────────────────────────────
@@ -24,13 +33,37 @@ CLIENT_ID = "<YOUR_CLIENT_ID>"
 CLIENT_SECRET = "<YOUR_CLIENT_SECRET>"
 TOKEN_URL = "<TOKEN_ENDPOINT>"
 GATEWAY_URL = "https://gateway-agentcore-bancolombia-outbound-tools-01-tv4ln7k9gd.gateway.bedrock-agentcore.us-east-1.amazonaws.com/mcp"
+MODEL_ID = "global.anthropic.claude-opus-4-6-v1"
+
+# Catálogo de tools en disco (~/.cache/rufus-bank/tool-catalog.json): arranque
+# inmediato y revalidación contra el gateway en segundo plano
+TOOL_CATALOG_ENABLED = os.environ.get("RUFUS_TOOL_CATALOG", "true").lower() == "true"
+
+# Máximo de tool calls simultáneos de un mismo turno sobre la sesión MCP
+TOOL_CONCURRENCY = int(os.environ.get("RUFUS_TOOL_CONCURRENCY", "4"))
+
+# Caché de resultados de tools (~/.cache/rufus-bank/tool-results.json): los tool
+# calls repetidos dentro de la sesión o entre sesiones no van al gateway
+TOOL_CACHE_ENABLED = os.environ.get("RUFUS_TOOL_CACHE", "true").lower() == "true"
 
 
 # ──────────────────────────────────────────────
 # Hook para logging de tools (input/output)
 # ──────────────────────────────────────────────
 class ToolLoggingHook(HookProvider):
-    """Loguea el input y output de cada tool call del agente."""
+    """Loguea el input y output de cada tool call del agente.
+
+    Con tool calls concurrentes indica con cuántas se solapa cada una y, al
+    terminar el grupo, compara su duración total con la suma de las duraciones
+    (lo que habría tardado en secuencia). `batches` guarda los últimos grupos.
+    """
+
+    def __init__(self):
+        self._started = {}  # toolUseId -> inicio (perf_counter)
+        self._batch_started = 0.0
+        self._batch_calls = 0
+        self._batch_busy_ms = 0.0
+        self.batches = deque(maxlen=100)  # (tool calls, ms total, ms en secuencia)
 
     def register_hooks(self, registry: HookRegistry) -> None:
         registry.add_callback(BeforeToolCallEvent, self.log_tool_input)
@@ -39,22 +72,105 @@ class ToolLoggingHook(HookProvider):
     def log_tool_input(self, event: BeforeToolCallEvent) -> None:
         tool_name = event.tool_use.get("name", "unknown")
         tool_input = event.tool_use.get("input", {})
-        print(f"\n  🔧 [TOOL CALL] {tool_name}")
+        now = time.perf_counter()
+        in_flight = len(self._started)
+        if not in_flight:
+            self._batch_started, self._batch_calls, self._batch_busy_ms = now, 0, 0.0
+        self._started[event.tool_use.get("toolUseId")] = now
+        self._batch_calls += 1
+        overlap = f" (en paralelo con {in_flight})" if in_flight else ""
+        print(f"\n  🔧 [TOOL CALL] {tool_name}{overlap}")
         print(f"  📥 [INPUT] {json.dumps(tool_input, indent=2, ensure_ascii=False)}")
 
     def log_tool_output(self, event: AfterToolCallEvent) -> None:
         tool_name = event.tool_use.get("name", "unknown")
         result = event.result
+        now = time.perf_counter()
+        started = self._started.pop(event.tool_use.get("toolUseId"), now)
+        elapsed_ms = (now - started) * 1000
+        self._batch_busy_ms += elapsed_ms
         # Truncar output largo para no llenar la terminal
         result_str = json.dumps(result, indent=2, ensure_ascii=False, default=str)
         if len(result_str) > 1000:
             result_str = result_str[:1000] + "\n  ... (truncado)"
-        print(f"  📤 [OUTPUT] {tool_name}:")
+        print(f"  📤 [OUTPUT] {tool_name} ({elapsed_ms:.0f} ms):")
         print(f"  {result_str}\n")
 
+        if not self._started:
+            wall_ms = (now - self._batch_started) * 1000
+            self.batches.append((self._batch_calls, wall_ms, self._batch_busy_ms))
+            if self._batch_calls > 1:
+                print(
+                    f"  ⏱️  [PARALELO] {self._batch_calls} tools en {wall_ms:.0f} ms "
+                    f"(en secuencia ~{self._batch_busy_ms:.0f} ms)\n"
+                )
+
+
+class ToolConcurrencyLimitHook(HookProvider):
+    """Limita los tool calls simultáneos de un turno y ordena sus resultados.
+
+    El executor concurrente de Strands (el default) ejecuta en paralelo todos
+    los tool calls de un turno, sin límite, y entrega los resultados en el orden
+    en que terminan. Este hook usa solo eventos públicos: cada tool call toma un
+    cupo de un semáforo antes de ejecutarse y lo libera al terminar, y el
+    mensaje de resultados se reordena según los tool uses. Debe registrarse
+    antes que los demás hooks para que ellos vean solo la ejecución real.
+    """
+
+    def __init__(self, max_concurrency: int = TOOL_CONCURRENCY):
+        self.max_concurrency = max(1, max_concurrency)
+        self._semaphore = None
+        self._holding = set()  # toolUseIds con un cupo tomado
 
-def create_streamable_http_transport(mcp_url: str, access_token: str):
-    """Crea el transporte HTTP para conectarse al MCP Gateway."""
+    def register_hooks(self, registry: HookRegistry) -> None:
+        registry.add_callback(BeforeInvocationEvent, self.reset)
+        registry.add_callback(BeforeToolCallEvent, self.acquire)
+        registry.add_callback(AfterToolCallEvent, self.release)
+        registry.add_callback(MessageAddedEvent, self.order_results)
+
+    def reset(self, event: BeforeInvocationEvent) -> None:
+        # Un semáforo por invocación: un tool call interrumpido o cancelado no
+        # deja cupos tomados para el siguiente turno
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._holding = set()
+
+    async def acquire(self, event: BeforeToolCallEvent) -> None:
+        await self._semaphore.acquire()
+        self._holding.add(event.tool_use.get("toolUseId"))
+
+    def release(self, event: AfterToolCallEvent) -> None:
+        tool_use_id = event.tool_use.get("toolUseId")
+        if tool_use_id in self._holding:
+            self._holding.discard(tool_use_id)
+            self._semaphore.release()
+
+    def order_results(self, event: MessageAddedEvent) -> None:
+        content = event.message.get("content", [])
+        messages = event.agent.messages
+        if len(messages) < 2 or not any("toolResult" in block for block in content):
+            return
+        tool_uses = [
+            block["toolUse"]["toolUseId"]
+            for block in messages[-2].get("content", [])
+            if "toolUse" in block
+        ]
+        order = {tool_use_id: i for i, tool_use_id in enumerate(tool_uses)}
+        # El mensaje es el mismo objeto que quedó en agent.messages
+        content.sort(
+            key=lambda block: order.get(
+                block.get("toolResult", {}).get("toolUseId"), -1
+            )
+        )
+
+
+def create_streamable_http_transport(mcp_url: str, access_token):
+    """Crea el transporte HTTP para conectarse al MCP Gateway.
+
+    `access_token` es un token fijo o un TokenProvider; con el provider cada
+    request lleva el token vigente, renovado antes de que expire.
+    """
+    if isinstance(access_token, TokenProvider):
+        return streamablehttp_client(mcp_url, auth=BearerTokenAuth(access_token))
     return streamablehttp_client(
         mcp_url, headers={"Authorization": f"Bearer {access_token}"}
     )
@@ -77,6 +193,71 @@ def get_full_tools_list(client):
     return tools
 
 
+def connect_gateway(gateway_url: str, access_token, catalog=None):
+    """Conecta el MCP client al gateway y carga sus tools.
+
+    Con un `ToolCatalog` las tools salen del catálogo en disco (si existe) y la
+    revalidación contra el gateway corre en segundo plano.
+    """
+    print("[PASO] Conectando al MCP Gateway...")
+    mcp_client = MCPClient(
+        lambda: create_streamable_http_transport(gateway_url, access_token)
+    )
+    mcp_client.start()
+    print("[PASO] Conexión al MCP Gateway establecida.")
+
+    if catalog is None:
+        return mcp_client, get_full_tools_list(mcp_client)
+    mcp_tools = catalog.get_tools(mcp_client, get_full_tools_list)
+    if catalog.source == "cache":
+        print(
+            f"[PASO] {len(mcp_tools)} tools cargadas del catálogo en disco "
+            "(revalidando contra el gateway en segundo plano)."
+        )
+    return mcp_client, mcp_tools
+
+
+def create_agent(
+    model,
+    tools: list,
+    hooks: list = None,
+    max_concurrency: int = TOOL_CONCURRENCY,
+    **agent_options,
+) -> Agent:
+    """Crea el agente Rufus Bank (por defecto con el hook de logging de tools).
+
+    El límite de tool calls simultáneos va antes que `hooks`, así el logging mide
+    solo la ejecución. `agent_options` va directo a `Agent` (ej.
+    `callback_handler=None`).
+    """
+    if hooks is None:
+        hooks = [ToolLoggingHook()]
+    return Agent(
+        model=model,
+        tools=tools,
+        system_prompt=SYSTEM_PROMPT,
+        hooks=[ToolConcurrencyLimitHook(max_concurrency), *hooks],
+        **agent_options,
+    )
+
+
+def gateway_access_token():
+    """TokenProvider si hay credenciales configuradas; si no, el gateway es público."""
+    if CLIENT_ID.startswith("<"):
+        return "NONE_IT_IS_PUBLIC"
+    return TokenProvider(CLIENT_ID, CLIENT_SECRET, TOKEN_URL)
+
+
+def response_text(response) -> str:
+    """Texto de la respuesta del agente (los bloques de texto del mensaje final)."""
+    text = ""
+    if hasattr(response, "message") and response.message:
+        for block in response.message.get("content", []):
+            if isinstance(block, dict) and block.get("text"):
+                text += block["text"]
+    return text
+
+
 # ──────────────────────────────────────────────
 # System Prompt del agente Rufus Bank
 # ──────────────────────────────────────────────
@@ -100,27 +281,22 @@ def main():
     print("║   Escribe 'salir' para terminar            ║")
     print("╚═══════════════════════════════════════════╝\n")
 
+    started = time.perf_counter()
+
     # ── Inicializar modelo ──
     print("[PASO] Inicializando modelo Bedrock...")
-    model = BedrockModel(model_id="global.anthropic.claude-opus-4-6-v1")
+    model = BedrockModel(model_id=MODEL_ID)
     print("[PASO] Modelo inicializado.")
 
     # ── Conectar al MCP Gateway ──
     mcp_client = None
     mcp_tools = []
+    catalog = ToolCatalog(GATEWAY_URL) if TOOL_CATALOG_ENABLED else None
 
     try:
-        print("[PASO] Conectando al MCP Gateway...")
-        mcp_client = MCPClient(
-            lambda: create_streamable_http_transport(
-                GATEWAY_URL,
-                "NONE_IT_IS_PUBLIC",
-            )
+        mcp_client, mcp_tools = connect_gateway(
+            GATEWAY_URL, gateway_access_token(), catalog
         )
-        mcp_client.start()
-        print("[PASO] Conexión al MCP Gateway establecida.")
-
-        mcp_tools = get_full_tools_list(mcp_client)
         print("[PASO] Tools cargadas:")
         for tool in mcp_tools:
             tool_name = getattr(tool, "tool_name", None) or getattr(
@@ -136,14 +312,16 @@ def main():
 
     # ── Crear agente con hook de logging ──
     print("[PASO] Creando agente Rufus Bank...")
-    tool_logger = ToolLoggingHook()
-    agent = Agent(
-        model=model,
-        tools=mcp_tools,
-        system_prompt=SYSTEM_PROMPT,
-        hooks=[tool_logger],
-    )
+    hooks = [ToolLoggingHook()]
+    tool_cache = None
+    if TOOL_CACHE_ENABLED:
+        tool_cache = ToolResultCacheHook(gateway_url=GATEWAY_URL, identity=CLIENT_ID)
+    if tool_cache:
+        hooks.append(tool_cache)
+        print(f"[PASO] Caché de tools con {tool_cache.loaded} resultados vigentes.")
+    agent = create_agent(model, mcp_tools, hooks=hooks)
     print(f"[PASO] Agente creado con {len(agent.tool_names)} tools: {agent.tool_names}")
+    print(f"[PASO] Arranque en {(time.perf_counter() - started) * 1000:.0f} ms.")
     print("\n" + "─" * 50)
     print("¡Listo! Puedes empezar a chatear con Rufus Bank.")
     print("─" * 50 + "\n")
@@ -160,27 +338,29 @@ def main():
                 print("\n🏦 Rufus Bank: ¡Hasta luego! Fue un placer atenderte. 👋\n")
                 break
 
+            # Si la revalidación encontró un catálogo distinto, cambiarlo entre turnos
+            if catalog and mcp_client:
+                catalog.apply_pending(agent)
+
             print("\n🏦 Rufus Bank: ", end="", flush=True)
             response = agent(user_input)
 
             # Extraer texto de la respuesta
-            response_text = ""
-            if hasattr(response, "message") and response.message:
-                for block in response.message.get("content", []):
-                    if isinstance(block, dict) and block.get("text"):
-                        response_text += block["text"]
-
-            if response_text:
-                print(response_text)
+            text = response_text(response)
+            if text:
+                print(text)
             print()
 
     except KeyboardInterrupt:
         print("\n\n🏦 Rufus Bank: ¡Chao! Que tengas un excelente día. 👋\n")
 
     finally:
+        if tool_cache:
+            tool_cache.save()
+            print(tool_cache.report())
         if mcp_client:
             try:
-                mcp_client.stop()
+                mcp_client.stop(None, None, None)
                 print("[PASO] MCP Client desconectado.")
             except Exception as e:
                 print(f"[ERROR] Error deteniendo MCP client: {e}")
@@ -0,0 +1,349 @@
+"""
+## DEMO CODE FOR rufus-bank-agent SANTI.
+## DO NOT USE IN PROD :)
+## Servidor HTTP (asyncio) del agente Rufus Bank para muchas conversaciones a la vez:
+## pool de sesiones MCP calientes, catálogo de tools compartido y un Agent por
+## conversación.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+from strands.models import BedrockModel
+from strands.tools.mcp.mcp_client import MCPClient
+from strands.types.tools import AgentTool
+
+from rufus_bank_agent import (
+    GATEWAY_URL,
+    MODEL_ID,
+    ToolLoggingHook,
+    create_agent,
+    create_streamable_http_transport,
+    gateway_access_token,
+    get_full_tools_list,
+    response_text,
+)
+
+
+# ──────────────────────────────────────────────
+# Pool de sesiones MCP compartido por todas las conversaciones
+# ──────────────────────────────────────────────
+class PooledMCPTool(AgentTool):
+    """Tool del catálogo compartido; cada llamada usa la sesión menos ocupada."""
+
+    def __init__(self, tool, pool: "McpSessionPool"):
+        super().__init__()
+        self._tool = tool
+        self._pool = pool
+
+    @property
+    def tool_name(self) -> str:
+        return self._tool.tool_name
+
+    @property
+    def tool_spec(self):
+        return self._tool.tool_spec
+
+    @property
+    def tool_type(self) -> str:
+        return self._tool.tool_type
+
+    async def stream(self, tool_use, invocation_state, **kwargs):
+        client = self._pool.acquire()
+        try:
+            result = await client.call_tool_async(
+                tool_use_id=tool_use["toolUseId"],
+                name=self._tool.mcp_tool.name,
+                arguments=tool_use["input"],
+            )
+        finally:
+            self._pool.release(client)
+        yield result
+
+
+class McpSessionPool:
+    """Sesiones MCP abiertas contra el gateway, listas antes del primer request.
+
+    Cada sesión es un MCPClient con su propio thread de I/O; los tool calls se
+    reparten a la sesión con menos llamadas en curso. El catálogo se lista al
+    arrancar y todas las conversaciones comparten los mismos tools, así crear
+    una conversación no abre sesiones ni lista tools.
+    """
+
+    def __init__(self, gateway_url: str, access_token, size: int = 4):
+        self.gateway_url = gateway_url
+        self.access_token = access_token
+        self.size = max(1, size)
+        self.clients = []
+        self.tools = []
+        self._in_flight = {}
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> "McpSessionPool":
+        clients = [
+            MCPClient(
+                lambda: create_streamable_http_transport(
+                    self.gateway_url, self.access_token
+                )
+            )
+            for _ in range(self.size)
+        ]
+        catalogs = [None] * len(clients)
+
+        def warm(i: int) -> None:
+            # Cada sesión lista el catálogo completo: el SDK de MCP guarda los
+            # output schemas por sesión y, si no conoce un tool, repite
+            # tools/list en cada tool call para validar el resultado.
+            clients[i].start()
+            catalogs[i] = get_full_tools_list(clients[i])
+
+        threads = [
+            threading.Thread(target=warm, args=(i,)) for i in range(len(clients))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if any(catalog is None for catalog in catalogs):
+            self.clients = clients
+            self.stop()
+            raise RuntimeError("Failed to open the MCP session pool")
+
+        for client in clients:
+            self._in_flight[id(client)] = 0
+            self._calls[id(client)] = 0
+        self.clients = clients
+        # Las conversaciones comparten los mismos tools (el catálogo de la sesión 0)
+        self.tools = [PooledMCPTool(tool, self) for tool in catalogs[0]]
+        return self
+
+    def acquire(self) -> MCPClient:
+        with self._lock:
+            client = min(self.clients, key=lambda client: self._in_flight[id(client)])
+            self._in_flight[id(client)] += 1
+            self._calls[id(client)] += 1
+        return client
+
+    def release(self, client: MCPClient) -> None:
+        with self._lock:
+            self._in_flight[id(client)] -= 1
+
+    def stats(self) -> list:
+        with self._lock:
+            return [
+                {
+                    "in_flight": self._in_flight[id(client)],
+                    "calls": self._calls[id(client)],
+                }
+                for client in self.clients
+            ]
+
+    def stop(self) -> None:
+        for client in self.clients:
+            try:
+                client.stop(None, None, None)
+            except Exception as e:
+                print(f"[ERROR] Error deteniendo MCP client: {e}")
+
+
+# ──────────────────────────────────────────────
+# Conversaciones: un Agent liviano por cliente
+# ──────────────────────────────────────────────
+class Conversation:
+    def __init__(self, agent):
+        self.agent = agent
+        self.lock = asyncio.Lock()  # un turno a la vez por conversación
+        self.last_used = time.monotonic()
+        self.turns = 0
+
+
+class ConversationStore:
+    """Conversaciones activas, acotadas por número y por inactividad."""
+
+    def __init__(self, factory, max_conversations: int, idle_timeout_s: float):
+        self.factory = factory
+        self.max_conversations = max_conversations
+        self.idle_timeout_s = idle_timeout_s
+        self._conversations = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        # De la más antigua a la más reciente; las que están en un turno se
+        # saltan y se sigue con la siguiente
+        for conversation_id, conversation in list(self._conversations.items()):
+            if conversation.lock.locked():
+                continue
+            idle = now - conversation.last_used > self.idle_timeout_s
+            full = len(self._conversations) >= self.max_conversations
+            if not (idle or full):
+                break
+            del self._conversations[conversation_id]
+
+    def create(self) -> str:
+        self._expire()
+        conversation_id = uuid.uuid4().hex
+        self._conversations[conversation_id] = Conversation(self.factory())
+        return conversation_id
+
+    def get(self, conversation_id: str):
+        conversation = self._conversations.get(conversation_id)
+        if conversation is not None:
+            conversation.last_used = time.monotonic()
+            self._conversations.move_to_end(conversation_id)
+        return conversation
+
+    def delete(self, conversation_id: str) -> bool:
+        return self._conversations.pop(conversation_id, None) is not None
+
+
+def create_app(
+    model,
+    pool: McpSessionPool,
+    max_conversations: int = 1000,
+    idle_timeout_s: float = 900.0,
+    log_tools: bool = False,
+) -> Starlette:
+    """App HTTP del servidor.
+
+    POST   /conversations                   -> {"conversation_id"}
+    POST   /conversations/{id}/messages     {"message"} -> {"response", ...}
+    DELETE /conversations/{id}
+    GET    /stats                           -> conversaciones, turnos, CPU, pool
+
+    El pool se abre al arrancar (lifespan) y se cierra al detener el servidor.
+    """
+    store = ConversationStore(
+        lambda: create_agent(
+            model,
+            pool.tools,
+            hooks=[ToolLoggingHook()] if log_tools else [],
+            callback_handler=None,
+        ),
+        max_conversations,
+        idle_timeout_s,
+    )
+    totals = {"turns": 0, "errors": 0}
+
+    async def create_conversation(request: Request) -> JSONResponse:
+        return JSONResponse({"conversation_id": store.create()}, status_code=201)
+
+    async def send_message(request: Request) -> JSONResponse:
+        conversation_id = request.path_params["conversation_id"]
+        conversation = store.get(conversation_id)
+        if conversation is None:
+            return JSONResponse({"error": "Conversation not found"}, status_code=404)
+        try:
+            message = (await request.json())["message"]
+        except (ValueError, KeyError, TypeError):
+            return JSONResponse({"error": "Body must be {\"message\": ...}"}, 400)
+
+        async with conversation.lock:
+            agent = conversation.agent
+            started, first_new = time.perf_counter(), len(agent.messages)
+            try:
+                result = await agent.invoke_async(message)
+            except Exception as e:
+                totals["errors"] += 1
+                print(f"[ERROR] Conversación {conversation_id}: {e}")
+                return JSONResponse({"error": "Agent error"}, status_code=500)
+            turn_ms = (time.perf_counter() - started) * 1000
+            tool_calls = sum(
+                "toolUse" in block
+                for turn_message in agent.messages[first_new:]
+                for block in turn_message["content"]
+            )
+            conversation.turns += 1
+            totals["turns"] += 1
+
+        return JSONResponse(
+            {
+                "conversation_id": conversation_id,
+                "response": response_text(result),
+                "tool_calls": tool_calls,
+                "turn_ms": round(turn_ms, 1),
+            }
+        )
+
+    async def delete_conversation(request: Request) -> Response:
+        if not store.delete(request.path_params["conversation_id"]):
+            return JSONResponse({"error": "Conversation not found"}, status_code=404)
+        return Response(status_code=204)
+
+    async def stats(request: Request) -> JSONResponse:
+        return JSONResponse(
+            {
+                "conversations": len(store),
+                "turns": totals["turns"],
+                "errors": totals["errors"],
+                "cpu_s": time.process_time(),
+                "sessions": pool.stats(),
+            }
+        )
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        await asyncio.to_thread(pool.start)
+        print(f"[PASO] Pool listo: {pool.size} sesiones MCP, {len(pool.tools)} tools.")
+        yield
+        await asyncio.to_thread(pool.stop)
+
+    return Starlette(
+        routes=[
+            Route("/conversations", create_conversation, methods=["POST"]),
+            Route(
+                "/conversations/{conversation_id}/messages",
+                send_message,
+                methods=["POST"],
+            ),
+            Route(
+                "/conversations/{conversation_id}",
+                delete_conversation,
+                methods=["DELETE"],
+            ),
+            Route("/stats", stats, methods=["GET"]),
+        ],
+        lifespan=lifespan,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Servidor multi-conversación Rufus Bank"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--sessions", type=int, default=4, help="Sesiones MCP del pool"
+    )
+    parser.add_argument("--max-conversations", type=int, default=1000)
+    parser.add_argument("--idle-timeout-s", type=float, default=900.0)
+    parser.add_argument("--log-tools", action="store_true")
+    args = parser.parse_args()
+
+    pool = McpSessionPool(GATEWAY_URL, gateway_access_token(), args.sessions)
+    app = create_app(
+        BedrockModel(model_id=MODEL_ID),
+        pool,
+        max_conversations=args.max_conversations,
+        idle_timeout_s=args.idle_timeout_s,
+        log_tools=args.log_tools,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+## Token OAuth (client credentials) compartido para los clientes del MCP Gateway.
+## Reutiliza el token hasta poco antes de `expires_in` y lo renueva en segundo plano.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+import httpx
+
+# Si el endpoint no retorna expires_in (Cognito siempre lo envía)
+DEFAULT_EXPIRES_IN = 3600
+
+
+def fetch_token(client_id, client_secret, token_url, timeout=10.0) -> dict:
+    """POST client_credentials al endpoint de tokens. Retorna el JSON completo."""
+    response = httpx.post(
+        token_url,
+        data={
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_secret,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+class TokenProvider:
+    """Token de acceso cacheado hasta poco antes de expirar.
+
+    - Vigente y lejos de expirar: retorna el token cacheado sin red.
+    - A menos de `refresh_margin_s` de expirar: retorna el token actual y lo
+      renueva en un thread, así ningún tool call espera la renovación.
+    - Sin token o a menos de `min_validity_s`: renueva y espera.
+
+    Las renovaciones son single-flight: los callers concurrentes comparten un
+    solo POST al endpoint de tokens.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        token_url: str,
+        refresh_margin_s: float = 300.0,
+        min_validity_s: float = 30.0,
+        clock=time.monotonic,
+    ):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.token_url = token_url
+        self.refresh_margin_s = refresh_margin_s
+        self.min_validity_s = min_validity_s
+        self._clock = clock
+        self._token = None
+        self._expires_at = 0.0
+        self._inflight = None  # Future de la renovación en curso
+        self._lock = threading.Lock()
+        self.fetches = 0
+
+    def get_token(self) -> str:
+        now = self._clock()
+        with self._lock:
+            token = self._token
+            if token and now < self._expires_at - self.refresh_margin_s:
+                return token
+            usable = token is not None and now < self._expires_at - self.min_validity_s
+            future, leader = self._inflight, False
+            if future is None:
+                future = self._inflight = Future()
+                leader = True
+
+        if leader:
+            if usable:
+                threading.Thread(
+                    target=self._refresh,
+                    args=(future, True),
+                    name="token-refresh",
+                    daemon=True,
+                ).start()
+            else:
+                self._refresh(future, False)
+        return token if usable else future.result()
+
+    def invalidate(self) -> None:
+        """Descarta el token (ej. el gateway respondió 401): el siguiente se renueva."""
+        with self._lock:
+            self._token = None
+            self._expires_at = 0.0
+
+    def _refresh(self, future: Future, background: bool) -> None:
+        requested_at = self._clock()
+        try:
+            payload = fetch_token(self.client_id, self.client_secret, self.token_url)
+            token = payload["access_token"]
+            expires_in = float(payload.get("expires_in", DEFAULT_EXPIRES_IN))
+        except Exception as e:
+            with self._lock:
+                self._inflight = None
+            if background:
+                # El token actual sigue vigente; el siguiente get_token reintenta
+                print(f"[ERROR] No se pudo renovar el token: {e}")
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            self._token = token
+            # Contado desde el request: el token pudo emitirse antes de recibirlo
+            self._expires_at = requested_at + expires_in
+            self._inflight = None
+            self.fetches += 1
+        future.set_result(token)
+
+
+class BearerTokenAuth(httpx.Auth):
+    """Auth de httpx que pone el token del provider en cada request.
+
+    Para el transporte streamable HTTP de MCP, cuya sesión dura más que un
+    token. Ante un 401 descarta el token y reintenta una vez con uno nuevo. En
+    clientes async la renovación corre en un thread y no bloquea el event loop.
+    """
+
+    def __init__(self, provider: TokenProvider):
+        self.provider = provider
+
+    def auth_flow(self, request):
+        request.headers["Authorization"] = f"Bearer {self.provider.get_token()}"
+        response = yield request
+        if response.status_code == 401:
+            self.provider.invalidate()
+            request.headers["Authorization"] = f"Bearer {self.provider.get_token()}"
+            yield request
+
+    async def async_auth_flow(self, request):
+        token = await asyncio.to_thread(self.provider.get_token)
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = yield request
+        if response.status_code == 401:
+            self.provider.invalidate()
+            token = await asyncio.to_thread(self.provider.get_token)
+            request.headers["Authorization"] = f"Bearer {token}"
+            yield request
@@ -0,0 +1,159 @@
+"""
+## Caché en disco del catálogo de tools del MCP Gateway.
+## Arranque inmediato desde el catálogo guardado + revalidación en segundo plano.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from mcp.types import Tool
+from strands.tools.mcp.mcp_agent_tool import MCPAgentTool
+
+# Un solo archivo para todos los gateways: {gateway_url: {hash, saved_at, tools}}
+DEFAULT_CATALOG_PATH = os.environ.get(
+    "RUFUS_TOOL_CATALOG_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "rufus-bank", "tool-catalog.json"),
+)
+
+
+def tool_spec(tool) -> dict:
+    """Definición MCP (name, description, inputSchema, ...) de un MCPAgentTool."""
+    return tool.mcp_tool.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+def catalog_hash(specs: list) -> str:
+    """SHA-256 del catálogo canónico: no depende del orden de páginas ni de claves."""
+    canonical = json.dumps(
+        sorted(specs, key=lambda spec: spec["name"]),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ToolCatalog:
+    """Catálogo de tools de un gateway persistido en disco.
+
+    En el primer arranque lista las tools del gateway y las guarda. En los
+    siguientes retorna las del archivo sin esperar al gateway y las revalida en
+    un thread: si el hash cambió guarda el catálogo nuevo y deja las tools listas
+    para `apply_pending`, que las cambia en el agente entre turnos.
+    """
+
+    def __init__(self, gateway_url: str, path: str = DEFAULT_CATALOG_PATH):
+        self.gateway_url = gateway_url
+        self.path = path
+        self.source = None  # "gateway" (frío) o "cache" (caliente)
+        self.revalidated = threading.Event()
+        self.changed = False
+        self._pending = None
+        self._names = set()
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as catalog_file:
+                return json.load(catalog_file)
+        except (OSError, ValueError):
+            return {}
+
+    def load(self):
+        """Entrada guardada para este gateway, o None si no hay catálogo."""
+        entry = self._read().get(self.gateway_url)
+        if not entry or entry.get("hash") != catalog_hash(entry.get("tools", [])):
+            return None
+        return entry
+
+    def save(self, specs: list) -> str:
+        """Guarda el catálogo de forma atómica (archivo temporal + os.replace)."""
+        digest = catalog_hash(specs)
+        catalogs = self._read()
+        catalogs[self.gateway_url] = {
+            "hash": digest,
+            "saved_at": int(time.time()),
+            "tools": specs,
+        }
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(catalogs, tmp_file, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return digest
+
+    def get_tools(self, client, list_tools) -> list:
+        """Tools para crear el agente.
+
+        `list_tools(client)` lista el catálogo completo del gateway (ej.
+        `get_full_tools_list`); en caliente solo se llama en segundo plano.
+        """
+        entry = self.load()
+        if entry is None:
+            self.source = "gateway"
+            tools = list_tools(client)
+            self.save([tool_spec(tool) for tool in tools])
+            self._names = {tool.tool_name for tool in tools}
+            self.revalidated.set()
+            return tools
+
+        self.source = "cache"
+        tools = [
+            MCPAgentTool(Tool.model_validate(spec), client) for spec in entry["tools"]
+        ]
+        self._names = {tool.tool_name for tool in tools}
+        threading.Thread(
+            target=self._revalidate,
+            args=(client, list_tools, entry["hash"]),
+            name="tool-catalog-revalidate",
+            daemon=True,
+        ).start()
+        return tools
+
+    def _revalidate(self, client, list_tools, cached_hash: str) -> None:
+        try:
+            tools = list_tools(client)
+            specs = [tool_spec(tool) for tool in tools]
+            if catalog_hash(specs) != cached_hash:
+                self.save(specs)
+                with self._lock:
+                    self._pending = tools
+                self.changed = True
+        except Exception as e:
+            # El agente sigue con el catálogo guardado
+            print(f"[ERROR] No se pudo revalidar el catálogo de tools: {e}")
+        finally:
+            self.revalidated.set()
+
+    def apply_pending(self, agent) -> bool:
+        """Cambia en el agente las tools revalidadas, si el catálogo cambió.
+
+        Llamar entre turnos (no durante una invocación). Quita las tools del
+        catálogo anterior que ya no existen y reemplaza o registra el resto.
+        """
+        with self._lock:
+            tools, self._pending = self._pending, None
+        if tools is None:
+            return False
+
+        registry = agent.tool_registry
+        names = {tool.tool_name for tool in tools}
+        for name in self._names - names:
+            registry.registry.pop(name, None)
+            registry.dynamic_tools.pop(name, None)
+        for tool in tools:
+            if tool.tool_name in registry.registry:
+                registry.replace(tool)
+            else:
+                registry.register_tool(tool)
+        self._names = names
+        print(f"[PASO] Catálogo de tools actualizado: {len(tools)} tools.")
+        return True
@@ -0,0 +1,277 @@
+"""
+## Caché de resultados de tools del lado del agente (HookProvider de Strands).
+## Evita el round trip al gateway cuando el modelo repite un tool call idéntico.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from strands.hooks import (
+    AfterToolCallEvent,
+    BeforeToolCallEvent,
+    HookProvider,
+    HookRegistry,
+)
+from strands.types.tools import AgentTool
+
+# Resultados guardados entre sesiones: {clave: [expira (epoch), resultado]}
+DEFAULT_CACHE_PATH = os.environ.get(
+    "RUFUS_TOOL_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "rufus-bank", "tool-results.json"),
+)
+
+# TTL en segundos por tool, sin el prefijo `<target>___` del gateway. Igual que
+# la caché del adapter: la salud de ATMs y datáfonos dura 60 s y los saldos no
+# se guardan. Un tool sin TTL (o con 0) siempre va al gateway.
+DEFAULT_TTL_SECONDS = {
+    "listAtms": 60,
+    "listAtmsByCity": 60,
+    "findNearestAtms": 60,
+    "listDatafonos": 60,
+    "listDatafonosByCity": 60,
+    "findNearestDatafonos": 60,
+    "getInvestmentsByUsername": 300,
+    "getBalanceByUsername": 0,
+    "getBalances": 0,
+    "batchInvoke": 0,
+}
+
+# Tools con datos de un usuario: se cachean durante la sesión pero `save()` no
+# los escribe en disco
+MEMORY_ONLY_TOOLS = {"getInvestmentsByUsername"}
+
+
+def tool_key(
+    tool_name: str, tool_input: dict, gateway_url: str = "", identity: str = ""
+) -> str:
+    """Clave del tool call: gateway + identidad + nombre + input canónico.
+
+    El gateway y la identidad del caller evitan que un resultado guardado para
+    otro gateway o con otras credenciales responda este tool call.
+    """
+    canonical = json.dumps(tool_input, sort_keys=True, separators=(",", ":"))
+    scoped = f"{gateway_url}\n{identity}\n{tool_name}\n{canonical}"
+    return hashlib.sha256(scoped.encode("utf-8")).hexdigest()
+
+
+def is_error_payload(result: dict) -> bool:
+    """True si el resultado trae el payload de error del adapter.
+
+    El adapter responde los timeouts, el circuito abierto y los errores del
+    upstream como `{"error": ..., "code": ...}` y el gateway los entrega como
+    resultados exitosos, así que el status no basta para decidir si se cachea.
+    """
+    for block in result.get("content") or []:
+        payload = block.get("json")
+        if payload is None and "text" in block:
+            try:
+                payload = json.loads(block["text"])
+            except ValueError:
+                continue
+        if isinstance(payload, dict) and ("error" in payload or "code" in payload):
+            return True
+    return False
+
+
+class _CachedResult(AgentTool):
+    """Tool que responde con un resultado guardado en lugar de llamar al gateway."""
+
+    def __init__(self, tool: AgentTool, result: dict):
+        super().__init__()
+        self._tool = tool
+        self._result = result
+
+    @property
+    def tool_name(self) -> str:
+        return self._tool.tool_name
+
+    @property
+    def tool_spec(self):
+        return self._tool.tool_spec
+
+    @property
+    def tool_type(self) -> str:
+        return self._tool.tool_type
+
+    async def stream(self, tool_use, invocation_state, **kwargs):
+        yield {**self._result, "toolUseId": tool_use["toolUseId"]}
+
+
+class ToolResultCacheHook(HookProvider):
+    """Responde desde la caché los tool calls repetidos (mismo tool e input).
+
+    Antes de cada tool call busca el resultado y, si sigue vigente, cambia el
+    tool por uno que lo retorna sin ir al gateway. Después de cada tool call
+    exitoso guarda el resultado con el TTL del tool, salvo los payloads de
+    error del adapter. La clave incluye `gateway_url` e `identity` (el caller).
+    La caché es LRU y acotada por número de resultados y por bytes (JSON). Con
+    `path` se carga al crear el hook y `save()` la persiste, así se reutiliza
+    entre sesiones; los tools de `memory_only` nunca se escriben en disco. Un
+    input con `bypass_cache: true` siempre va al gateway.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: dict = None,
+        max_entries: int = 256,
+        max_bytes: int = 1024 * 1024,
+        path: str = DEFAULT_CACHE_PATH,
+        gateway_url: str = "",
+        identity: str = "",
+        memory_only: set = MEMORY_ONLY_TOOLS,
+        clock=time.time,
+    ):
+        self.ttl_seconds = {**DEFAULT_TTL_SECONDS, **(ttl_seconds or {})}
+        self.gateway_url = gateway_url
+        self.identity = identity
+        self.memory_only = set(memory_only)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path
+        self._clock = clock
+        # clave -> (expira, bytes, resultado, se guarda en disco)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0  # tool calls de tools sin TTL
+        self.loaded = self._load() if path else 0
+
+    def register_hooks(self, registry: HookRegistry) -> None:
+        registry.add_callback(BeforeToolCallEvent, self.lookup)
+        registry.add_callback(AfterToolCallEvent, self.store)
+
+    def ttl_for(self, tool_name: str) -> float:
+        return self.ttl_seconds.get(tool_name.rsplit("___", 1)[-1], 0)
+
+    def persisted(self, tool_name: str) -> bool:
+        return tool_name.rsplit("___", 1)[-1] not in self.memory_only
+
+    def key_for(self, tool_use) -> str:
+        return tool_key(
+            tool_use["name"],
+            tool_use.get("input") or {},
+            self.gateway_url,
+            self.identity,
+        )
+
+    def _cacheable(self, tool_use) -> bool:
+        tool_input = tool_use.get("input") or {}
+        if tool_input.get("bypass_cache"):
+            return False
+        return self.ttl_for(tool_use["name"]) > 0
+
+    def lookup(self, event: BeforeToolCallEvent) -> None:
+        tool_use = event.tool_use
+        if event.selected_tool is None:
+            return
+        if not self._cacheable(tool_use):
+            with self._lock:
+                self.uncached += 1
+            return
+
+        key = self.key_for(tool_use)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return
+            self._entries.move_to_end(key)
+            self.hits += 1
+        event.selected_tool = _CachedResult(event.selected_tool, entry[2])
+        print(f"  ♻️  [CACHÉ] {tool_use['name']}: resultado guardado")
+
+    def store(self, event: AfterToolCallEvent) -> None:
+        tool_use = event.tool_use
+        if (
+            isinstance(event.selected_tool, _CachedResult)
+            or event.selected_tool is None
+            or event.result.get("status") != "success"
+            or not self._cacheable(tool_use)
+            or is_error_payload(event.result)
+        ):
+            return
+
+        result = {
+            name: value for name, value in event.result.items() if name != "toolUseId"
+        }
+        try:
+            size = len(json.dumps(result))
+        except (TypeError, ValueError):
+            return
+        if size > self.max_bytes:
+            return
+        expires_at = self._clock() + self.ttl_for(tool_use["name"])
+        entry = (expires_at, size, result, self.persisted(tool_use["name"]))
+        with self._lock:
+            self._put(self.key_for(tool_use), entry)
+
+    def _remove(self, key: str) -> None:
+        _, size, _, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _put(self, key: str, entry: tuple) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._bytes += entry[1]
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _load(self) -> int:
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                stored = json.load(cache_file)
+        except (OSError, ValueError):
+            return 0
+        now = self._clock()
+        with self._lock:
+            # El archivo conserva el orden LRU (el más reciente al final)
+            for key, (expires_at, result) in stored.items():
+                if expires_at > now:
+                    size = len(json.dumps(result))
+                    self._put(key, (expires_at, size, result, True))
+            return len(self._entries)
+
+    def save(self) -> None:
+        """Persiste los resultados vigentes de forma atómica (temporal + replace)."""
+        if not self.path:
+            return
+        now = self._clock()
+        with self._lock:
+            stored = {
+                key: [expires_at, result]
+                for key, (expires_at, _, result, persist) in self._entries.items()
+                if persist and expires_at > now
+            }
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(stored, tmp_file, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def report(self) -> str:
+        return (
+            f"[CACHÉ] {self.hits}/{self.hits + self.misses} tool calls cacheables "
+            f"respondidos desde la caché ({self.hit_rate:.0%}); {self.uncached} sin "
+            f"caché; {len(self._entries)} resultados guardados "
+            f"({self._bytes / 1024:.1f} KB)."
+        )
@@ -0,0 +1,38 @@
+"""
+Atributos geohash para los scripts de setup.
+
+Cada dispositivo se guarda con dos atributos que alimentan el GSI `GeoIndex`:
+    - geo_cell: prefijo geohash de 5 caracteres (celda de ~4.9 km), partition key
+    - geohash:  geohash completo de 9 caracteres (~5 m), sort key
+
+La codificación y las precisiones vienen de `shared_runtime.geohash`, el mismo
+módulo de la capa que usa la búsqueda `/near`: escritura y lectura no pueden
+desalinearse. Ese módulo no depende de boto3, así que se importa directo desde
+el directorio de la capa.
+"""
+
+import os
+import sys
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "lambdas",
+        "layers",
+        "shared_runtime",
+        "python",
+    ),
+)
+
+from shared_runtime.geohash import geo_keys  # noqa: E402
+
+
+def geo_attributes(lat: float, lon: float) -> dict:
+    """Atributos DynamoDB (formato bajo nivel) `geo_cell` y `geohash` del item."""
+    geo_cell, geohash = geo_keys(lat, lon)
+    return {
+        "geo_cell": {"S": geo_cell},
+        "geohash": {"S": geohash},
+    }
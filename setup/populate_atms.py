@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Script para poblar la tabla DynamoDB de cajeros automáticos (ATMs) con 25 registros simulados.
-Genera ATMs con datos realistas en Medellín y Bogotá, Colombia.
+Genera ATMs con datos realistas en Medellín y Bogotá, Colombia, con los atributos
+geo_cell/geohash que indexa el GSI GeoIndex (búsqueda por proximidad).
 
 Uso: python setup/populate_atms.py TABLE_NAME
 """
@@ -15,6 +16,8 @@ from datetime import datetime, timedelta
 import boto3
 from botocore.exceptions import ClientError
 
+from geo_utils import geo_attributes
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
@@ -108,6 +111,7 @@ def generate_atms(count: int = 25) -> list:
                 "address": {"S": address},
                 "latitude": {"N": str(lat)},
                 "longitude": {"N": str(lon)},
+                **geo_attributes(lat, lon),
                 "status": {"S": status},
                 "cash_level": {"S": cash_level},
                 "last_service": {"S": generate_last_service()},
@@ -130,6 +134,7 @@ def generate_atms(count: int = 25) -> list:
                 "address": {"S": address},
                 "latitude": {"N": str(lat)},
                 "longitude": {"N": str(lon)},
+                **geo_attributes(lat, lon),
                 "status": {"S": status},
                 "cash_level": {"S": cash_level},
                 "last_service": {"S": generate_last_service()},
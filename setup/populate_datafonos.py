@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Script para poblar la tabla DynamoDB de datáfonos con 100 registros simulados.
-Genera datáfonos con datos realistas en Medellín y Bogotá, Colombia.
+Genera datáfonos con datos realistas en Medellín y Bogotá, Colombia, con los atributos
+geo_cell/geohash que indexa el GSI GeoIndex (búsqueda por proximidad).
 
 Uso: python setup/populate_datafonos.py TABLE_NAME
 """
@@ -16,6 +17,8 @@ from decimal import Decimal
 import boto3
 from botocore.exceptions import ClientError
 
+from geo_utils import geo_attributes
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
@@ -293,6 +296,7 @@ def generate_datafonos(count: int = 100) -> list:
                 "address": {"S": address},
                 "latitude": {"N": str(lat)},
                 "longitude": {"N": str(lon)},
+                **geo_attributes(lat, lon),
                 "status": {"S": status},
                 "last_transaction": {"S": generate_last_transaction()},
                 "city": {"S": "medellin"},
@@ -315,6 +319,7 @@ def generate_datafonos(count: int = 100) -> list:
                 "address": {"S": address},
                 "latitude": {"N": str(lat)},
                 "longitude": {"N": str(lon)},
+                **geo_attributes(lat, lon),
                 "status": {"S": status},
                 "last_transaction": {"S": generate_last_transaction()},
                 "city": {"S": "bogota"},
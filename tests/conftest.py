@@ -0,0 +1,14 @@
+"""Put the `shared_runtime` layer on sys.path, as Lambda does for /opt/python."""
+
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+LAYER_PATH = os.path.join(ROOT, "lambdas", "layers", "shared_runtime", "python")
+
+sys.path.insert(0, LAYER_PATH)
+
+# The layer creates its boto3 clients at import time
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
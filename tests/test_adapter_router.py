@@ -0,0 +1,48 @@
+import importlib.util
+import os
+import zlib
+
+import pytest
+
+from conftest import ROOT
+from shared_runtime.resilience import HALF_OPEN, OPEN, CircuitBreaker, Deadline
+
+
+@pytest.fixture(scope="module")
+def adapter():
+    path = os.path.join(ROOT, "lambdas", "adapter_router", "index.py")
+    spec = importlib.util.spec_from_file_location("adapter_router_index", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_unexpected_error_releases_the_half_open_trial(adapter, monkeypatch):
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_s=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    monkeypatch.setitem(adapter.circuit_breakers, "atm", breaker)
+
+    def corrupt_body(*args, **kwargs):
+        raise zlib.error("invalid stored block lengths")
+
+    monkeypatch.setattr(adapter.pool, "request", corrupt_body)
+
+    with pytest.raises(zlib.error):
+        adapter.call_private_api(
+            "atm", "GET", "https://atm.example/atms", None, Deadline(10000)
+        )
+    assert breaker.state == OPEN
+
+    clock.now = 20
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
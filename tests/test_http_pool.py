@@ -0,0 +1,55 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from shared_runtime.http_pool import ConnectionPool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if self.path == "/chunked":
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for part in (body[:5], body[5:]):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(part), part))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.connections = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("path", ["/", "/chunked"])
+def test_second_request_reuses_the_pooled_connection(server, path):
+    pool = ConnectionPool()
+    url = f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+    first = pool.request("GET", url)
+    second = pool.request("GET", url)
+
+    assert first.body == second.body == b'{"ok": true}'
+    assert second.timings["reused"] and not second.timings["retried"]
+    assert pool.stats["opened"] == 1 and pool.stats["reused"] == 1
+    assert len(server.connections) == 1
@@ -0,0 +1,36 @@
+import pytest
+
+from shared_runtime.pagination import decode_segment_cursor, encode_next_token
+
+TOTAL_SEGMENTS = 4
+
+
+def segment_token(segments, total_segments=TOTAL_SEGMENTS):
+    return encode_next_token(
+        {"segments": segments, "total_segments": total_segments}
+    )
+
+
+def test_round_trips_the_unfinished_segments():
+    token = segment_token({"0": {"id": "atm-1"}, "3": None})
+    assert decode_segment_cursor(token, TOTAL_SEGMENTS) == {
+        0: {"id": "atm-1"},
+        3: None,
+    }
+
+
+def test_rejects_an_empty_segment_map():
+    with pytest.raises(ValueError):
+        decode_segment_cursor(segment_token({}), TOTAL_SEGMENTS)
+
+
+@pytest.mark.parametrize("segment", ["-1", "4", "99"])
+def test_rejects_out_of_range_segments(segment):
+    with pytest.raises(ValueError):
+        decode_segment_cursor(segment_token({segment: None}), TOTAL_SEGMENTS)
+
+
+def test_rejects_duplicate_segments():
+    token = segment_token({"1": None, "01": {"id": "atm-1"}})
+    with pytest.raises(ValueError):
+        decode_segment_cursor(token, TOTAL_SEGMENTS)